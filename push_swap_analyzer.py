@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Análisis de mirilla de la salida de push_swap: operaciones que sobran y cuántas quedarían"""
+import sys
+
+from push_swap_checker import OPCODES, parse_numbers
+
+# Pila que modifica cada operación
+A_ONLY = {"sa", "ra", "rra"}
+B_ONLY = {"sb", "rb", "rrb"}
+
+# Parejas que se anulan y parejas que se pueden fusionar en una sola operación
+INVERSE = {"sa": "sa", "sb": "sb", "ss": "ss", "pa": "pb", "pb": "pa", "ra": "rra", "rb": "rrb",
+           "rr": "rrr", "rra": "ra", "rrb": "rb", "rrr": "rr"}
+MERGE_PARTNER = {"sa": "sb", "sb": "sa", "ra": "rb", "rb": "ra", "rra": "rrb", "rrb": "rra"}
+MERGED = {"sa": "ss", "sb": "ss", "ra": "rr", "rb": "rr", "rra": "rrr", "rrb": "rrr"}
+
+# Rotaciones de una sola pila (para las rachas más largas que la pila)
+ROTATIONS = {"ra": "a", "rra": "a", "rb": "b", "rrb": "b"}
+
+
+def _find_noops(operations, size):
+    """Índices de las operaciones que no cambian nada (p. ej. pa con B vacía)"""
+    len_a, len_b = size, 0
+    noops = []
+    for i, op in enumerate(operations):
+        if op == "pa":
+            if len_b:
+                len_a += 1
+                len_b -= 1
+                continue
+        elif op == "pb":
+            if len_a:
+                len_a -= 1
+                len_b += 1
+                continue
+        elif op in A_ONLY:
+            if len_a >= 2:
+                continue
+        elif op in B_ONLY:
+            if len_b >= 2:
+                continue
+        elif len_a >= 2 or len_b >= 2:
+            continue
+        noops.append(i)
+    return noops
+
+
+def _find_long_rotations(operations, size, skip):
+    """Índices sobrantes de rachas de la misma rotación de longitud >= tamaño de la pila
+
+    Rotar k veces una pila de L elementos equivale a rotarla k % L veces.
+    """
+    len_a, len_b = size, 0
+    wasted = []
+    i = 0
+    n = len(operations)
+    while i < n:
+        op = operations[i]
+        if i in skip:
+            i += 1
+            continue
+        if op in ROTATIONS:
+            j = i
+            while j < n and operations[j] == op and j not in skip:
+                j += 1
+            length = len_a if ROTATIONS[op] == "a" else len_b
+            run = j - i
+            if length >= 2 and run >= length:
+                wasted.extend(range(i, i + run - run % length))
+            i = j
+            continue
+        if op == "pa" and len_b:
+            len_a += 1
+            len_b -= 1
+        elif op == "pb" and len_a:
+            len_a -= 1
+            len_b += 1
+        i += 1
+    return wasted
+
+
+def analyze(operations, size):
+    """Detecta operaciones sobrantes en tiempo lineal
+
+    size es el número de elementos iniciales de A. Detecta:
+      - operaciones sin efecto (pa con B vacía, ra con menos de 2 elementos...)
+      - rachas de una rotación más largas que la pila
+      - parejas que se anulan (pa/pb, ra/rra, sa/sa...) aunque haya entre ellas
+        operaciones de la otra pila, que conmutan con ellas
+      - parejas fusionables (ra+rb -> rr, rra+rrb -> rrr, sa+sb -> ss)
+
+    Devuelve un diccionario con el total, el número de operaciones tras
+    reescribir (y la secuencia reescrita), los índices sobrantes y el recuento
+    por categoría.
+    """
+    noops = _find_noops(operations, size)
+    skip = set(noops)
+    rotations = _find_long_rotations(operations, size, skip)
+    skip.update(rotations)
+
+    # Reescritura con dos pilas de índices: la última operación viva que toca A
+    # y la última que toca B. Una operación de una sola pila conmuta con todas
+    # las posteriores de la otra, así que solo puede combinarse con la cima de
+    # su pila; cada operación entra y sale como mucho una vez -> O(n).
+    # out: [operación, índice original, viva]
+    out = []
+    touch_a = []
+    touch_b = []
+    cancelled = []
+    merged = []
+    for i, op in enumerate(operations):
+        if i in skip:
+            continue
+        if op in A_ONLY or op in B_ONLY:
+            own, other = (touch_a, touch_b) if op in A_ONLY else (touch_b, touch_a)
+            if own and out[own[-1]][0] == INVERSE[op]:
+                previous = out[own.pop()]
+                previous[2] = False
+                cancelled.extend((previous[1], i))
+                continue
+            if other and out[other[-1]][0] == MERGE_PARTNER[op]:
+                # La pareja de la otra pila se mueve hasta aquí y se fusiona
+                partner = out[other.pop()]
+                partner[2] = False
+                merged.append(i)
+                out.append([MERGED[op], partner[1], True])
+                touch_a.append(len(out) - 1)
+                touch_b.append(len(out) - 1)
+                continue
+            out.append([op, i, True])
+            own.append(len(out) - 1)
+        else:
+            if touch_a and touch_b and touch_a[-1] == touch_b[-1] and out[touch_a[-1]][0] == INVERSE[op]:
+                previous = out[touch_a.pop()]
+                touch_b.pop()
+                previous[2] = False
+                cancelled.extend((previous[1], i))
+                continue
+            out.append([op, i, True])
+            touch_a.append(len(out) - 1)
+            touch_b.append(len(out) - 1)
+
+    rewritten = [op for op, _, alive in out if alive]
+    wasted = sorted(skip.union(cancelled, merged))
+    return {
+        "total": len(operations),
+        "optimized": len(rewritten),
+        "operations": rewritten,
+        "wasted": wasted,
+        "noop": len(noops),
+        "rotation": len(rotations),
+        "cancel": len(cancelled),
+        "merge": len(merged),
+    }
+
+
+def format_report(report):
+    """Resumen legible de analyze()"""
+    return (f"Operaciones: {report['total']} -> {report['optimized']} tras reescribir "
+            f"({len(report['wasted'])} sobrantes: {report['noop']} sin efecto, "
+            f"{report['rotation']} en rotaciones más largas que la pila, "
+            f"{report['cancel']} que se anulan, {report['merge']} fusionables)")
+
+
+def main():
+    """Uso: ./push_swap $ARG | ./push_swap_analyzer.py $ARG"""
+    try:
+        numbers = parse_numbers(sys.argv[1:])
+    except ValueError:
+        print("Error", file=sys.stderr)
+        return 1
+    operations = [line.strip() for line in sys.stdin if line.strip()]
+    invalid = [op for op in operations if op not in OPCODES]
+    if invalid:
+        print(f"Error: operación inválida '{invalid[0]}'", file=sys.stderr)
+        return 1
+    print(format_report(analyze(operations, len(numbers))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
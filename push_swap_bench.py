@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Benchmark de push_swap: varias permutaciones con semilla por tamaño, en paralelo"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from push_swap_analyzer import analyze
+from push_swap_corpus import open_corpus
+from push_swap_export import export_summary
+from push_swap_history import HISTORY_DB, case_id, connect, record_run
+from push_swap_optimal import lower_bound
+from push_swap_runner import PUSH_SWAP, RESULTS_FILE, run_push_swap
+from push_swap_stats import describe
+
+# Tamaños probados por defecto (los mismos que el resumen del tester)
+SIZES = (3, 5, 10, 50, 100, 500)
+
+# Máximo de operaciones para considerar el tamaño aprobado (se evalúa con el peor caso)
+LIMITS = {100: 1500, 500: 10000}
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+BLUE = "\033[0;34m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def make_input(size, seed, index):
+    """Permutación reproducible de 1..size para la muestra index"""
+    rng = random.Random(f"{seed}-{size}-{index}")
+    numbers = list(range(1, size + 1))
+    rng.shuffle(numbers)
+    return numbers
+
+
+def _measure(push_swap, numbers, index, use_cache):
+    """Ejecuta push_swap con una entrada y verifica su salida"""
+    # Las operaciones se simulan según llegan por el pipe
+    result = run_push_swap(numbers, push_swap, keep_operations=True, use_cache=use_cache)
+    # Operaciones que sobran según el analizador de mirilla (lineal)
+    optimized = analyze(result.operations, len(numbers))["optimized"]
+    return dict(size=len(numbers), index=index, case=case_id(numbers), optimized=optimized,
+                bound=lower_bound(numbers), **result.metrics())
+
+
+def run_sample(task):
+    """Muestra generada con semilla (se ejecuta en un worker)"""
+    push_swap, size, seed, index, use_cache = task
+    return _measure(push_swap, make_input(size, seed, index), index, use_cache)
+
+
+def run_corpus_sample(task):
+    """Caso de un corpus; el worker lee solo ese caso del fichero mapeado"""
+    push_swap, path, index, use_cache = task
+    return _measure(push_swap, open_corpus(path)[index], index, use_cache)
+
+
+def run_benchmark(push_swap, sizes, samples, seed=0, jobs=None, use_cache=True, corpus=None):
+    """Ejecuta samples permutaciones de cada tamaño en un pool de procesos
+
+    Con corpus (ruta a un fichero de push_swap_corpus) se ejecutan en cambio
+    todos sus casos y sizes, samples y seed no se usan. Devuelve un
+    diccionario tamaño -> lista de resultados de run_sample.
+    """
+    if corpus:
+        count = len(open_corpus(corpus))
+        worker = run_corpus_sample
+        tasks = ((push_swap, corpus, i, use_cache) for i in range(count))
+        results = {}
+    else:
+        count = len(sizes) * samples
+        worker = run_sample
+        tasks = ((push_swap, size, seed, i, use_cache) for size in sizes for i in range(samples))
+        results = {size: [] for size in sizes}
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = max(1, count // (jobs * 8))
+    with multiprocessing.Pool(jobs) as pool:
+        for result in pool.imap_unordered(worker, tasks, chunksize):
+            results.setdefault(result["size"], []).append(result)
+    return dict(sorted(results.items()))
+
+
+def summarize(results):
+    """Estadísticas de operaciones y tiempo por tamaño
+
+    Los tiempos y el RSS salen solo de las muestras medidas en esta
+    ejecución: las de la caché no tienen medidas.
+    """
+    summary = {}
+    for size, samples in results.items():
+        failures = [s for s in samples if s["status"] != "OK"]
+        timed = [s for s in samples if not s["cached"]]
+        kinds = {}
+        for s in failures:
+            kinds[s["status"]] = kinds.get(s["status"], 0) + 1
+        ops = describe([s["ops"] for s in samples])
+        limit = LIMITS.get(size)
+        summary[size] = {
+            "ops": ops,
+            "wall": describe([s["wall"] for s in timed]) if timed else None,
+            "cpu": describe([s["user"] + s["sys"] for s in timed]) if timed else None,
+            "rss": describe([s["max_rss_kb"] for s in timed]) if timed else None,
+            "cached": len(samples) - len(timed),
+            "wasted": describe([s["ops"] - s["optimized"] for s in samples]),
+            "bound": describe([s["bound"] for s in samples]),
+            "efficiency": describe([s["bound"] / s["ops"] if s["ops"] else 1.0 for s in samples]),
+            "failures": len(failures),
+            "kinds": kinds,
+            "limit": limit,
+            "passed": not failures and (limit is None or ops["max"] < limit),
+        }
+    return summary
+
+
+def print_summary(summary):
+    """Muestra la tabla de resultados"""
+    print(f"{YELLOW}{'Tamaño':>6} | {'min':>6} {'media':>8} {'p50':>7} {'p90':>7} "
+          f"{'p99':>7} {'max':>6} {'sobran':>7} {'cota':>6} {'efic.':>6} | {'t p50':>8} {'t max':>8} {'cpu p50':>8} {'RSS max':>9} | Resultado{NC}")
+    print("-" * 136)
+    for size, stats in summary.items():
+        ops = stats["ops"]
+        wall = stats["wall"]
+        cpu = stats["cpu"]
+        rss = stats["rss"]
+        if stats["failures"]:
+            kinds = ", ".join(f"{count} {kind}" for kind, count in stats["kinds"].items())
+            verdict = f"{RED}✗ {stats['failures']} muestras no ordenan ({kinds}){NC}"
+        elif stats["limit"] is None:
+            verdict = f"{BLUE}-{NC}"
+        elif stats["passed"]:
+            verdict = f"{GREEN}✓ peor caso < {stats['limit']}{NC}"
+        else:
+            verdict = f"{RED}✗ peor caso >= {stats['limit']}{NC}"
+        if wall is None:
+            times = f"{'caché':>8} {'-':>8} {'-':>8} {'-':>9}"
+        else:
+            times = (f"{wall['p50'] * 1000:>6.1f}ms {wall['max'] * 1000:>6.1f}ms "
+                     f"{cpu['p50'] * 1000:>6.1f}ms {rss['max'] / 1024:>7.1f}MB")
+        print(f"{size:>6} | {ops['min']:>6} {ops['mean']:>8.1f} {ops['p50']:>7.0f} {ops['p90']:>7.0f} "
+              f"{ops['p99']:>7.0f} {ops['max']:>6} {stats['wasted']['mean']:>7.1f} {stats['bound']['mean']:>6.0f} "
+              f"{stats['efficiency']['mean']:>6.1%} | {times} | {verdict}")
+
+
+def write_results(path, results, label="bench"):
+    """Añade cada muestra como una línea JSON (tamaño, operaciones, tiempos y RSS)
+
+    El fichero es el mismo en el que el tester y el visualizador añaden sus
+    ejecuciones: no se trunca, y cada muestra lleva label para distinguirlas.
+    """
+    with open(path, "a") as f:
+        for size in results:
+            for sample in sorted(results[size], key=lambda s: s["index"]):
+                f.write(json.dumps(dict(label=label, **sample)) + "\n")
+
+
+def export_failures(push_swap, results, output_dir, seed=0, corpus=None):
+    """Guarda la entrada y la imagen resumen de cada muestra que no ordenó
+
+    Cada muestra va a output_dir/<tamaño>_<índice>/ (input.txt y summary.png),
+    pensado para adjuntarlo a los artefactos de la CI. Devuelve los directorios.
+    """
+    directories = []
+    for size, samples in results.items():
+        for sample in samples:
+            if sample["status"] == "OK":
+                continue
+            index = sample["index"]
+            numbers = open_corpus(corpus)[index] if corpus else make_input(size, seed, index)
+            result = run_push_swap(numbers, push_swap, keep_operations=True)
+            directory = os.path.join(output_dir, f"{size}_{index}")
+            export_summary(numbers, result.operations, directory, "png", result.status)
+            with open(os.path.join(directory, "input.txt"), "w") as f:
+                f.write(" ".join(map(str, numbers)) + "\n")
+            directories.append(directory)
+    return directories
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--samples", type=int, default=100, help="permutaciones por tamaño (100)")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=list(SIZES), help="tamaños a probar")
+    parser.add_argument("--seed", type=int, default=0, help="semilla base de las permutaciones")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="procesos en paralelo (todos los núcleos)")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    parser.add_argument("--no-cache", action="store_true", help="ejecutar siempre push_swap sin usar la caché")
+    parser.add_argument("--corpus", default=None, help="ejecutar los casos de un corpus (push_swap_corpus.py)")
+    parser.add_argument("--export-failures", metavar="DIR", default=None,
+                        help="guardar una imagen resumen de cada muestra que no ordene en DIR")
+    parser.add_argument("--results", default=RESULTS_FILE, help=f"fichero JSON lines con cada muestra ({RESULTS_FILE})")
+    parser.add_argument("--history", default=HISTORY_DB,
+                        help=f"base de datos SQLite donde se añade la ejecución ({HISTORY_DB})")
+    parser.add_argument("--no-history", action="store_true", help="no guardar la ejecución en el historial")
+    parser.add_argument("--label", default=None, help="etiqueta de la ejecución en el historial")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+
+    if args.corpus:
+        try:
+            open_corpus(args.corpus)
+        except (OSError, ValueError) as e:
+            print(f"{RED}Error: {e}{NC}")
+            return 1
+
+    start = time.perf_counter()
+    results = run_benchmark(args.push_swap, args.sizes, args.samples, args.seed, args.jobs,
+                            not args.no_cache, args.corpus)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print_summary(summary)
+    write_results(args.results, results, args.label or "bench")
+    runs = sum(len(samples) for samples in results.values())
+    source = f"corpus {args.corpus}" if args.corpus else f"semilla {args.seed}"
+    print(f"\n{runs} ejecuciones en {elapsed:.2f} segundos ({source})")
+    cached = sum(s["cached"] for s in summary.values())
+    if cached:
+        print(f"{cached} muestras de la caché sin tiempos ni RSS (--no-cache para medirlas todas)")
+    if not args.no_history:
+        conn = connect(args.history)
+        run_id = record_run(conn, args.push_swap, results, source, args.label)
+        conn.close()
+        print(f"Ejecución #{run_id} guardada en el historial {args.history}")
+    if args.export_failures:
+        exported = export_failures(args.push_swap, results, args.export_failures, args.seed, args.corpus)
+        if exported:
+            print(f"{len(exported)} muestras fallidas exportadas en {args.export_failures}")
+    return 0 if all(s["passed"] for s in summary.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
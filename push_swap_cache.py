@@ -0,0 +1,163 @@
+"""Caché en disco de ejecuciones de push_swap indexada por (hash del binario, entrada)"""
+import hashlib
+import json
+import os
+import shutil
+import string
+import struct
+import tempfile
+import zlib
+
+from push_swap_checker import decode_operations, encode_operations
+
+# Directorio de la caché (relativo al directorio desde el que se ejecuta el tester)
+CACHE_DIR = ".push_swap_cache"
+
+# Tamaño máximo de la caché en bytes; al superarlo se borran las entradas menos usadas
+CACHE_LIMIT = 256 * 1024 * 1024
+
+# Cada cuántas escrituras (por proceso) se comprueba el tamaño total
+EVICT_EVERY = 100
+
+# Cabecera de cada entrada: magic + longitud de los metadatos JSON
+MAGIC = b"PSC1"
+HEADER = struct.Struct("<4sI")
+
+# Hash del binario memorizado por (ruta, inodo, tamaño, fecha de modificación)
+_binary_hashes = {}
+_stores = 0
+
+
+def binary_hash(path):
+    """SHA-256 del ejecutable; se recalcula solo si el fichero cambia (p. ej. al recompilar)
+
+    Un nombre sin directorio se busca en PATH, igual que al ejecutarlo.
+    """
+    path = shutil.which(path) or path
+    st = os.stat(path)
+    stamp = (os.path.realpath(path), st.st_ino, st.st_size, st.st_mtime_ns)
+    digest = _binary_hashes.get(stamp)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _binary_hashes[stamp] = digest
+    return digest
+
+
+def cache_key(push_swap, numbers, quoted=False, limits=None):
+    """Clave de una ejecución: hash del binario + secuencia de entrada
+
+    Las entradas pasadas como un único argumento tienen su propia clave (un
+    push_swap puede aceptar una forma y rechazar la otra). limits son los
+    límites de la ejecución (cualquier valor serializable en JSON): un
+    resultado obtenido con poca memoria no vale para una ejecución sin límite.
+    """
+    h = hashlib.sha256(binary_hash(push_swap).encode())
+    h.update(b"\0")
+    h.update(" ".join(map(str, numbers)).encode())
+    if quoted:
+        h.update(b"\0quoted")
+    if limits is not None:
+        h.update(b"\0limits" + json.dumps(limits).encode())
+    return h.hexdigest()
+
+
+def _entry_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], key[2:] + ".bin")
+
+
+def _entries(cache_dir):
+    """Rutas de las entradas de resultados: solo los subdirectorios de dos cifras hexadecimales
+
+    En CACHE_DIR hay también otros ficheros (las tablas de push_swap_optimal)
+    que no cuentan para el límite ni se borran.
+    """
+    try:
+        subdirs = [d for d in os.scandir(cache_dir) if len(d.name) == 2
+                   and all(c in string.hexdigits for c in d.name) and d.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    for subdir in subdirs:
+        try:
+            names = os.listdir(subdir.path)
+        except OSError:
+            continue
+        for name in names:
+            if name.endswith(".bin"):
+                yield os.path.join(subdir.path, name)
+
+
+def load(key, cache_dir=CACHE_DIR):
+    """Devuelve (metadatos, operaciones) de una entrada o None si no existe"""
+    path = _entry_path(key, cache_dir)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        magic, meta_len = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            return None
+        meta = json.loads(data[HEADER.size:HEADER.size + meta_len])
+        operations = decode_operations(zlib.decompress(data[HEADER.size + meta_len:]))
+    except (struct.error, ValueError, zlib.error, IndexError):
+        return None
+    # Marcar la entrada como usada recientemente (LRU por fecha de modificación)
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return meta, operations
+
+
+def store(key, meta, operations, cache_dir=CACHE_DIR):
+    """Guarda una entrada de forma atómica (varios procesos pueden escribir a la vez)"""
+    global _stores
+    path = _entry_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    meta_bytes = json.dumps(meta).encode()
+    data = HEADER.pack(MAGIC, len(meta_bytes)) + meta_bytes + zlib.compress(encode_operations(operations))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return
+
+    _stores += 1
+    if _stores % EVICT_EVERY == 0:
+        evict(cache_dir)
+
+
+def evict(cache_dir=CACHE_DIR, limit=CACHE_LIMIT):
+    """Borra las entradas menos usadas hasta dejar los resultados por debajo del 90% del límite"""
+    entries = []
+    total = 0
+    for path in _entries(cache_dir):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    if total <= limit:
+        return
+    entries.sort()
+    target = limit * 0.9
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
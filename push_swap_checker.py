@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Simulador de las pilas de push_swap y checker compatible con el oficial"""
+import re
+import sys
+from collections import deque
+from itertools import groupby, islice
+
+# Operaciones válidas (el índice de cada una es su código de operación)
+OPERATIONS = ("sa", "sb", "ss", "pa", "pb", "ra", "rb", "rr", "rra", "rrb", "rrr")
+OPCODES = {op: code for code, op in enumerate(OPERATIONS)}
+
+# Codificación compacta: un byte por operación; con RUN_FLAG activado le sigue la
+# longitud de la racha en varint (LEB128), útil para las largas series de ra/rra
+RUN_FLAG = 0x80
+MIN_RUN = 3
+
+# Límites de un int de C
+INT_MIN = -2147483648
+INT_MAX = 2147483647
+
+# Formato de un número aceptado por push_swap (int() admitiría además '_' y espacios)
+NUMBER_RE = re.compile(r"[+-]?[0-9]+")
+
+
+class InvalidOperation(ValueError):
+    """Línea de la salida de push_swap que no es una operación válida"""
+
+
+class PushSwapSimulator:
+    """Pilas A y B sobre deques: cada operación cuesta O(1)
+
+    El elemento 0 de cada deque es la cima de la pila, igual que en la
+    visualización HTML.
+    """
+
+    def __init__(self, numbers):
+        self.a = deque(numbers)
+        self.b = deque()
+        self.count = 0
+        handlers = (self.sa, self.sb, self.ss, self.pa, self.pb, self.ra,
+                    self.rb, self.rr, self.rra, self.rrb, self.rrr)
+        # Se aceptan tanto str como bytes para poder leer directamente de un pipe
+        self._dispatch = {}
+        for op, handler in zip(OPERATIONS, handlers):
+            self._dispatch[op] = handler
+            self._dispatch[op.encode()] = handler
+
+    @staticmethod
+    def _swap(stack):
+        if len(stack) >= 2:
+            stack[0], stack[1] = stack[1], stack[0]
+
+    @staticmethod
+    def _push(src, dst):
+        if src:
+            dst.appendleft(src.popleft())
+
+    def sa(self):
+        self._swap(self.a)
+
+    def sb(self):
+        self._swap(self.b)
+
+    def ss(self):
+        self._swap(self.a)
+        self._swap(self.b)
+
+    def pa(self):
+        self._push(self.b, self.a)
+
+    def pb(self):
+        self._push(self.a, self.b)
+
+    def ra(self):
+        self.a.rotate(-1)
+
+    def rb(self):
+        self.b.rotate(-1)
+
+    def rr(self):
+        self.a.rotate(-1)
+        self.b.rotate(-1)
+
+    def rra(self):
+        self.a.rotate(1)
+
+    def rrb(self):
+        self.b.rotate(1)
+
+    def rrr(self):
+        self.a.rotate(1)
+        self.b.rotate(1)
+
+    def apply(self, op):
+        """Ejecuta una operación ('sa', b'rra', ...)"""
+        handler = self._dispatch.get(op)
+        if handler is None:
+            raise InvalidOperation(op)
+        handler()
+        self.count += 1
+
+    def run(self, lines):
+        """Ejecuta las operaciones de un iterable de líneas (str o bytes)
+
+        Las líneas se consumen una a una, por lo que se puede pasar
+        directamente el stdout de un proceso sin cargarlo en memoria.
+        """
+        dispatch = self._dispatch
+        count = self.count
+        try:
+            for line in lines:
+                # Quitar solo el salto de línea final: un '\r' es parte de la
+                # operación y la invalida, igual que en el checker oficial
+                handler = dispatch.get(line.rstrip("\n" if isinstance(line, str) else b"\n"))
+                if handler is None:
+                    raise InvalidOperation(line)
+                handler()
+                count += 1
+        finally:
+            self.count = count
+        return count
+
+    def is_sorted(self):
+        """True si B está vacía y A está ordenada de menor a mayor"""
+        if self.b:
+            return False
+        return all(x < y for x, y in zip(self.a, islice(self.a, 1, None)))
+
+
+def check_operations(numbers, lines):
+    """Verifica que las operaciones ordenan los números
+
+    Devuelve (estado, número de operaciones) donde estado es "OK", "KO" o
+    "Error" (operación inválida).
+    """
+    simulator = PushSwapSimulator(numbers)
+    try:
+        simulator.run(lines)
+    except InvalidOperation:
+        return "Error", simulator.count
+    return ("OK" if simulator.is_sorted() else "KO"), simulator.count
+
+
+def encode_operations(operations):
+    """Codifica una lista de operaciones en bytes (ver RUN_FLAG)"""
+    data = bytearray()
+    for op, group in groupby(operations):
+        code = OPCODES.get(op)
+        if code is None:
+            raise InvalidOperation(op)
+        run = sum(1 for _ in group)
+        if run < MIN_RUN:
+            data.extend(bytes((code,)) * run)
+            continue
+        data.append(code | RUN_FLAG)
+        while True:
+            byte = run & 0x7F
+            run >>= 7
+            if run:
+                data.append(byte | 0x80)
+            else:
+                data.append(byte)
+                break
+    return bytes(data)
+
+
+def decode_operations(data):
+    """Inverso de encode_operations: devuelve la lista de operaciones"""
+    operations = []
+    i = 0
+    while i < len(data):
+        byte = data[i]
+        i += 1
+        if not byte & RUN_FLAG:
+            operations.append(OPERATIONS[byte])
+            continue
+        run = shift = 0
+        while True:
+            part = data[i]
+            i += 1
+            run |= (part & 0x7F) << shift
+            shift += 7
+            if not part & 0x80:
+                break
+        operations.extend([OPERATIONS[byte & ~RUN_FLAG]] * run)
+    return operations
+
+
+def parse_numbers(args):
+    """Convierte los argumentos del checker en enteros (acepta "1 2 3" como un único argumento)
+
+    Dentro de un argumento solo separa el espacio ASCII, como en el checker
+    oficial: un tabulador o un espacio Unicode forman parte del número.
+    """
+    numbers = []
+    for arg in args:
+        tokens = [token for token in arg.split(" ") if token]
+        if not tokens:
+            raise ValueError("argumento vacío")
+        for token in tokens:
+            if not NUMBER_RE.fullmatch(token):
+                raise ValueError(f"no numérico: {token}")
+            value = int(token)
+            if not INT_MIN <= value <= INT_MAX:
+                raise ValueError(f"fuera de rango: {token}")
+            numbers.append(value)
+    if len(numbers) != len(set(numbers)):
+        raise ValueError("números duplicados")
+    return numbers
+
+
+def main():
+    # Sin argumentos el checker no hace nada, igual que el oficial
+    if len(sys.argv) < 2:
+        return 0
+
+    try:
+        numbers = parse_numbers(sys.argv[1:])
+    except ValueError:
+        print("Error", file=sys.stderr)
+        return 1
+
+    status, _ = check_operations(numbers, sys.stdin.buffer)
+    if status == "Error":
+        print("Error", file=sys.stderr)
+        return 1
+    print(status)
+    return 0 if status == "OK" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Benchmark del checker: flujos de operaciones válidos, inválidos y malformados por stdin"""
+import argparse
+import multiprocessing
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from push_swap_analyzer import INVERSE
+from push_swap_checker import OPERATIONS, PushSwapSimulator, check_operations
+from push_swap_runner import ERROR, TIMEOUT, wait_with_rusage, watchdog
+
+# Checker por defecto y, si no existe, el de Python del tester
+CHECKER = "./checker"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PYTHON_CHECKER = os.path.join(SCRIPT_DIR, "push_swap_checker.py")
+
+# Números de la entrada y longitudes (en operaciones) de los flujos de rendimiento
+SIZE = 100
+LENGTHS = (10_000, 100_000, 1_000_000)
+
+# Longitud de los flujos de las pruebas de corrección
+CHECK_LENGTH = 2000
+
+# Plazo de cada ejecución del checker
+CHECKER_TIMEOUT = 60.0
+
+# Escrituras grandes en el pipe (rendimiento) y pequeñas (escrituras parciales)
+WRITE_CHUNK = 1 << 20
+PARTIAL_CHUNK = (1, 8)
+
+# Líneas malformadas que se insertan en mitad de un flujo válido
+MALFORMED = {
+    "espacio final": b"ra ",
+    "espacio inicial": b" ra",
+    "mayúsculas": b"RA",
+    "línea vacía": b"",
+    "separada": b"r a",
+    "tabulador": b"ra\t",
+    "fin de línea CRLF": b"ra\r",
+    "byte nulo": b"ra\0",
+    "desconocida": b"rx",
+}
+
+# Cada operación como bytes (las listas de líneas comparten estos objetos)
+ENCODED = {op: op.encode() for op in OPERATIONS}
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def random_walk(size, length, rng):
+    """Unas length operaciones al azar desde A con size elementos y B vacía, terminando con B vacía
+
+    Solo se usan pa/pb que mueven algún elemento: el resto de operaciones
+    sin efecto también lo son al deshacerlas, pero un pb con A vacía no.
+    """
+    ops = []
+    len_a, len_b = size, 0
+    while len(ops) + len_b < length:
+        op = rng.choice(OPERATIONS)
+        if op == "pa":
+            if not len_b:
+                continue
+            len_a, len_b = len_a + 1, len_b - 1
+        elif op == "pb":
+            if not len_a:
+                continue
+            len_a, len_b = len_a - 1, len_b + 1
+        ops.append(op)
+    ops.extend(["pa"] * len_b)
+    return ops
+
+
+def sorting_stream(size, length, rng):
+    """(números, operaciones) donde las operaciones ordenan los números
+
+    Se parte de 1..size ordenado, se aplica un paseo aleatorio y la entrada es
+    el estado final; el flujo es el paseo deshecho (al revés y cada operación
+    cambiada por su inversa), que vuelve al estado ordenado.
+    """
+    walk = random_walk(size, length, rng)
+    simulator = PushSwapSimulator(range(1, size + 1))
+    for op in walk:
+        simulator.apply(op)
+    return list(simulator.a), [INVERSE[op] for op in reversed(walk)]
+
+
+def _case(directory, name, numbers, lines, partial=False):
+    """Guarda el flujo en directory y devuelve el caso con el resultado esperado según el simulador"""
+    expected, _ = check_operations(numbers, lines)
+    path = os.path.join(directory, f"{len(os.listdir(directory))}.ops")
+    with open(path, "wb") as f:
+        if lines:
+            f.write(b"\n".join(lines) + b"\n")
+    return {"name": name, "numbers": numbers, "path": path, "ops": len(lines),
+            "bytes": os.path.getsize(path), "partial": partial, "expected": expected}
+
+
+def make_cases(task):
+    """Casos de rendimiento de una longitud: un flujo que ordena, uno que no y uno con una
+    operación inválida (se ejecuta en un worker)"""
+    directory, size, length, seed = task
+    directory = tempfile.mkdtemp(dir=directory)
+    rng = random.Random(f"checker-{seed}-{size}-{length}")
+    numbers, ops = sorting_stream(size, length, rng)
+    lines = [ENCODED[op] for op in ops]
+    middle = len(lines) // 2
+    return [_case(directory, f"ok {length}", numbers, lines),
+            _case(directory, f"ko {length}", numbers, lines + [b"sa"]),
+            _case(directory, f"inválida {length}", numbers, lines[:middle] + [b"rx"] + lines[middle:])]
+
+
+def make_check_cases(task):
+    """Casos de corrección: líneas malformadas, escrituras parciales y flujos vacíos (se ejecuta en un worker)"""
+    directory, size, seed = task
+    directory = tempfile.mkdtemp(dir=directory)
+    rng = random.Random(f"checker-check-{seed}-{size}")
+    numbers, ops = sorting_stream(size, CHECK_LENGTH, rng)
+    lines = [ENCODED[op] for op in ops]
+    middle = len(lines) // 2
+    cases = [_case(directory, name, numbers, lines[:middle] + [line] + lines[middle:])
+             for name, line in MALFORMED.items()]
+    cases.append(_case(directory, "parcial ok", numbers, lines, partial=True))
+    cases.append(_case(directory, "parcial ko", numbers, lines + [b"sa"], partial=True))
+    cases.append(_case(directory, "parcial inválida", numbers, lines[:middle] + [b"rx"] + lines[middle:],
+                       partial=True))
+    cases.append(_case(directory, "vacío ordenada", sorted(numbers), []))
+    cases.append(_case(directory, "vacío desordenada", numbers, []))
+    return cases
+
+
+def generate(directory, size, lengths, seed=0, jobs=None):
+    """Genera en paralelo los flujos en ficheros de directory
+
+    Devuelve (casos de rendimiento, casos de corrección). Los flujos no pasan
+    por este proceso: el RSS máximo de un hijo nunca es menor que el del
+    padre al lanzarlo (ver wait_with_rusage), así que el padre debe seguir
+    siendo pequeño para medir el del checker.
+    """
+    with multiprocessing.Pool(jobs or os.cpu_count() or 1) as pool:
+        check = pool.apply_async(make_check_cases, ((directory, size, seed),))
+        batches = pool.map(make_cases, [(directory, size, length, seed) for length in lengths])
+        return [case for batch in batches for case in batch], check.get()
+
+
+def _feed(stream, path, partial, rng):
+    """Escribe el fichero path en el stdin del checker y lo cierra
+
+    Sin partial se escribe en bloques de WRITE_CHUNK; con partial, en trozos
+    de 1 a 8 bytes que cortan las líneas, con una pausa cada 64 escrituras
+    para que el checker llegue a leer líneas a medias.
+    """
+    try:
+        with open(path, "rb") as f:
+            if partial:
+                view = memoryview(f.read())
+                i = writes = 0
+                while i < len(view):
+                    step = rng.randint(*PARTIAL_CHUNK)
+                    os.write(stream.fileno(), view[i:i + step])
+                    i += step
+                    writes += 1
+                    if writes % 64 == 0:
+                        time.sleep(0.001)
+            else:
+                for chunk in iter(lambda: f.read(WRITE_CHUNK), b""):
+                    stream.write(chunk)
+        stream.close()
+    except BrokenPipeError:
+        # El checker puede terminar antes de leerlo todo (p. ej. tras un Error)
+        pass
+
+
+def _verdict(out, err):
+    text = out.decode(errors="replace").strip()
+    if text in ("OK", "KO"):
+        return text
+    if text == ERROR or ERROR in err.decode(errors="replace"):
+        return ERROR
+    return text or "(nada)"
+
+
+def run_checker(checker, numbers, path, partial=False, timeout=CHECKER_TIMEOUT, seed=0):
+    """Ejecuta el checker con el fichero path por stdin y devuelve (veredicto, segundos, RSS máximo en KB)"""
+    cmd = [checker] + [str(n) for n in numbers]
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            start_new_session=True)
+    deadline = watchdog.watch(proc, timeout)
+    writer = threading.Thread(target=_feed, args=(proc.stdin, path, partial, random.Random(seed)), daemon=True)
+    writer.start()
+    # stderr se lee en otro hilo: un checker que llena el pipe de stderr
+    # mientras aquí se espera el final de stdout no se queda bloqueado
+    err_chunks = []
+    reader = threading.Thread(target=lambda: err_chunks.append(proc.stderr.read()), daemon=True)
+    reader.start()
+    out = proc.stdout.read()
+    reader.join()
+    err = err_chunks[0]
+    proc.stdout.close()
+    proc.stderr.close()
+    returncode, _, _, max_rss_kb = wait_with_rusage(proc, deadline=deadline)
+    wall = time.perf_counter() - start
+    writer.join()
+    if deadline.expired.is_set() and returncode == -signal.SIGKILL:
+        return TIMEOUT, wall, max_rss_kb
+    return _verdict(out, err), wall, max_rss_kb
+
+
+def run_cases(checker, cases, timeout=CHECKER_TIMEOUT):
+    """Ejecuta cada caso y anota la respuesta del checker junto a la esperada"""
+    results = []
+    for case in cases:
+        verdict, wall, max_rss_kb = run_checker(checker, case["numbers"], case["path"], case["partial"], timeout)
+        results.append({"name": case["name"], "ops": case["ops"], "bytes": case["bytes"],
+                        "expected": case["expected"], "verdict": verdict, "wall": wall,
+                        "max_rss_kb": max_rss_kb, "partial": case["partial"]})
+    return results
+
+
+def print_results(title, results):
+    print(f"{YELLOW}{title}{NC}")
+    print(f"{YELLOW}{'Caso':<20} {'ops':>9} {'MB':>7} {'esperado':>8} {'checker':>8} "
+          f"{'tiempo':>9} {'ops/s':>11} {'RSS máx':>9}{NC}")
+    print("-" * 90)
+    for r in results:
+        # Con Error el checker para en la línea inválida: el ritmo no es comparable
+        rate = f"{r['ops'] / r['wall']:>11,.0f}" if r["expected"] != ERROR and r["ops"] else f"{'-':>11}"
+        mark = f"{GREEN}✓{NC}" if r["verdict"] == r["expected"] else f"{RED}✗{NC}"
+        print(f"{r['name']:<20} {r['ops']:>9} {r['bytes'] / 1e6:>7.2f} {r['expected']:>8} {r['verdict']:>8} "
+              f"{r['wall'] * 1000:>7.1f}ms {rate} {r['max_rss_kb'] / 1024:>7.1f}MB {mark}")
+
+
+def main():
+    default_checker = CHECKER if os.path.isfile(CHECKER) else PYTHON_CHECKER
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checker", default=default_checker,
+                        help=f"checker a probar ({CHECKER}; si no existe, push_swap_checker.py)")
+    parser.add_argument("-n", "--size", type=int, default=SIZE, help=f"números de la entrada ({SIZE})")
+    parser.add_argument("-l", "--lengths", type=int, nargs="+", default=list(LENGTHS),
+                        help="operaciones de cada flujo de rendimiento (10000 100000 1000000)")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de los flujos")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="procesos que generan los flujos (todos los núcleos)")
+    parser.add_argument("--timeout", type=float, default=CHECKER_TIMEOUT,
+                        help=f"segundos por ejecución del checker ({CHECKER_TIMEOUT:.0f})")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.checker):
+        print(f"{RED}Error: No se encontró el checker en la ubicación: {args.checker}{NC}")
+        return 1
+    if args.size < 2:
+        print(f"{RED}Error: la entrada necesita al menos 2 números{NC}")
+        return 1
+
+    print(f"Checker: {args.checker} ({args.size} números, semilla {args.seed})\n")
+    with tempfile.TemporaryDirectory(prefix="push_swap_checker_") as directory:
+        cases, check_cases = generate(directory, args.size, args.lengths, args.seed, args.jobs)
+        throughput = run_cases(args.checker, cases, args.timeout)
+        print_results("Rendimiento (escrituras de 1 MiB)", throughput)
+        print()
+        correctness = run_cases(args.checker, check_cases, args.timeout)
+        print_results("Corrección (líneas malformadas, escrituras parciales y flujos vacíos)", correctness)
+
+    wrong = [r for r in throughput + correctness if r["verdict"] != r["expected"]]
+    if wrong:
+        print(f"\n{RED}✗ {len(wrong)} casos con una respuesta incorrecta: "
+              f"{', '.join(r['name'] for r in wrong)}{NC}")
+        return 1
+    print(f"\n{GREEN}✓ El checker responde correctamente en todos los casos{NC}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Comparación A/B de dos binarios de push_swap con las mismas entradas y un test t pareado"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from push_swap_bench import SIZES, make_input
+from push_swap_runner import OK, run_push_swap
+from push_swap_stats import mean, paired_test
+
+# Fichero con las entradas en las que el binario nuevo empeora más
+REGRESSIONS_FILE = "push_swap_regressions.json"
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+BLUE = "\033[0;34m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def compare_sample(task):
+    """Ejecuta los dos binarios con la misma entrada (se ejecuta en un worker)
+
+    Sin caché: el test pareado del tiempo solo tiene sentido con las dos
+    medidas tomadas ahora y con la misma carga.
+    """
+    old, new, size, seed, index = task
+    numbers = make_input(size, seed, index)
+    # Se alterna el orden para que ninguno de los dos se beneficie siempre de ir segundo
+    order = (old, new) if index % 2 == 0 else (new, old)
+    results = {binary: run_push_swap(numbers, binary, use_cache=False) for binary in order}
+    sample = {"size": size, "index": index}
+    for name, binary in (("old", old), ("new", new)):
+        result = results[binary]
+        sample[f"{name}_status"] = result.status
+        sample[f"{name}_ops"] = result.ops
+        sample[f"{name}_wall"] = result.wall
+    return sample
+
+
+def run_comparison(old, new, sizes, samples, seed=0, jobs=None):
+    """Ejecuta samples entradas de cada tamaño con los dos binarios en un pool de procesos"""
+    tasks = [(old, new, size, seed, i) for size in sizes for i in range(samples)]
+    results = {size: [] for size in sizes}
+    jobs = jobs or os.cpu_count() or 1
+    with multiprocessing.Pool(jobs) as pool:
+        for sample in pool.imap_unordered(compare_sample, tasks, max(1, len(tasks) // (jobs * 8))):
+            results[sample["size"]].append(sample)
+    for samples_of_size in results.values():
+        samples_of_size.sort(key=lambda s: s["index"])
+    return results
+
+
+def summarize(results):
+    """Diferencias pareadas (nuevo - antiguo) de operaciones y tiempo por tamaño"""
+    summary = {}
+    for size, samples in results.items():
+        summary[size] = {
+            "old_ops": mean([s["old_ops"] for s in samples]),
+            "new_ops": mean([s["new_ops"] for s in samples]),
+            "ops": paired_test([s["old_ops"] for s in samples], [s["new_ops"] for s in samples]),
+            "wall": paired_test([s["old_wall"] for s in samples], [s["new_wall"] for s in samples]),
+            "old_failures": sum(1 for s in samples if s["old_status"] != OK),
+            "new_failures": sum(1 for s in samples if s["new_status"] != OK),
+        }
+    return summary
+
+
+def _verdict(test, alpha=0.05):
+    if not test["p"] < alpha:
+        return f"{BLUE}sin diferencia{NC}"
+    return f"{GREEN}mejora{NC}" if test["mean"] < 0 else f"{RED}empeora{NC}"
+
+
+def print_summary(summary):
+    """Tabla con la media de cada binario, la diferencia con su IC del 95% y el valor p"""
+    print(f"{YELLOW}{'Tamaño':>6} | {'antiguo':>8} {'nuevo':>8} {'dif. ops (IC 95%)':>26} {'p':>7} | "
+          f"{'dif. tiempo ms (IC 95%)':>28} {'p':>7} | Resultado{NC}")
+    print("-" * 120)
+    for size, stats in summary.items():
+        ops = stats["ops"]
+        wall = stats["wall"]
+        interval = f"{ops['mean']:+.1f} [{ops['ci_low']:+.1f}, {ops['ci_high']:+.1f}]"
+        wall_interval = (f"{wall['mean'] * 1000:+.2f} [{wall['ci_low'] * 1000:+.2f}, "
+                         f"{wall['ci_high'] * 1000:+.2f}]")
+        verdict = _verdict(ops)
+        if stats["new_failures"] > stats["old_failures"]:
+            verdict = f"{RED}✗ {stats['new_failures']} muestras no ordenan (antes {stats['old_failures']}){NC}"
+        print(f"{size:>6} | {stats['old_ops']:>8.1f} {stats['new_ops']:>8.1f} {interval:>26} {ops['p']:>7.3f} | "
+              f"{wall_interval:>28} {wall['p']:>7.3f} | {verdict}")
+
+
+def worst_regressions(results, count, seed=0):
+    """Las count entradas en las que el binario nuevo usa más operaciones que el antiguo"""
+    samples = [s for size_samples in results.values() for s in size_samples if s["new_ops"] > s["old_ops"]]
+    samples.sort(key=lambda s: s["new_ops"] - s["old_ops"], reverse=True)
+    return [dict(s, numbers=make_input(s["size"], seed, s["index"])) for s in samples[:count]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("old", help="push_swap de referencia")
+    parser.add_argument("new", help="push_swap a comparar")
+    parser.add_argument("-n", "--samples", type=int, default=100, help="entradas por tamaño (100)")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=list(SIZES), help="tamaños a probar")
+    parser.add_argument("--seed", type=int, default=0, help="semilla base de las entradas")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="procesos en paralelo (todos los núcleos)")
+    parser.add_argument("--top", type=int, default=5, help="peores regresiones que se muestran (5)")
+    parser.add_argument("--regressions", default=REGRESSIONS_FILE,
+                        help=f"fichero JSON con las entradas de las peores regresiones ({REGRESSIONS_FILE})")
+    args = parser.parse_args()
+
+    for binary in (args.old, args.new):
+        if not os.path.isfile(binary):
+            print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {binary}{NC}")
+            return 1
+
+    start = time.perf_counter()
+    results = run_comparison(args.old, args.new, args.sizes, args.samples, args.seed, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    print(f"Diferencias: {args.new} - {args.old} (negativo = el nuevo es mejor)\n")
+    summary = summarize(results)
+    print_summary(summary)
+
+    regressions = worst_regressions(results, args.top, args.seed)
+    if regressions:
+        print(f"\n{YELLOW}Peores regresiones:{NC}")
+        for sample in regressions:
+            print(f"  {sample['size']} números, muestra {sample['index']}: "
+                  f"{sample['old_ops']} -> {sample['new_ops']} (+{sample['new_ops'] - sample['old_ops']})")
+        with open(args.regressions, "w") as f:
+            json.dump(regressions, f)
+        print(f"Entradas guardadas en {args.regressions}")
+
+    print(f"\n{2 * args.samples * len(args.sizes)} ejecuciones en {elapsed:.2f} segundos (semilla {args.seed})")
+    worse = any(s["new_failures"] > s["old_failures"] or (s["ops"]["p"] < 0.05 and s["ops"]["mean"] > 0)
+                for s in summary.values())
+    return 1 if worse else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Corpus de entradas reproducibles: suites con semilla en un fichero binario que se lee con mmap"""
+import argparse
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+
+from push_swap_checker import INT_MAX, INT_MIN
+
+# Cabecera del fichero: magic, número de casos, longitud de los metadatos JSON.
+# Le siguen los metadatos, el índice (número de casos + 1 offsets uint64 en
+# bytes desde el inicio de los datos, alineado a 8) y los datos (int32 little-endian).
+MAGIC = b"PSK1"
+HEADER = struct.Struct("<4sII")
+OFFSET = struct.Struct("<Q")
+
+# Colores para la terminal
+RED = "\033[0;31m"
+NC = "\033[0m"
+
+
+def _random(size, rng):
+    numbers = list(range(1, size + 1))
+    rng.shuffle(numbers)
+    return numbers
+
+
+def _reversed(size, rng):
+    return list(range(size, 0, -1))
+
+
+def _nearly_sorted(size, rng):
+    """Ordenada con un 5% de intercambios de elementos cercanos"""
+    numbers = list(range(1, size + 1))
+    for _ in range(max(1, size // 20)):
+        if size < 2:
+            break
+        i = rng.randrange(size - 1)
+        j = min(size - 1, i + rng.randrange(1, 4))
+        numbers[i], numbers[j] = numbers[j], numbers[i]
+    return numbers
+
+
+def _extremes(size, rng):
+    """Valores pegados a INT_MIN e INT_MAX (siempre incluye los dos)"""
+    low = list(range(INT_MIN, INT_MIN + size))
+    high = list(range(INT_MAX - size + 1, INT_MAX + 1))
+    numbers = [INT_MIN, INT_MAX][:size] + rng.sample(low[1:] + high[:-1], max(0, size - 2))
+    rng.shuffle(numbers)
+    return numbers
+
+
+def _sawtooth(size, rng):
+    """Dientes crecientes de longitud aleatoria colocados de mayor a menor"""
+    numbers = list(range(1, size + 1))
+    teeth = []
+    while numbers:
+        length = rng.randint(2, max(2, int(size ** 0.5)))
+        teeth.append(numbers[:length])
+        numbers = numbers[length:]
+    return [n for tooth in reversed(teeth) for n in tooth]
+
+
+# Suites disponibles: nombre -> función (tamaño, rng) -> lista de números
+SUITES = {
+    "random": _random,
+    "reversed": _reversed,
+    "nearly-sorted": _nearly_sorted,
+    "extremes": _extremes,
+    "sawtooth": _sawtooth,
+}
+
+
+def make_case(suite, size, seed, index):
+    """Caso index de una suite; depende solo de (suite, tamaño, semilla, índice)"""
+    rng = random.Random(f"{suite}-{seed}-{size}-{index}")
+    return SUITES[suite](size, rng)
+
+
+def write_corpus(path, cases, count, meta=None):
+    """Escribe count casos (un iterable de listas de enteros) sin tenerlos todos en memoria"""
+    meta_bytes = json.dumps(dict(meta or {}, count=count)).encode()
+    index_start = HEADER.size + len(meta_bytes)
+    index_start += -index_start % 8
+    data_start = index_start + OFFSET.size * (count + 1)
+    offsets = [0]
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.seek(data_start)
+        written = 0
+        for numbers in cases:
+            if written == count:
+                raise ValueError(f"más de {count} casos")
+            f.write(struct.pack(f"<{len(numbers)}i", *numbers))
+            offsets.append(offsets[-1] + 4 * len(numbers))
+            written += 1
+        if written != count:
+            raise ValueError(f"se esperaban {count} casos y hay {written}")
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, count, len(meta_bytes)) + meta_bytes)
+        f.seek(index_start)
+        f.write(struct.pack(f"<{count + 1}Q", *offsets))
+    os.replace(tmp_path, path)
+
+
+def generate(path, suites, sizes, count, seed=0):
+    """Genera count casos de cada suite y tamaño (en ese orden) en path"""
+    cases = (make_case(suite, size, seed, i) for suite in suites for size in sizes for i in range(count))
+    meta = {"suites": list(suites), "sizes": list(sizes), "per_suite": count, "seed": seed}
+    write_corpus(path, cases, len(suites) * len(sizes) * count, meta)
+
+
+class Corpus:
+    """Corpus mapeado en memoria: corpus[i] lee solo el caso i"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.count, meta_len = HEADER.unpack_from(self._map)
+        except struct.error:
+            raise ValueError(f"{path}: no es un corpus") from None
+        if magic != MAGIC:
+            raise ValueError(f"{path}: no es un corpus")
+        self.meta = json.loads(self._map[HEADER.size:HEADER.size + meta_len])
+        self._index = HEADER.size + meta_len
+        self._index += -self._index % 8
+        self._data = self._index + OFFSET.size * (self.count + 1)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(f"caso {i} fuera de rango (el corpus tiene {self.count})")
+        start, end = struct.unpack_from("<2Q", self._map, self._index + OFFSET.size * i)
+        return list(struct.unpack_from(f"<{(end - start) // 4}i", self._map, self._data + start))
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def close(self):
+        self._map.close()
+
+
+# Corpus abiertos por proceso (los workers de un pool abren cada fichero una vez)
+_open = {}
+
+
+def open_corpus(path):
+    corpus = _open.get(path)
+    if corpus is None:
+        corpus = _open[path] = Corpus(path)
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="generar un corpus")
+    gen.add_argument("output", help="fichero de salida")
+    gen.add_argument("--suites", nargs="+", choices=list(SUITES), default=list(SUITES), help="suites (todas)")
+    gen.add_argument("-s", "--sizes", type=int, nargs="+", default=[100, 500], help="tamaños (100 500)")
+    gen.add_argument("-n", "--count", type=int, default=100, help="casos por suite y tamaño (100)")
+    gen.add_argument("--seed", type=int, default=0, help="semilla")
+
+    info = commands.add_parser("info", help="mostrar los metadatos de un corpus")
+    info.add_argument("corpus")
+
+    show = commands.add_parser("show", help="imprimir un caso como argumentos de push_swap")
+    show.add_argument("corpus")
+    show.add_argument("index", type=int)
+
+    case = commands.add_parser("case", help="imprimir un caso sin generar un fichero")
+    case.add_argument("suite", choices=list(SUITES))
+    case.add_argument("size", type=int)
+    case.add_argument("--seed", type=int, default=0, help="semilla")
+    case.add_argument("--index", type=int, default=0, help="índice del caso")
+
+    args = parser.parse_args()
+    try:
+        if args.command == "generate":
+            generate(args.output, args.suites, args.sizes, args.count, args.seed)
+            print(f"{len(args.suites) * len(args.sizes) * args.count} casos guardados en {args.output}")
+        elif args.command == "info":
+            corpus = Corpus(args.corpus)
+            print(json.dumps(corpus.meta))
+        elif args.command == "show":
+            print(" ".join(map(str, Corpus(args.corpus)[args.index])))
+        else:
+            print(" ".join(map(str, make_case(args.suite, args.size, args.seed, args.index))))
+    except (OSError, ValueError, IndexError) as e:
+        print(f"{RED}Error: {e}{NC}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
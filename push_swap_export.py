@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Exportación sin navegador: fotogramas SVG/PNG de las pilas y una imagen resumen de la ejecución"""
+import argparse
+import math
+import multiprocessing
+import os
+import struct
+import sys
+import unicodedata
+import zlib
+
+from push_swap_checker import PushSwapSimulator, parse_numbers
+from push_swap_runner import PUSH_SWAP, run_push_swap
+from push_swap_visualizer import COLORS
+
+# Directorio de salida por defecto
+EXPORT_DIR = "push_swap_export"
+
+# Tamaño de cada fotograma en píxeles
+FRAME_WIDTH = 800
+FRAME_HEIGHT = 600
+
+# Máximo de fotogramas si no se indica cada cuántas operaciones se toma uno
+MAX_FRAMES = 200
+
+# Instantáneas en la imagen resumen (columnas x filas) y alto de la gráfica de B
+SUMMARY_GRID = (3, 2)
+SUMMARY_PANEL = (400, 300)
+SUMMARY_CHART_HEIGHT = 150
+
+# Colores del fondo (los mismos que la página)
+BACKGROUND = "#1e1e1e"
+PANEL = "#2d2d2d"
+CHART = "#3357FF"
+TEXT = "#f0f0f0"
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+NC = "\033[0m"
+
+
+# Fuente de mapa de bits 5x7 para el texto de los PNG: cinco columnas por
+# carácter de " " a "~", con la fila de arriba en el bit menos significativo
+FONT = bytes.fromhex(
+    "0000000000" "00005f0000" "0007000700" "147f147f14" "242a7f2a12" "2313086462" "3649562050" "0005030000"
+    "001c224100" "0041221c00" "14083e0814" "08083e0808" "0050300000" "0808080808" "0060600000" "2010080402"
+    "3e5149453e" "00427f4000" "4261514946" "2141454b31" "1814127f10" "2745454539" "3c4a494930" "0171090503"
+    "3649494936" "064949291e" "0036360000" "0056360000" "0814224100" "1414141414" "0041221408" "0201510906"
+    "324979413e" "7e1111117e" "7f49494936" "3e41414122" "7f4141221c" "7f49494941" "7f09090901" "3e4149497a"
+    "7f0808087f" "00417f4100" "2040413f01" "7f08142241" "7f40404040" "7f020c027f" "7f0408107f" "3e4141413e"
+    "7f09090906" "3e4151215e" "7f09192946" "4649494931" "01017f0101" "3f4040403f" "1f2040201f" "3f4038403f"
+    "6314081463" "0708700807" "6151494543" "007f414100" "0204081020" "0041417f00" "0402010204" "4040404040"
+    "0001020400" "2054545478" "7f48444438" "3844444420" "384444487f" "3854545418" "087e090102" "0c5252523e"
+    "7f08040478" "00447d4000" "2040443d00" "7f10284400" "00417f4000" "7c04180478" "7c08040478" "3844444438"
+    "7c14141408" "081414187c" "7c08040408" "4854545420" "043f444020" "3c4040207c" "1c2040201c" "3c4030403c"
+    "4428102844" "0c5050503c" "4464544c44" "0008364100" "00007f0000" "0041360800" "0804081008")
+FONT_WIDTH, FONT_HEIGHT = 5, 7
+
+# Tildes sobre las minúsculas, en las dos filas que dejan libres: (columna, bits)
+ACCENTS = {"\u0301": ((2, 0x02), (3, 0x01)), "\u0300": ((1, 0x01), (2, 0x02)),
+           "\u0303": ((1, 0x02), (2, 0x01), (3, 0x02), (4, 0x01)), "\u0308": ((1, 0x02), (3, 0x02))}
+
+
+def _rgb(color):
+    return bytes.fromhex(color[1:])
+
+
+def glyph(char):
+    """Columnas de un carácter en FONT; las letras con tilde se componen y lo desconocido es «?»"""
+    base, *marks = unicodedata.normalize("NFD", char)
+    if not " " <= base <= "~":
+        base, marks = "?", []
+    start = (ord(base) - ord(" ")) * FONT_WIDTH
+    columns = bytearray(FONT[start:start + FONT_WIDTH])
+    if base.islower():
+        if base == "i" and marks:
+            columns[2] = 0x7c
+        for mark in marks:
+            for column, bits in ACCENTS.get(mark, ()):
+                columns[column] |= bits
+    return columns
+
+
+class Raster:
+    """Imagen RGB en memoria que solo sabe pintar rectángulos y texto y guardarse como PNG"""
+
+    def __init__(self, width, height, background=BACKGROUND):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(_rgb(background) * (width * height))
+
+    def rect(self, x, y, w, h, color):
+        x0, y0 = max(0, round(x)), max(0, round(y))
+        x1, y1 = min(self.width, round(x + w)), min(self.height, round(y + h))
+        # Las barras de menos de un píxel se dibujan de un píxel
+        x1, y1 = max(x1, min(x0 + 1, self.width)), max(y1, min(y0 + 1, self.height))
+        row = _rgb(color) * (x1 - x0)
+        for yy in range(y0, y1):
+            start = (yy * self.width + x0) * 3
+            self.pixels[start:start + len(row)] = row
+
+    def text(self, x, y, s, scale=2):
+        """Escribe s con la fuente FONT; y es la línea base, como en el SVG"""
+        top = y - FONT_HEIGHT * scale
+        for char in s:
+            for column, bits in enumerate(glyph(char)):
+                for row in range(FONT_HEIGHT):
+                    if bits >> row & 1:
+                        self.rect(x + column * scale, top + row * scale, scale, scale, TEXT)
+            x += (FONT_WIDTH + 1) * scale
+
+    def to_bytes(self):
+        """Codifica la imagen como PNG (filtro 0 en cada fila, un solo IDAT)"""
+        stride = self.width * 3
+        raw = b"".join(b"\0" + bytes(self.pixels[y * stride:(y + 1) * stride]) for y in range(self.height))
+
+        def chunk(kind, data):
+            return (struct.pack(">I", len(data)) + kind + data
+                    + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+                + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+
+class Vector:
+    """Imagen SVG con la misma interfaz que Raster"""
+
+    def __init__(self, width, height, background=BACKGROUND):
+        self.width = width
+        self.height = height
+        self.elements = [f'<rect width="{width}" height="{height}" fill="{background}"/>']
+
+    def rect(self, x, y, w, h, color):
+        self.elements.append(f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" fill="{color}"/>')
+
+    def text(self, x, y, s):
+        self.elements.append(f'<text x="{x}" y="{y}" fill="{TEXT}" font-family="Arial, sans-serif" '
+                             f'font-size="14">{s}</text>')
+
+    def to_bytes(self):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}">'
+                + "".join(self.elements) + "</svg>\n").encode()
+
+
+def new_image(fmt, width, height):
+    if fmt == "png":
+        return Raster(width, height)
+    if fmt == "svg":
+        return Vector(width, height)
+    raise ValueError(f"formato desconocido: {fmt}")
+
+
+def draw_state(image, a, b, scale, x, y, width, height):
+    """Dibuja las dos pilas en el rectángulo dado, con la cima abajo igual que la página
+
+    scale es (mínimo, máximo, cantidad) de los números de entrada.
+    """
+    low, high, count = scale
+    span = high - low
+    half = width / 2
+    row = height / max(count, 1)
+    bar = row - 1 if row >= 3 else row
+    for offset, stack in ((0, a), (half, b)):
+        image.rect(x + offset + 2, y, half - 4, height, PANEL)
+        for i, num in enumerate(stack):
+            fraction = 0.9 if span == 0 else 0.3 + (num - low) / span * 0.6
+            bar_width = fraction * (half - 4)
+            image.rect(x + offset + 2 + (half - 4 - bar_width) / 2, y + height - (i + 1) * row,
+                       bar_width, bar, COLORS[abs(num) % len(COLORS)])
+
+
+def sample_states(numbers, operations, every):
+    """Estados (posición, A, B) cada every operaciones, incluidos el inicial y el final"""
+    simulator = PushSwapSimulator(numbers)
+    states = [(0, list(simulator.a), list(simulator.b))]
+    for i, op in enumerate(operations, 1):
+        simulator.apply(op)
+        if i % every == 0 or i == len(operations):
+            states.append((i, list(simulator.a), list(simulator.b)))
+    return states
+
+
+def _write_frame(task):
+    """Dibuja y guarda un fotograma (se ejecuta en un worker)"""
+    path, fmt, position, a, b, scale = task
+    image = new_image(fmt, FRAME_WIDTH, FRAME_HEIGHT)
+    draw_state(image, a, b, scale, 0, 24, FRAME_WIDTH, FRAME_HEIGHT - 24)
+    image.text(8, 17, f"Operación {position}")
+    with open(path, "wb") as f:
+        f.write(image.to_bytes())
+    return path
+
+
+def _scale(numbers):
+    return (min(numbers, default=0), max(numbers, default=0), len(numbers))
+
+
+def export_frames(numbers, operations, output_dir=EXPORT_DIR, fmt="png", every=None, jobs=None):
+    """Guarda un fotograma cada every operaciones (por defecto como mucho MAX_FRAMES) en paralelo"""
+    every = every or max(1, math.ceil(len(operations) / MAX_FRAMES))
+    os.makedirs(output_dir, exist_ok=True)
+    scale = _scale(numbers)
+    tasks = [(os.path.join(output_dir, f"frame_{position:07d}.{fmt}"), fmt, position, a, b, scale)
+             for position, a, b in sample_states(numbers, operations, every)]
+    with multiprocessing.Pool(jobs or os.cpu_count() or 1) as pool:
+        return pool.map(_write_frame, tasks)
+
+
+def render_summary(numbers, operations, fmt="png", status=""):
+    """Imagen resumen: instantáneas repartidas por la ejecución y el tamaño de B a lo largo del tiempo"""
+    columns, rows = SUMMARY_GRID
+    panel_width, panel_height = SUMMARY_PANEL
+    width = columns * panel_width
+    height = 24 + rows * (panel_height + 24) + SUMMARY_CHART_HEIGHT + 24
+    image = new_image(fmt, width, height)
+    image.text(8, 17, f"{len(numbers)} números, {len(operations)} operaciones {status}".strip())
+
+    # Posiciones de las instantáneas repartidas entre el principio y el final
+    panels = columns * rows
+    positions = sorted({round(len(operations) * k / (panels - 1)) for k in range(panels)})
+    simulator = PushSwapSimulator(numbers)
+    b_sizes = []
+    scale = _scale(numbers)
+    panel = 0
+    for i in range(len(operations) + 1):
+        if i:
+            simulator.apply(operations[i - 1])
+        b_sizes.append(len(simulator.b))
+        if panel < len(positions) and positions[panel] == i:
+            x = (panel % columns) * panel_width
+            y = 24 + (panel // columns) * (panel_height + 24)
+            image.text(x + 8, y + 17, f"Operación {i}")
+            draw_state(image, simulator.a, simulator.b, scale, x, y + 24, panel_width, panel_height)
+            panel += 1
+
+    # Tamaño de B: una columna por píxel con el máximo de las operaciones que le tocan
+    top = 24 + rows * (panel_height + 24)
+    image.text(8, top + 17, "Tamaño de B")
+    chart_top = top + 24
+    image.rect(0, chart_top, width, SUMMARY_CHART_HEIGHT, PANEL)
+    per_column = len(b_sizes) / width
+    for column in range(width):
+        start = int(column * per_column)
+        bucket = b_sizes[start:max(start + 1, int((column + 1) * per_column))]
+        if bucket and max(bucket):
+            h = max(bucket) / max(len(numbers), 1) * SUMMARY_CHART_HEIGHT
+            image.rect(column, chart_top + SUMMARY_CHART_HEIGHT - h, 1, h, CHART)
+    return image.to_bytes()
+
+
+def export_summary(numbers, operations, output_dir=EXPORT_DIR, fmt="png", status=""):
+    """Guarda la imagen resumen en output_dir/summary.<fmt> y devuelve su ruta"""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"summary.{fmt}")
+    with open(path, "wb") as f:
+        f.write(render_summary(numbers, operations, fmt, status))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("numbers", nargs="+", help="números de entrada (o uno solo entre comillas)")
+    parser.add_argument("-o", "--output", default=EXPORT_DIR, help=f"directorio de salida ({EXPORT_DIR})")
+    parser.add_argument("-f", "--format", choices=("png", "svg"), default="png", help="formato de las imágenes (png)")
+    parser.add_argument("-k", "--every", type=int, default=None,
+                        help=f"un fotograma cada k operaciones (por defecto como mucho {MAX_FRAMES} fotogramas)")
+    parser.add_argument("--summary-only", action="store_true", help="guardar solo la imagen resumen")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="procesos en paralelo (todos los núcleos)")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    args = parser.parse_args()
+
+    try:
+        numbers = parse_numbers(args.numbers)
+    except ValueError as e:
+        print(f"{RED}Error: {e}{NC}")
+        return 1
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+
+    result = run_push_swap(numbers, args.push_swap, keep_operations=True)
+    print(f"push_swap: {result.ops} operaciones, {result.status}")
+    if not args.summary_only:
+        frames = export_frames(numbers, result.operations, args.output, args.format, args.every, args.jobs)
+        print(f"{len(frames)} fotogramas guardados en {args.output}")
+    path = export_summary(numbers, result.operations, args.output, args.format, result.status)
+    print(f"{GREEN}Resumen guardado en {path}{NC}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""Fuzzer del parseo de argumentos de push_swap: miles de argv ejecutados en paralelo con asyncio"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shlex
+import signal
+import sys
+import time
+
+from push_swap_checker import INT_MAX, INT_MIN, check_operations, parse_numbers
+from push_swap_runner import PUSH_SWAP, STDERR_LIMIT, Limits, Sandbox, reap, watchdog
+
+# Argumentos generados por defecto y límites de cada ejecución
+FUZZ_COUNT = 2000
+FUZZ_TIMEOUT = 5.0
+FUZZ_LIMITS = Limits(output=1024 * 1024)
+
+# Fichero con los fallos (argv original y minimizado)
+FUZZ_FILE = "push_swap_fuzz.json"
+
+# Lo que debe escribir push_swap en stderr ante una entrada inválida
+ERROR_OUTPUT = b"Error\n"
+
+# Tipos de fallo
+MISSED = "no detecta el error"
+ERROR_ON_STDOUT = "Error en stdout"
+OPS_AFTER_ERROR = "operaciones tras Error"
+FALSE_ERROR = "Error con entrada válida"
+UNSORTED = "no ordena"
+CRASH = "crash"
+HANG = "cuelgue"
+FLOOD = "salida excesiva"
+
+# Valores alrededor de los límites de int y de los enteros de 64 bits
+BOUNDARIES = [str(v) for b in (INT_MAX, INT_MIN, 2 ** 32, -2 ** 32, 2 ** 63, -2 ** 63, 2 ** 64)
+              for v in (b - 1, b, b + 1)] + ["99999999999999999999", "-99999999999999999999"]
+
+# Signos sueltos, repetidos o fuera de sitio (los de "+0" y "-0" son válidos)
+SIGNS = ["+", "-", "++1", "--1", "+-1", "-+1", "1+", "1-", "1-1", "+0", "-0", "+42", "- 1", "+ 1"]
+
+# Ceros a la izquierda: un número largo no tiene por qué salirse del rango
+ZEROS = ["00", "007", "-007", "+007", "0" * 30 + "42", "0" * 20 + str(INT_MAX), "0" * 20 + str(INT_MAX + 1),
+         "-" + "0" * 20 + str(-INT_MIN), "-" + "0" * 20 + str(-INT_MIN + 1)]
+
+# Argumentos vacíos o solo con espacios
+EMPTY = ["", " ", "   "]
+
+# Tokens que no son números en base 10 (los separadores que no son el espacio
+# ASCII, como el tabulador o el espacio Unicode, no separan números)
+GARBAGE = ["abc", "1a", "a1", "1.5", "1e3", "0x10", "1,2", "٣", "１", "1_000",
+           "1\t2", "1\n2", "1\u00a02", "\t"]
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def reference(argv):
+    """Números que debe aceptar push_swap para argv, o None si debe responder Error
+
+    Es el parseo del checker: números en base 10 con signo opcional, dentro
+    de int, sin repetir y separados solo por espacios ASCII dentro de un
+    argumento (un tabulador o un espacio Unicode hacen el argumento inválido).
+    """
+    try:
+        return parse_numbers(argv)
+    except ValueError:
+        return None
+
+
+def _disguise(value, rng):
+    """value escrito de otra forma que representa el mismo entero"""
+    text = str(abs(value))
+    sign = "-" if value < 0 else rng.choice(["", "+"])
+    if value == 0:
+        sign = rng.choice(["", "+", "-"])
+    return sign + "0" * rng.randint(0, 3) + text
+
+
+def _pack(tokens, rng):
+    """Agrupa tokens consecutivos en argumentos separados por espacios, con espacios de sobra"""
+    args = []
+    i = 0
+    while i < len(tokens):
+        group = tokens[i:i + rng.randint(1, 4)]
+        i += len(group)
+        if len(group) == 1 and rng.random() < 0.5:
+            args.append(group[0])
+            continue
+        spaces = [" " * rng.randint(1, 3) for _ in group]
+        arg = "".join(s + t for s, t in zip(spaces, group))[len(spaces[0]):]
+        args.append(" " * rng.randint(0, 2) + arg + " " * rng.randint(0, 2))
+    return args
+
+
+def make_vector(category, rng):
+    """Un argv de la categoría dada: unos pocos números válidos y distintos con tokens difíciles entre ellos"""
+    values = rng.sample(range(-1000, 1000), rng.randint(0, 6))
+    tokens = [str(v) for v in values]
+    if category == "límites":
+        extra = rng.sample(BOUNDARIES, rng.randint(1, 2))
+    elif category == "signos":
+        extra = rng.sample(SIGNS, rng.randint(1, 2))
+    elif category == "ceros":
+        extra = rng.sample(ZEROS, rng.randint(1, 2))
+    elif category == "vacíos":
+        # Un argumento vacío solo existe como argumento por separado
+        args = _pack(tokens, rng)
+        args.insert(rng.randint(0, len(args)), rng.choice(EMPTY))
+        return args
+    elif category == "duplicados":
+        # El mismo número escrito de dos formas distintas ("1", "+1", "01")
+        value = rng.choice(values) if values and rng.random() < 0.5 else rng.choice([0, 1, -1, INT_MAX, INT_MIN])
+        extra = [_disguise(value, rng)]
+        if str(value) not in tokens:
+            extra.append(_disguise(value, rng))
+    elif category == "basura":
+        extra = rng.sample(GARBAGE, 1)
+    else:
+        # Entradas válidas escritas de formas raras: las que más falsos Error provocan
+        tokens = [_disguise(v, rng) for v in values]
+        extra = []
+    for token in extra:
+        tokens.insert(rng.randint(0, len(tokens)), token)
+    return _pack(tokens, rng)
+
+
+CATEGORIES = ("límites", "signos", "ceros", "vacíos", "duplicados", "basura", "válidos")
+
+
+def edge_vectors():
+    """Cada token difícil solo y junto a otro número, como argumento propio y dentro de uno con espacios"""
+    vectors = [("válidos", [])]
+    for category, tokens in (("límites", BOUNDARIES), ("signos", SIGNS), ("ceros", ZEROS),
+                             ("vacíos", EMPTY), ("basura", GARBAGE)):
+        for token in tokens:
+            vectors += [(category, [token]), (category, ["5", token]), (category, [f"5 {token}"])]
+    for a, b in (("1", "+1"), ("1", "01"), ("+1", "01"), ("0", "-0"), ("0", "+0"), ("-0", "+0"),
+                 (str(INT_MAX), "+" + str(INT_MAX)), (str(INT_MIN), "-0" + str(-INT_MIN))):
+        vectors += [("duplicados", [a, b]), ("duplicados", [f"{a} {b}"]), ("duplicados", ["3", a, "2", b])]
+    return vectors
+
+
+def generate(count, seed=0):
+    """Los casos límite fijos más count argv aleatorios, sin repetir: lista de (categoría, argv)"""
+    rng = random.Random(f"fuzz-{seed}")
+    vectors = edge_vectors()
+    seen = {tuple(argv) for _, argv in vectors}
+    target = len(vectors) + count
+    attempts = 0
+    while len(vectors) < target and attempts < count * 10:
+        attempts += 1
+        category = CATEGORIES[attempts % len(CATEGORIES)]
+        argv = make_vector(category, rng)
+        if tuple(argv) not in seen:
+            seen.add(tuple(argv))
+            vectors.append((category, argv))
+    return vectors
+
+
+async def _read(proc, stream, limit):
+    """Lee stream hasta el final; si pasa de limit bytes mata el proceso y devuelve None"""
+    data = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return bytes(data)
+        data += chunk
+        if len(data) > limit:
+            # Todo el grupo: proc puede ser la compuerta, y el comando está en su grupo
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            return None
+
+
+async def run_vector(push_swap, argv, timeout, semaphore):
+    """Ejecuta push_swap con argv y devuelve (stdout, stderr, código de salida, agotó el tiempo)
+
+    stdout o stderr son None si superaron su límite. El tiempo lo vigila el
+    watchdog del runner y el hijo tiene los mismos límites que en el tester.
+    """
+    cmd = [push_swap] + list(argv)
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        with Sandbox(cmd, timeout, FUZZ_LIMITS) as box:
+            proc = await asyncio.create_subprocess_exec(
+                *box.cmd, stdin=box.stdin, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE, start_new_session=True)
+            # Espera a que termine la compuerta: fuera del bucle de eventos
+            pid = await loop.run_in_executor(None, box.release, proc.pid)
+        deadline = watchdog.watch(proc, timeout)
+        try:
+            stdout, stderr = await asyncio.gather(_read(proc, proc.stdout, FUZZ_LIMITS.output),
+                                                  _read(proc, proc.stderr, STDERR_LIMIT))
+            if pid != proc.pid:
+                # proc era la compuerta; el comando lo recoge el tester, su padre
+                # adoptivo, y reap cancela el plazo antes de liberar su pid
+                returncode, *_ = await loop.run_in_executor(None, reap, pid, deadline)
+                await proc.wait()
+            else:
+                # Sin compuerta el hijo lo recoge asyncio y el plazo solo se puede
+                # cancelar después
+                returncode = await proc.wait()
+        finally:
+            watchdog.cancel(deadline)
+    return stdout, stderr, returncode, deadline.expired.is_set() and returncode == -signal.SIGKILL
+
+
+def classify(argv, stdout, stderr, returncode, timed_out):
+    """Tipo de fallo de una ejecución según el parseo de referencia, o None si es correcta"""
+    if timed_out:
+        return HANG
+    if stdout is None or stderr is None:
+        return FLOOD
+    if returncode < 0:
+        return CRASH
+    numbers = reference(argv)
+    if numbers is None:
+        if stderr != ERROR_OUTPUT:
+            return ERROR_ON_STDOUT if b"Error" in stdout else MISSED
+        return OPS_AFTER_ERROR if stdout else None
+    if b"Error" in stderr:
+        return FALSE_ERROR
+    status, _ = check_operations(numbers, stdout.splitlines())
+    return None if status == "OK" else UNSORTED
+
+
+class Fuzzer:
+    """Ejecuta argv con un límite de procesos simultáneos y recuerda cada resultado"""
+
+    def __init__(self, push_swap, timeout=FUZZ_TIMEOUT, jobs=None):
+        self.push_swap = push_swap
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(jobs or 2 * (os.cpu_count() or 1))
+        self.results = {}
+        self.runs = 0
+
+    async def check(self, argv):
+        """Tipo de fallo de argv (None si push_swap responde bien)"""
+        key = tuple(argv)
+        if key not in self.results:
+            self.runs += 1
+            outcome = await run_vector(self.push_swap, argv, self.timeout, self.semaphore)
+            self.results[key] = classify(argv, *outcome)
+        return self.results[key]
+
+    async def ddmin(self, items, fails):
+        """Subconjunto mínimo de items que sigue fallando (delta debugging de Zeller)
+
+        En cada ronda se prueban a la vez todos los trozos y sus complementos
+        y se queda el primero que falla en orden.
+        """
+        n = 2
+        while len(items) >= 2:
+            size = len(items) / n
+            chunks = [items[round(i * size):round((i + 1) * size)] for i in range(n)]
+            complements = [items[:round(i * size)] + items[round((i + 1) * size):] for i in range(n)]
+            candidates = chunks + complements if n > 2 else chunks
+            results = await asyncio.gather(*(fails(c) for c in candidates))
+            failing = [c for c, failed in zip(candidates, results) if failed]
+            if failing and failing[0] in chunks:
+                items, n = failing[0], 2
+            elif failing:
+                items, n = failing[0], max(n - 1, 2)
+            elif n < len(items):
+                n = min(2 * n, len(items))
+            else:
+                break
+        if len(items) == 1 and await fails([]):
+            return []
+        return items
+
+    async def minimize(self, argv, kind):
+        """argv más corto con el mismo tipo de fallo: primero quita argumentos y
+        después tokens dentro de los argumentos con espacios"""
+        async def fails(candidate):
+            return await self.check(candidate) == kind
+
+        argv = await self.ddmin(list(argv), fails)
+        for i in range(len(argv)):
+            tokens = argv[i].split(" ")
+            if len(tokens) < 2:
+                continue
+
+            async def token_fails(candidate, i=i):
+                return await fails(argv[:i] + [" ".join(candidate)] + argv[i + 1:])
+
+            argv[i] = " ".join(await self.ddmin(tokens, token_fails))
+        return argv
+
+
+async def fuzz(push_swap, vectors, timeout=FUZZ_TIMEOUT, jobs=None, minimize=True):
+    """Ejecuta todos los argv en paralelo y minimiza los que fallan
+
+    Devuelve (resultados por argv como (categoría, argv, fallo), fallos con
+    su argv minimizado, ejecuciones totales).
+    """
+    fuzzer = Fuzzer(push_swap, timeout, jobs)
+    kinds = await asyncio.gather(*(fuzzer.check(argv) for _, argv in vectors))
+    results = [(category, argv, kind) for (category, argv), kind in zip(vectors, kinds)]
+    failed = [(category, argv, kind) for category, argv, kind in results if kind]
+    if minimize:
+        minimized = await asyncio.gather(*(fuzzer.minimize(argv, kind) for _, argv, kind in failed))
+    else:
+        minimized = [argv for _, argv, _ in failed]
+    failures = [{"category": category, "kind": kind, "argv": argv, "minimized": small,
+                 "expected": "Error" if reference(small) is None else "válida"}
+                for (category, argv, kind), small in zip(failed, minimized)]
+    return results, failures, fuzzer.runs
+
+
+def print_summary(results):
+    """Tabla con los argv y los fallos de cada categoría"""
+    print(f"{YELLOW}{'Categoría':<12} {'argv':>6} {'fallos':>7}  Tipos de fallo{NC}")
+    for category in CATEGORIES:
+        kinds = [kind for c, _, kind in results if c == category]
+        failed = [kind for kind in kinds if kind]
+        counts = ", ".join(f"{kind} ({failed.count(kind)})" for kind in sorted(set(failed)))
+        color = RED if failed else GREEN
+        print(f"{category:<12} {len(kinds):>6} {color}{len(failed):>7}{NC}  {counts}")
+
+
+def print_failures(push_swap, failures, top):
+    """Los argv minimizados distintos de cada tipo de fallo, del más corto al más largo"""
+    by_kind = {}
+    for failure in failures:
+        by_kind.setdefault(failure["kind"], {}).setdefault(tuple(failure["minimized"]), failure)
+    for kind, unique in by_kind.items():
+        print(f"\n{RED}✗ {kind}{NC} ({len(unique)} argv mínimos distintos)")
+        for argv in sorted(unique, key=lambda a: (len(a), sum(map(len, a))))[:top]:
+            print(f"  {shlex.join([push_swap, *argv])}  (esperado: {unique[argv]['expected']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=FUZZ_COUNT,
+                        help=f"argv aleatorios además de los casos límite fijos ({FUZZ_COUNT})")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de los argv")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="procesos simultáneos (el doble de núcleos)")
+    parser.add_argument("--timeout", type=float, default=FUZZ_TIMEOUT,
+                        help=f"segundos máximos por ejecución ({FUZZ_TIMEOUT})")
+    parser.add_argument("--no-minimize", action="store_true", help="no minimizar los argv que fallan")
+    parser.add_argument("--top", type=int, default=5, help="argv mínimos que se muestran por tipo de fallo (5)")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    parser.add_argument("-o", "--output", default=FUZZ_FILE, help=f"fichero JSON con los fallos ({FUZZ_FILE})")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+
+    vectors = generate(args.count, args.seed)
+    start = time.perf_counter()
+    results, failures, runs = asyncio.run(fuzz(args.push_swap, vectors, args.timeout, args.jobs,
+                                               not args.no_minimize))
+    elapsed = time.perf_counter() - start
+
+    print_summary(results)
+    if failures:
+        print_failures(args.push_swap, failures, args.top)
+        with open(args.output, "w") as f:
+            json.dump(failures, f, ensure_ascii=False)
+        print(f"\nFallos guardados en {args.output}")
+    else:
+        print(f"\n{GREEN}✓ push_swap responde correctamente a todos los argv{NC}")
+    print(f"{len(vectors)} argv, {runs} ejecuciones en {elapsed:.2f} segundos (semilla {args.seed})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Historial de benchmarks en SQLite: tendencias por tamaño y regresiones frente a una ejecución base"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+from push_swap_cache import binary_hash
+from push_swap_stats import describe, holm, paired_test
+
+# Base de datos del historial (relativa al directorio desde el que se ejecuta el tester)
+HISTORY_DB = "push_swap_history.db"
+
+# Filas por transacción al guardar una ejecución
+BATCH_ROWS = 50_000
+
+# Nivel de significación de los tests y aumento relativo mínimo del tiempo
+# para marcarlo como regresión (con muchas muestras cualquier ruido es significativo)
+ALPHA = 0.05
+TIME_TOLERANCE = 0.05
+
+# Ejecuciones que se muestran por tamaño en la tendencia
+TREND_RUNS = 10
+
+# runs: una fila por ejecución del benchmark (binario, commit, origen de las entradas)
+# results: una fila por muestra; la clave (run_id, size, sample) hace que leer un
+#   tamaño de una ejecución y emparejar dos ejecuciones sean recorridos de índice.
+#   Las muestras que salieron de la caché no tienen tiempos ni RSS (NULL)
+# sizes: resumen por tamaño calculado al guardar, para que la tendencia no lea
+#   results; timed es el número de muestras medidas y los tiempos salen solo
+#   de ellas (NULL si no hay ninguna)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    binary_hash TEXT NOT NULL,
+    git_commit TEXT,
+    label TEXT,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_binary ON runs (binary_hash);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (git_commit);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sample INTEGER NOT NULL,
+    case_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    ops INTEGER NOT NULL,
+    wall REAL,
+    user REAL,
+    sys REAL,
+    max_rss_kb INTEGER,
+    PRIMARY KEY (run_id, size, sample)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sizes (
+    run_id INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    ops_mean REAL NOT NULL,
+    ops_p50 REAL NOT NULL,
+    ops_p90 REAL NOT NULL,
+    ops_max INTEGER NOT NULL,
+    timed INTEGER NOT NULL,
+    wall_mean REAL,
+    cpu_mean REAL,
+    rss_max INTEGER,
+    PRIMARY KEY (run_id, size)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sizes_size ON sizes (size, run_id);
+"""
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+BLUE = "\033[0;34m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def case_id(numbers):
+    """Identificador de 64 bits de una entrada (los 8 primeros bytes de su SHA-256)"""
+    digest = hashlib.sha256(" ".join(map(str, numbers)).encode()).digest()
+    return int.from_bytes(digest[:8], "little", signed=True)
+
+
+def git_commit(path):
+    """Commit de HEAD del repositorio que contiene path, con "-dirty" si hay
+    cambios sin guardar, o None si no está en un repositorio git"""
+    directory = os.path.dirname(os.path.realpath(path))
+    try:
+        head = subprocess.run(["git", "-C", directory, "rev-parse", "HEAD"],
+                              capture_output=True, text=True, timeout=10)
+        if head.returncode != 0:
+            return None
+        dirty = subprocess.run(["git", "-C", directory, "diff", "--quiet", "HEAD"],
+                               capture_output=True, timeout=10).returncode == 1
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return head.stdout.strip() + ("-dirty" if dirty else "")
+
+
+def connect(path=HISTORY_DB):
+    """Abre (o crea) el historial en modo WAL: los informes pueden leer mientras se escribe"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_run(conn, push_swap, results, source, label=None):
+    """Guarda una ejecución del benchmark (tamaño -> muestras de run_benchmark) y devuelve su id
+
+    Las muestras se insertan con executemany en transacciones de BATCH_ROWS
+    filas. Las que salieron de la caché (cached) se guardan sin tiempos ni
+    RSS: son medidas de otra ejecución. El resumen por tamaño se escribe
+    después de todas las muestras, y los informes solo ven las ejecuciones
+    que lo tienen, así que una ejecución interrumpida a medias no aparece.
+    """
+    with conn:
+        run_id = conn.execute("INSERT INTO runs (started, binary_hash, git_commit, label, source) "
+                              "VALUES (?, ?, ?, ?, ?)",
+                              (time.time(), binary_hash(push_swap), git_commit(push_swap), label, source)).lastrowid
+    rows = [(run_id, size, s["index"], s["case"], s["status"], s["ops"])
+            + ((None,) * 4 if s.get("cached") else (s["wall"], s["user"], s["sys"], s["max_rss_kb"]))
+            for size, samples in results.items() for s in samples]
+    for start in range(0, len(rows), BATCH_ROWS):
+        with conn:
+            conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             rows[start:start + BATCH_ROWS])
+    summary = []
+    for size, samples in results.items():
+        if not samples:
+            continue
+        ops = describe([s["ops"] for s in samples])
+        timed = [s for s in samples if not s.get("cached")]
+        summary.append((run_id, size, len(samples), sum(1 for s in samples if s["status"] != "OK"),
+                        ops["mean"], ops["p50"], ops["p90"], ops["max"], len(timed),
+                        sum(s["wall"] for s in timed) / len(timed) if timed else None,
+                        sum(s["user"] + s["sys"] for s in timed) / len(timed) if timed else None,
+                        max((s["max_rss_kb"] for s in timed), default=None)))
+    with conn:
+        conn.executemany("INSERT INTO sizes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", summary)
+    return run_id
+
+
+_RUN_COLUMNS = ("id", "started", "binary_hash", "git_commit", "label", "source")
+
+
+def list_runs(conn, limit=None):
+    """Ejecuciones completas, de la más reciente a la más antigua"""
+    query = (f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs "
+             "WHERE EXISTS (SELECT 1 FROM sizes WHERE run_id = runs.id) ORDER BY id DESC")
+    if limit:
+        query += f" LIMIT {int(limit)}"
+    return [dict(zip(_RUN_COLUMNS, row)) for row in conn.execute(query)]
+
+
+def get_run(conn, run_id):
+    row = conn.execute(f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs WHERE id = ?", (run_id,)).fetchone()
+    return dict(zip(_RUN_COLUMNS, row))
+
+
+def find_run(conn, ref, before=None):
+    """Última ejecución completa que coincide con ref, anterior a la ejecución before si se indica
+
+    ref puede ser un id, una etiqueta o un prefijo del commit o del hash del
+    binario, con esa prioridad: "12" es la ejecución #12 aunque algún hash
+    empiece por 12.
+    """
+    number = int(ref) if ref.isdigit() else -1
+    # Los comodines de LIKE en ref se buscan literalmente
+    prefix = ref.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    query = ("SELECT id FROM runs WHERE EXISTS (SELECT 1 FROM sizes WHERE run_id = runs.id) "
+             "AND (id = ? OR label = ? OR git_commit LIKE ? ESCAPE '\\' OR binary_hash LIKE ? ESCAPE '\\')")
+    params = [number, ref, prefix, prefix]
+    if before is not None:
+        query += " AND id < ?"
+        params.append(before)
+    query += " ORDER BY CASE WHEN id = ? THEN 0 WHEN label = ? THEN 1 ELSE 2 END, id DESC LIMIT 1"
+    row = conn.execute(query, params + [number, ref]).fetchone()
+    return row[0] if row else None
+
+
+def default_baseline(conn, run_id):
+    """Última ejecución completa anterior a run_id con otro binario"""
+    row = conn.execute("SELECT id FROM runs WHERE id < ? AND binary_hash != "
+                       "(SELECT binary_hash FROM runs WHERE id = ?) "
+                       "AND EXISTS (SELECT 1 FROM sizes WHERE run_id = runs.id) ORDER BY id DESC LIMIT 1",
+                       (run_id, run_id)).fetchone()
+    return row[0] if row else None
+
+
+def trend(conn, sizes=None, limit=TREND_RUNS):
+    """Tamaño -> resúmenes de sus últimas limit ejecuciones, de la más antigua a la más reciente"""
+    if not sizes:
+        sizes = [size for (size,) in conn.execute("SELECT DISTINCT size FROM sizes ORDER BY size")]
+    columns = ("run_id", "started", "binary_hash", "git_commit", "label", "samples", "failures",
+               "ops_mean", "ops_p50", "ops_p90", "ops_max", "timed", "wall_mean", "cpu_mean", "rss_max")
+    result = {}
+    for size in sizes:
+        rows = conn.execute(
+            "SELECT s.run_id, r.started, r.binary_hash, r.git_commit, r.label, s.samples, s.failures, "
+            "s.ops_mean, s.ops_p50, s.ops_p90, s.ops_max, s.timed, s.wall_mean, s.cpu_mean, s.rss_max "
+            "FROM sizes s JOIN runs r ON r.id = s.run_id WHERE s.size = ? ORDER BY s.run_id DESC LIMIT ?",
+            (size, limit)).fetchall()
+        result[size] = [dict(zip(columns, row)) for row in reversed(rows)]
+    return result
+
+
+def compare_runs(conn, baseline, run_id, alpha=ALPHA):
+    """Test t pareado de operaciones y tiempo por tamaño entre dos ejecuciones
+
+    Se emparejan las muestras con el mismo tamaño, índice y entrada (case_id),
+    así que solo hay pares si las dos usaron la misma semilla o el mismo
+    corpus. Las operaciones son una regresión si aumentan de forma
+    significativa; el tiempo, si además sube más de TIME_TOLERANCE. El test
+    del tiempo solo usa los pares medidos en las dos ejecuciones (sin caché).
+    Los valores p de cada familia (operaciones, tiempo) se corrigen con Holm
+    entre los tamaños comparados, y las regresiones se deciden con los
+    corregidos (p_adjusted).
+    """
+    comparison = {}
+    sizes = conn.execute("SELECT size, failures FROM sizes WHERE run_id = ? ORDER BY size", (run_id,)).fetchall()
+    for size, failures in sizes:
+        base = conn.execute("SELECT failures FROM sizes WHERE run_id = ? AND size = ?", (baseline, size)).fetchone()
+        if base is None:
+            continue
+        pairs = conn.execute(
+            "SELECT b.ops, n.ops, b.wall, n.wall FROM results n JOIN results b "
+            "ON b.run_id = ? AND b.size = n.size AND b.sample = n.sample AND b.case_id = n.case_id "
+            "WHERE n.run_id = ? AND n.size = ?", (baseline, run_id, size)).fetchall()
+        timed = [p for p in pairs if p[2] is not None and p[3] is not None]
+        comparison[size] = {
+            "pairs": len(pairs),
+            "timed_pairs": len(timed),
+            "ops": paired_test([p[0] for p in pairs], [p[1] for p in pairs]),
+            "wall": paired_test([p[2] for p in timed], [p[3] for p in timed]),
+            "base_wall": sum(p[2] for p in timed) / len(timed) if timed else 0.0,
+            "old_failures": base[0],
+            "new_failures": failures,
+        }
+    for family in ("ops", "wall"):
+        tests = [stats[family] for stats in comparison.values()]
+        for test, adjusted in zip(tests, holm([test["p"] for test in tests])):
+            test["p_adjusted"] = adjusted
+    for stats in comparison.values():
+        ops, wall = stats["ops"], stats["wall"]
+        stats["ops_regression"] = ops["p_adjusted"] < alpha and ops["mean"] > 0
+        stats["wall_regression"] = wall["p_adjusted"] < alpha and wall["mean"] > TIME_TOLERANCE * stats["base_wall"]
+        stats["regression"] = (stats["ops_regression"] or stats["wall_regression"]
+                               or stats["new_failures"] > stats["old_failures"])
+    return comparison
+
+
+def _describe_run(run):
+    commit = (run["git_commit"] or "-")[:12]
+    label = f" «{run['label']}»" if run["label"] else ""
+    when = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started"]))
+    return f"#{run['id']} {when} commit {commit} binario {run['binary_hash'][:8]} ({run['source']}){label}"
+
+
+def print_runs(runs):
+    """Tabla de ejecuciones"""
+    print(f"{YELLOW}{'id':>5} {'fecha':<16} {'commit':<14} {'binario':<8} {'origen':<24} Etiqueta{NC}")
+    for run in runs:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started"]))
+        print(f"{run['id']:>5} {when:<16} {(run['git_commit'] or '-')[:12]:<14} {run['binary_hash'][:8]:<8} "
+              f"{run['source']:<24} {run['label'] or ''}")
+
+
+def print_trend(history):
+    """Una tabla por tamaño con la diferencia de la media de operaciones respecto a la ejecución anterior"""
+    for size, rows in history.items():
+        print(f"\n{BLUE}{size} números{NC}")
+        print(f"{YELLOW}{'id':>5} {'fecha':<16} {'commit':<14} {'binario':<8} {'muestras':>8} {'media':>9} "
+              f"{'Δ media':>8} {'p90':>7} {'max':>6} {'t media':>9} {'RSS máx':>9} {'fallos':>6}{NC}")
+        previous = None
+        for row in rows:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["started"]))
+            delta = "" if previous is None else f"{row['ops_mean'] - previous:+.1f}"
+            failures = f"{RED}{row['failures']:>6}{NC}" if row["failures"] else f"{0:>6}"
+            if row["timed"]:
+                times = f"{row['wall_mean'] * 1000:>7.2f}ms {row['rss_max'] / 1024:>7.1f}MB"
+            else:
+                times = f"{'caché':>9} {'-':>9}"
+            print(f"{row['run_id']:>5} {when:<16} {(row['git_commit'] or '-')[:12]:<14} {row['binary_hash'][:8]:<8} "
+                  f"{row['samples']:>8} {row['ops_mean']:>9.1f} {delta:>8} {row['ops_p90']:>7.0f} "
+                  f"{row['ops_max']:>6} {times} {failures}")
+            previous = row["ops_mean"]
+
+
+def print_comparison(comparison, alpha=ALPHA):
+    """Diferencias pareadas (ejecución - base) por tamaño con su valor p corregido con Holm"""
+    print(f"{YELLOW}{'Tamaño':>6} {'pares':>6} | {'dif. ops (IC 95%)':>26} {'p Holm':>7} | "
+          f"{'dif. tiempo ms':>14} {'p Holm':>7} | Resultado{NC}")
+    for size, stats in comparison.items():
+        ops = stats["ops"]
+        wall = stats["wall"]
+        if not stats["pairs"]:
+            print(f"{size:>6} {0:>6} | {BLUE}sin entradas comunes (otra semilla o corpus){NC}")
+            continue
+        interval = f"{ops['mean']:+.1f} [{ops['ci_low']:+.1f}, {ops['ci_high']:+.1f}]"
+        problems = []
+        if stats["new_failures"] > stats["old_failures"]:
+            problems.append(f"{stats['new_failures']} muestras no ordenan (antes {stats['old_failures']})")
+        if stats["ops_regression"]:
+            problems.append("más operaciones")
+        if stats["wall_regression"]:
+            problems.append("más lento")
+        if problems:
+            verdict = f"{RED}✗ {', '.join(problems)}{NC}"
+        elif ops["p_adjusted"] < alpha and ops["mean"] < 0:
+            verdict = f"{GREEN}mejora{NC}"
+        else:
+            verdict = f"{BLUE}sin regresión{NC}"
+        if stats["timed_pairs"]:
+            times = f"{wall['mean'] * 1000:>+14.3f} {wall['p_adjusted']:>7.3f}"
+        else:
+            times = f"{'caché':>14} {'-':>7}"
+        print(f"{size:>6} {stats['pairs']:>6} | {interval:>26} {ops['p_adjusted']:>7.3f} | {times} | {verdict}")
+    if comparison:
+        print(f"\nValores p corregidos con Holm entre los {len(comparison)} tamaños (α = {alpha}), "
+              "por separado para operaciones y tiempo")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", default=HISTORY_DB, help=f"base de datos del historial ({HISTORY_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="listar las ejecuciones guardadas")
+    runs.add_argument("-n", "--limit", type=int, default=20, help="ejecuciones que se muestran (20)")
+
+    report = commands.add_parser("report", help="tendencia por tamaño y regresiones frente a una ejecución base")
+    report.add_argument("-s", "--sizes", type=int, nargs="+", default=None, help="tamaños (todos)")
+    report.add_argument("-n", "--limit", type=int, default=TREND_RUNS,
+                        help=f"ejecuciones por tamaño en la tendencia ({TREND_RUNS})")
+    report.add_argument("--run", default=None, help="ejecución que se evalúa (la última)")
+    report.add_argument("--baseline", default=None,
+                        help="ejecución base: id, etiqueta o prefijo del commit o del hash del binario "
+                             "(por defecto la última anterior con otro binario)")
+    report.add_argument("--alpha", type=float, default=ALPHA, help=f"nivel de significación ({ALPHA})")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.db):
+        print(f"{RED}Error: No existe el historial {args.db} (se crea con push_swap_bench.py){NC}")
+        return 1
+    conn = connect(args.db)
+
+    if args.command == "runs":
+        print_runs(list_runs(conn, args.limit))
+        return 0
+
+    latest = list_runs(conn, 1)
+    if not latest:
+        print(f"{YELLOW}El historial no tiene ejecuciones{NC}")
+        return 0
+    run_id = latest[0]["id"] if args.run is None else find_run(conn, args.run)
+    if run_id is None:
+        print(f"{RED}Error: ninguna ejecución coincide con {args.run}{NC}")
+        return 1
+    if args.baseline is None:
+        baseline = default_baseline(conn, run_id)
+    else:
+        baseline = find_run(conn, args.baseline, before=run_id)
+        if baseline is None:
+            print(f"{RED}Error: ninguna ejecución anterior a #{run_id} coincide con {args.baseline}{NC}")
+            return 1
+
+    print_trend(trend(conn, args.sizes, args.limit))
+    if baseline is None:
+        print(f"\n{BLUE}No hay una ejecución anterior con otro binario con la que comparar{NC}")
+        return 0
+
+    print(f"\nEjecución {_describe_run(get_run(conn, run_id))}")
+    print(f"Base      {_describe_run(get_run(conn, baseline))}\n")
+    comparison = compare_runs(conn, baseline, run_id, args.alpha)
+    print_comparison(comparison, args.alpha)
+    return 1 if any(stats["regression"] for stats in comparison.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Número mínimo de operaciones para cada permutación pequeña y comparación con push_swap"""
+import argparse
+import bisect
+import math
+import mmap
+import multiprocessing
+import os
+import sys
+import tempfile
+from collections import Counter, deque
+from itertools import permutations
+
+from push_swap_cache import CACHE_DIR
+from push_swap_checker import parse_numbers
+from push_swap_runner import OK, PUSH_SWAP, run_push_swap
+
+# Tamaños comparados por defecto y tamaño máximo admitido (7! * 8 estados en la BFS)
+SIZES = (3, 4, 5, 6)
+MAX_SIZE = 7
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def permutation_rank(perm):
+    """Rango lexicográfico (código de Lehmer) de una permutación de 1..n"""
+    n = len(perm)
+    rank = 0
+    for i, value in enumerate(perm):
+        smaller = sum(1 for later in perm[i + 1:] if later < value)
+        rank += smaller * math.factorial(n - 1 - i)
+    return rank
+
+
+def longest_increasing_subsequence(numbers):
+    """Longitud de la subsecuencia creciente más larga en O(n log n)"""
+    tails = []
+    for value in numbers:
+        i = bisect.bisect_left(tails, value)
+        if i == len(tails):
+            tails.append(value)
+        else:
+            tails[i] = value
+    return len(tails)
+
+
+def lower_bound(numbers):
+    """Cota inferior del número de operaciones para ordenar numbers, en O(n log n)
+
+    Sea L la subsecuencia creciente más larga de A (de la cima al fondo). Ninguna
+    operación aumenta L en más de 1: sa cambia el orden de dos elementos
+    contiguos, ra/rra mueven un solo elemento de un extremo al otro y pa
+    añade un elemento. Al final L = n, así que hacen falta al menos n - L
+    operaciones. Es exacta en casos como 2 1 3 pero muy holgada con entradas
+    grandes, donde solo sirve para comparar entradas entre sí.
+    """
+    return len(numbers) - longest_increasing_subsequence(numbers)
+
+
+def efficiency(numbers, ops):
+    """Cociente entre la cota inferior y las operaciones realizadas (1 = en la cota)"""
+    return lower_bound(numbers) / ops if ops else 1.0
+
+
+def _neighbors(a, b):
+    """Estados alcanzables con cada una de las 11 operaciones (las cimas son a[0] y b[0])"""
+    if len(a) >= 2:
+        yield a[1::-1] + a[2:], b                    # sa
+        yield a[1:] + a[:1], b                       # ra
+        yield a[-1:] + a[:-1], b                     # rra
+    if len(b) >= 2:
+        yield a, b[1::-1] + b[2:]                    # sb
+        yield a, b[1:] + b[:1]                       # rb
+        yield a, b[-1:] + b[:-1]                     # rrb
+    if len(a) >= 2 and len(b) >= 2:
+        yield a[1::-1] + a[2:], b[1::-1] + b[2:]     # ss
+        yield a[1:] + a[:1], b[1:] + b[:1]           # rr
+        yield a[-1:] + a[:-1], b[-1:] + b[:-1]       # rrr
+    if b:
+        yield b[:1] + a, b[1:]                       # pa
+    if a:
+        yield a[1:], a[:1] + b                       # pb
+
+
+def build_table(n):
+    """Distancia mínima al estado ordenado de cada permutación de 1..n (B vacía)
+
+    Todas las operaciones tienen inversa dentro del conjunto (pa/pb, ra/rra...),
+    así que una BFS desde el estado ordenado da la distancia de todos los
+    estados. Devuelve un bytearray indexado por permutation_rank.
+    """
+    goal = (tuple(range(1, n + 1)), ())
+    distance = {goal: 0}
+    queue = deque([goal])
+    table = bytearray(b"\xff" * math.factorial(n))
+    while queue:
+        state = queue.popleft()
+        d = distance[state]
+        if not state[1]:
+            table[permutation_rank(state[0])] = d
+        for neighbor in _neighbors(*state):
+            if neighbor not in distance:
+                distance[neighbor] = d + 1
+                queue.append(neighbor)
+    return table
+
+
+def table_path(n, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"optimal_{n}.bin")
+
+
+def load_table(n, cache_dir=CACHE_DIR):
+    """Tabla de n elementos mapeada en memoria; se construye y guarda la primera vez"""
+    if not 1 <= n <= MAX_SIZE:
+        raise ValueError(f"tamaño fuera de rango (1..{MAX_SIZE}): {n}")
+    path = table_path(n, cache_dir)
+    if not os.path.isfile(path) or os.path.getsize(path) != math.factorial(n):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Un nombre temporal por proceso: dos que construyan la tabla a la vez no se pisan
+        fd, tmp_path = tempfile.mkstemp(prefix=f"optimal_{n}.", suffix=".tmp", dir=cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(build_table(n))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def optimal_operations(numbers, table=None):
+    """Mínimo de operaciones para ordenar numbers (cualquier conjunto de enteros distintos)"""
+    ranks = {value: i + 1 for i, value in enumerate(sorted(numbers))}
+    perm = [ranks[value] for value in numbers]
+    table = table if table is not None else load_table(len(perm))
+    return table[permutation_rank(perm)]
+
+
+def _run(task):
+    push_swap, perm = task
+    result = run_push_swap(list(perm), push_swap)
+    return perm, result.ops, result.status
+
+
+def compare(push_swap, n, jobs=None):
+    """Ejecuta push_swap con todas las permutaciones de 1..n
+
+    Devuelve una lista de (permutación, operaciones de push_swap, óptimo, estado).
+    """
+    table = load_table(n)
+    tasks = [(push_swap, perm) for perm in permutations(range(1, n + 1))]
+    with multiprocessing.Pool(jobs or os.cpu_count() or 1) as pool:
+        results = pool.map(_run, tasks, chunksize=max(1, len(tasks) // 64))
+    return [(perm, ops, table[permutation_rank(perm)], status) for perm, ops, status in results]
+
+
+def print_report(n, results, list_all=False):
+    """Resumen de la distancia al óptimo para un tamaño
+
+    Con list_all se lista además el exceso de cada permutación que no es óptima.
+    """
+    failures = [r for r in results if r[3] != OK]
+    excess = [ops - best for _, ops, best, status in results if status == OK]
+    optimal = sum(1 for e in excess if e == 0)
+    print(f"{YELLOW}{n} números ({len(results)} permutaciones){NC}")
+    if excess:
+        worst = max((r for r in results if r[3] == OK), key=lambda r: r[1] - r[2])
+        print(f"  Óptimas: {optimal}/{len(excess)}  "
+              f"Exceso medio: {sum(excess) / len(excess):.2f}  Exceso máximo: {max(excess)}")
+        histogram = Counter(excess)
+        print("  Permutaciones por exceso: "
+              + "  ".join(f"+{e}: {histogram[e]}" for e in sorted(histogram)))
+        print(f"  Peor: {' '.join(map(str, worst[0]))} -> {worst[1]} operaciones (óptimo {worst[2]})")
+        if list_all:
+            for perm, ops, best, status in results:
+                if status == OK and ops > best:
+                    print(f"    {' '.join(map(str, perm))}: {ops} operaciones (óptimo {best}, +{ops - best})")
+    if failures:
+        perm, ops, _, status = failures[0]
+        print(f"  {RED}✗ {len(failures)} permutaciones fallan, por ejemplo: {' '.join(map(str, perm))} ({status}){NC}")
+    elif excess and optimal == len(excess):
+        print(f"  {GREEN}✓ Todas las permutaciones con el mínimo de operaciones{NC}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=list(SIZES),
+                        help=f"tamaños a comparar (hasta {MAX_SIZE})")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="procesos en paralelo (todos los núcleos)")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    parser.add_argument("--list", action="store_true", help="listar el exceso de cada permutación no óptima")
+    parser.add_argument("--best", nargs="+", metavar="NÚMERO",
+                        help=f"solo imprimir el mínimo de operaciones de estos números (hasta {MAX_SIZE})")
+    args = parser.parse_args()
+
+    if args.best:
+        try:
+            numbers = parse_numbers(args.best)
+            print(optimal_operations(numbers))
+        except ValueError as e:
+            print(f"{RED}Error: {e}{NC}")
+            return 1
+        return 0
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+    if any(not 1 <= n <= MAX_SIZE for n in args.sizes):
+        print(f"{RED}Error: los tamaños deben estar entre 1 y {MAX_SIZE}{NC}")
+        return 1
+
+    failed = False
+    for n in args.sizes:
+        results = compare(args.push_swap, n, args.jobs)
+        print_report(n, results, args.list)
+        failed = failed or any(status != OK for *_, status in results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Perfil por fases de la salida de push_swap: histogramas por ventana, tamaño de B y rotaciones por push"""
+import argparse
+import json
+import math
+import os
+import sys
+
+from push_swap_checker import OPERATIONS, OPCODES, parse_numbers
+from push_swap_runner import PUSH_SWAP, run_push_swap
+
+# Número de ventanas en que se divide la ejecución por defecto
+WINDOWS = 100
+
+# Un cambio de tendencia del tamaño de B cuenta como fase nueva si B
+# recupera al menos esta fracción de la entrada (filtra idas y vueltas sueltas)
+PHASE_THRESHOLD = 0.05
+
+# Operaciones de cada grupo (las rotaciones incluyen las inversas)
+ROTATIONS = {"ra", "rb", "rr", "rra", "rrb", "rrr"}
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def b_sizes(size, operations):
+    """Tamaño de B tras cada operación (pa con B vacía y pb con A vacía no hacen nada)"""
+    len_b = 0
+    sizes = []
+    for op in operations:
+        if op == "pb" and len_b < size:
+            len_b += 1
+        elif op == "pa" and len_b:
+            len_b -= 1
+        sizes.append(len_b)
+    return sizes
+
+
+def push_distances(operations):
+    """(índice, rotaciones desde el push anterior) de cada pa/pb
+
+    Las rotaciones que preceden a un push son lo que ha costado llevar el
+    elemento (o su destino) a la cima.
+    """
+    pushes = []
+    rotations = 0
+    for i, op in enumerate(operations):
+        if op in ROTATIONS:
+            rotations += 1
+        elif op in ("pa", "pb"):
+            pushes.append((i, rotations))
+            rotations = 0
+    return pushes
+
+
+def detect_phases(sizes, threshold):
+    """Divide la ejecución en fases según la tendencia del tamaño de B
+
+    Devuelve una lista de (nombre, inicio, fin) con fin exclusivo. Cada tramo
+    entre un mínimo y el máximo siguiente es "push-to-B" y cada tramo entre un
+    máximo y el mínimo siguiente es "sort-back"; un cambio de tendencia solo
+    cuenta si B varía al menos threshold elementos desde el extremo. Lo que
+    queda tras vaciar B por última vez es "final-rotate", y una ejecución que
+    no usa B es una sola fase "in-place".
+    """
+    phases = []
+    start = 0
+    trend = 0
+    extreme_index, extreme = -1, 0
+    for i, size in enumerate(sizes):
+        if (size > extreme) if trend >= 0 else (size < extreme):
+            extreme_index, extreme = i, size
+            trend = trend or 1
+        elif trend and abs(size - extreme) >= threshold:
+            phases.append(("push-to-B" if trend > 0 else "sort-back", start, extreme_index + 1))
+            start = extreme_index + 1
+            trend = -trend
+            extreme_index, extreme = i, size
+    if not trend:
+        return [("in-place", 0, len(sizes))] if sizes else []
+    end = extreme_index + 1
+    if trend > 0 or extreme:
+        # B no termina vacía: el último tramo llega hasta el final
+        end = len(sizes)
+    phases.append(("push-to-B" if trend > 0 else "sort-back", start, end))
+    if end < len(sizes):
+        phases.append(("final-rotate", end, len(sizes)))
+    return phases
+
+
+def profile(numbers, operations, windows=WINDOWS):
+    """Perfil de la ejecución, serializable como JSON
+
+    counts[w] es el número de cada operación (en el orden de OPERATIONS) en
+    la ventana w, b_size[w] y b_max[w] el tamaño de B al final de la ventana y
+    el máximo dentro de ella, pushes la lista de [índice, rotaciones previas]
+    y phases el resumen de cada fase de detect_phases().
+    """
+    total = len(operations)
+    window = max(1, math.ceil(total / windows))
+    sizes = b_sizes(len(numbers), operations)
+    pushes = push_distances(operations)
+
+    counts = []
+    for start in range(0, total, window):
+        histogram = [0] * len(OPERATIONS)
+        for op in operations[start:start + window]:
+            histogram[OPCODES[op]] += 1
+        counts.append(histogram)
+
+    phases = []
+    threshold = max(1, round(len(numbers) * PHASE_THRESHOLD))
+    for name, start, end in detect_phases(sizes, threshold):
+        histogram = {}
+        for op in operations[start:end]:
+            histogram[op] = histogram.get(op, 0) + 1
+        distances = [rotations for i, rotations in pushes if start <= i < end]
+        phases.append({
+            "name": name,
+            "start": start,
+            "end": end,
+            "ops": end - start,
+            "counts": histogram,
+            "pushes": len(distances),
+            "rotations": sum(histogram.get(op, 0) for op in ROTATIONS),
+            "rotations_per_push": sum(distances) / len(distances) if distances else 0.0,
+            "b_max": max(sizes[start:end], default=0),
+        })
+
+    return {
+        "size": len(numbers),
+        "total": total,
+        "operations": list(OPERATIONS),
+        "window": window,
+        "counts": counts,
+        "b_size": [sizes[min(start + window, total) - 1] for start in range(0, total, window)],
+        "b_max": [max(sizes[start:start + window]) for start in range(0, total, window)],
+        "pushes": [list(push) for push in pushes],
+        "phases": phases,
+    }
+
+
+def format_phases(report):
+    """Tabla con una fila por fase"""
+    lines = [f"{YELLOW}{'Fase':<14} {'Operaciones':>18} {'%':>6} {'pushes':>7} {'rot/push':>9} "
+             f"{'B máx.':>7}  Más frecuentes{NC}"]
+    for phase in report["phases"]:
+        share = phase["ops"] / report["total"] if report["total"] else 0.0
+        top = sorted(phase["counts"].items(), key=lambda item: item[1], reverse=True)[:3]
+        span = f"{phase['ops']} [{phase['start']}, {phase['end']})"
+        lines.append(f"{phase['name']:<14} {span:>18} {share:>6.1%} {phase['pushes']:>7} "
+                     f"{phase['rotations_per_push']:>9.2f} {phase['b_max']:>7}  "
+                     + " ".join(f"{op}={count}" for op, count in top))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("numbers", nargs="+", help="números de entrada (o uno solo entre comillas)")
+    parser.add_argument("-o", "--output", default=None, help="guardar el perfil completo en un fichero JSON")
+    parser.add_argument("-w", "--windows", type=int, default=WINDOWS, help=f"ventanas del histograma ({WINDOWS})")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    args = parser.parse_args()
+
+    try:
+        numbers = parse_numbers(args.numbers)
+    except ValueError as e:
+        print(f"{RED}Error: {e}{NC}")
+        return 1
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+
+    result = run_push_swap(numbers, args.push_swap, keep_operations=True)
+    operations = [op for op in result.operations if op in OPCODES]
+    print(f"push_swap: {result.ops} operaciones, {result.status}")
+    report = profile(numbers, operations, args.windows)
+    print(format_phases(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f)
+        print(f"{GREEN}Perfil guardado en {args.output}{NC}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,673 @@
+#!/usr/bin/env python3
+"""Ejecución de push_swap en streaming: valida cada operación según llega por el pipe"""
+import ctypes
+import errno
+import heapq
+import itertools
+import json
+import math
+import os
+import resource
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+import push_swap_cache
+from push_swap_checker import InvalidOperation, PushSwapSimulator
+
+# Ruta al programa push_swap
+PUSH_SWAP = "./push_swap"
+
+# Límites por defecto de una ejecución
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_OPS = 1_000_000
+
+# Fichero de resultados por defecto (una línea JSON por ejecución)
+RESULTS_FILE = "push_swap_results.jsonl"
+
+# Bytes de stderr que se conservan (el resto se descarta)
+STDERR_LIMIT = 4096
+
+# Bytes de la operación más larga con su salto de línea ("rrr\n")
+OPERATION_BYTES = 4
+
+# Límites de cada hijo: memoria (RLIMIT_AS) y bytes de salida. El de salida
+# es lo que ocupan DEFAULT_MAX_OPS operaciones válidas: una salida correcta
+# llega antes al máximo de operaciones y una con líneas más largas (basura)
+# al de salida, así que los dos límites se pueden alcanzar. El de CPU
+# (RLIMIT_CPU) es por defecto el plazo de la ejecución: respalda al watchdog
+# si el proceso del tester muere y deja al hijo girando
+MEMORY_LIMIT = 1024 * 1024 * 1024
+OUTPUT_LIMIT = DEFAULT_MAX_OPS * OPERATION_BYTES
+
+# Bytes que se guardan como mucho de una línea sin terminar: una operación
+# válida ocupa OPERATION_BYTES, así que una línea más larga ya es inválida
+LINE_LIMIT = 64
+
+# Mensajes de stderr de una reserva de memoria fallida (malloc devuelve NULL
+# bajo RLIMIT_AS: el proceso no recibe una señal propia, falla a su manera)
+OOM_MESSAGES = ("Cannot allocate memory", "out of memory", "bad_alloc")
+
+# Longitud máxima de un solo argumento en Linux (MAX_ARG_STRLEN, 32 páginas)
+MAX_ARG_STRLEN = 32 * 4096
+
+# Estados posibles de una ejecución
+OK = "OK"
+KO = "KO"
+ERROR = "Error"
+TIMEOUT = "timeout"
+MAX_OPS = "max_ops"
+OOM = "oom"
+OUTPUT_FLOOD = "output_flood"
+
+
+@dataclass
+class Limits:
+    """Límites de recursos de cada hijo (None desactiva el límite)
+
+    memory son bytes de espacio de direcciones (RLIMIT_AS; los binarios con
+    AddressSanitizer reservan mucho más y necesitan memory=None), output los
+    bytes de stdout y cpu los segundos de CPU (por defecto el plazo).
+    """
+    memory: int = MEMORY_LIMIT
+    output: int = OUTPUT_LIMIT
+    cpu: float = None
+
+
+DEFAULT_LIMITS = Limits()
+
+
+@dataclass
+class RunResult:
+    """Resultado de una ejecución de push_swap
+
+    invalid indica que el estado ERROR se debe a una línea que no es una
+    operación (y no a que push_swap terminara con error): operations tiene
+    entonces las operaciones anteriores a ella. Un resultado de la caché
+    (cached) no tiene medidas: wall, user_time, sys_time y max_rss_kb son None.
+    """
+    status: str
+    ops: int
+    returncode: int
+    wall: float
+    stderr: str = ""
+    operations: list = None
+    cached: bool = False
+    user_time: float = 0.0
+    sys_time: float = 0.0
+    max_rss_kb: int = 0
+    invalid: bool = False
+
+    def metrics(self):
+        """Medidas de la ejecución en un diccionario serializable"""
+        return {"status": self.status, "ops": self.ops, "returncode": self.returncode,
+                "wall": self.wall, "user": self.user_time, "sys": self.sys_time,
+                "max_rss_kb": self.max_rss_kb, "cached": self.cached}
+
+
+class _OperationLimit(Exception):
+    """Se superó el máximo de operaciones permitido"""
+
+
+class _OutputLimit(Exception):
+    """Se superó el máximo de bytes de salida"""
+
+
+class _Deadline:
+    """Plazo de una ejecución vigilada; proc es None si se canceló"""
+    __slots__ = ("when", "proc", "expired")
+
+    def __init__(self, when, proc):
+        self.when = when
+        self.proc = proc
+        self.expired = threading.Event()
+
+    def __lt__(self, other):
+        return self.when < other.when
+
+
+class Watchdog:
+    """Un solo hilo que mata a los hijos que superan su plazo
+
+    Sustituye a un threading.Timer por ejecución: con muchas ejecuciones a la
+    vez (los hilos del modo --serve del visualizador) hay un hilo por proceso
+    en lugar de uno por hijo. Los plazos están en un heap; los cancelados se
+    descartan al llegar a la cima.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._thread = None
+
+    def watch(self, proc, timeout):
+        """Vigila proc; el evento expired del resultado indica si se mató por tiempo"""
+        deadline = _Deadline(time.monotonic() + timeout, proc)
+        with self._condition:
+            heapq.heappush(self._deadlines, deadline)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="push_swap-watchdog", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return deadline
+
+    def cancel(self, deadline):
+        with self._condition:
+            deadline.proc = None
+
+    def _run(self):
+        with self._condition:
+            while True:
+                while self._deadlines and self._deadlines[0].proc is None:
+                    heapq.heappop(self._deadlines)
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+                delay = self._deadlines[0].when - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                deadline = heapq.heappop(self._deadlines)
+                deadline.expired.set()
+                _kill(deadline.proc)
+
+
+# Watchdog compartido por todas las ejecuciones del proceso
+watchdog = Watchdog()
+
+
+def _drain(stream, chunks):
+    """Lee stream hasta el final guardando como mucho STDERR_LIMIT bytes"""
+    kept = 0
+    for chunk in iter(lambda: stream.read(4096), b""):
+        if kept < STDERR_LIMIT:
+            chunks.append(chunk[:STDERR_LIMIT - kept])
+            kept += len(chunks[-1])
+
+
+def reap(pid, deadline=None):
+    """Recoge el hijo pid con wait4: (código de salida, user, sys, RSS máximo en KB)
+
+    El código de salida es negativo si el proceso terminó por una señal,
+    igual que Popen.returncode. Con deadline, el plazo del watchdog se
+    cancela cuando el hijo ya ha terminado pero antes de recogerlo: una vez
+    recogido, su pid y el de su grupo se pueden reutilizar y el watchdog
+    mataría a otro proceso.
+    """
+    if deadline is not None:
+        os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+        watchdog.cancel(deadline)
+    _, status, usage = os.wait4(pid, 0)
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    max_rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return os.waitstatus_to_exitcode(status), usage.ru_utime, usage.ru_stime, max_rss
+
+
+def wait_with_rusage(proc, pid=None, deadline=None):
+    """Espera al hijo con wait4 y devuelve (código de salida, user, sys, RSS máximo en KB)
+
+    pid es el del comando cuando proc es la compuerta de un Sandbox (ver
+    Sandbox.release); la compuerta, que ya terminó, se recoge también. El RSS
+    máximo nunca es menor que el del proceso del que el hijo copió la
+    memoria (execve conserva el máximo del mm anterior): el del tester si lo
+    lanza él directamente, algo más de 1 MB si lo lanza la compuerta. Sin
+    compuerta solo son significativos los valores por encima de ese suelo.
+    deadline, si se da, se cancela antes de recoger al hijo (ver reap).
+    """
+    if pid is None or pid == proc.pid:
+        result = reap(proc.pid, deadline)
+        proc.returncode = result[0]
+    else:
+        result = reap(pid, deadline)
+        proc.wait()
+    return result
+
+
+def _kill(proc):
+    """Mata el proceso y cualquier hijo suyo que mantenga el pipe abierto"""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def push_swap_command(push_swap, numbers, quoted=False):
+    """Línea de comandos de push_swap: un argumento por número o, con quoted,
+    todos en un único argumento ("3 1 2", como ./push_swap "$ARG")
+
+    En Linux cada argumento por separado está limitado a MAX_ARG_STRLEN
+    bytes, así que un único argumento no admite entradas grandes (unos 20000
+    números); en ese caso se lanza OSError(E2BIG) sin llegar a ejecutar nada.
+    """
+    args = [" ".join(map(str, numbers))] if quoted else [str(n) for n in numbers]
+    cmd = [push_swap] + args
+    longest = max(len(arg.encode()) + 1 for arg in cmd)
+    if sys.platform.startswith("linux") and longest > MAX_ARG_STRLEN:
+        raise OSError(errno.E2BIG, f"un argumento de {longest} bytes supera MAX_ARG_STRLEN ({MAX_ARG_STRLEN}); "
+                                   "pasa los números como argumentos separados")
+    return cmd
+
+
+def argument_bytes(cmd):
+    """Bytes que ocupan los argumentos y el entorno en la pila del proceso nuevo
+    (cada cadena con su NUL más un puntero en argv/envp)"""
+    size = sum(len(arg.encode()) + 1 + 8 for arg in cmd)
+    return size + sum(len(k.encode()) + len(v.encode()) + 2 + 8 for k, v in os.environ.items())
+
+
+def _set_limit(kind, value, raise_soft=False, pid=0):
+    """Baja el límite blando de pid (0 es el propio tester) a value, o lo sube
+    con raise_soft, sin pasar del duro"""
+    soft, hard = resource.prlimit(pid, kind) if pid else resource.getrlimit(kind)
+    if soft != resource.RLIM_INFINITY and (soft < value) != raise_soft:
+        value = soft
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    if pid:
+        resource.prlimit(pid, kind, (value, hard))
+    else:
+        resource.setrlimit(kind, (value, hard))
+
+
+def _executable(program):
+    """Ruta con la que execvp lanzaría program; si no se puede, el OSError de Popen"""
+    path = shutil.which(program, mode=os.F_OK)
+    if path is None:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), program)
+    if not os.access(path, os.X_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), program)
+    return program if os.sep in program else path
+
+
+# Serializa las subidas de RLIMIT_STACK del tester entre hilos
+_stack_lock = threading.Lock()
+
+
+def _reserve_arguments(cmd):
+    """Sube RLIMIT_STACK del tester si los argumentos de cmd no caben en ARG_MAX
+
+    Linux calcula ARG_MAX como un cuarto del límite de la pila en el momento
+    del execve, y el hijo lo hereda al crearse, así que hay que subirlo antes
+    de lanzarlo. Solo se sube (nunca se baja), para no quitárselo a otro hilo
+    que esté lanzando un proceso; al tester solo le da margen de pila.
+    """
+    size = argument_bytes(cmd)
+    if size <= os.sysconf("SC_ARG_MAX"):
+        return
+    with _stack_lock:
+        if resource.getrlimit(resource.RLIMIT_STACK)[0] != resource.RLIM_INFINITY:
+            _set_limit(resource.RLIMIT_STACK, 4 * size + (1 << 20), raise_soft=True)
+
+
+# Compuerta del hijo: con los límites ya puestos (primera línea por stdin)
+# lanza el comando en segundo plano, escribe su pid y termina. El comando
+# espera una segunda línea antes del execve, que solo llega cuando ya es
+# hijo del tester (ver Sandbox)
+GATE = ("/bin/sh", "-c",
+        'read -r _ || exit 1; exec 3<&0; { read -r _ <&3 && exec "$@" 3<&- </dev/null; } & echo $! >&3',
+        "push_swap-gate")
+
+# prctl que convierte a un proceso en el padre de los huérfanos de sus hijos
+PR_SET_CHILD_SUBREAPER = 36
+_subreaper_pid = None
+
+
+def _become_subreaper():
+    """Hace del tester el padre de los huérfanos de sus hijos (una vez por proceso,
+    porque el ajuste no se hereda en un fork como los de multiprocessing)"""
+    global _subreaper_pid
+    if _subreaper_pid == os.getpid():
+        return
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.prctl(PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0) != 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+    _subreaper_pid = os.getpid()
+
+
+class Sandbox:
+    """Lanza un comando con los límites de memoria y CPU de limits
+
+    Los límites se aplican desde fuera con prlimit en vez de con un
+    preexec_fn, que no es seguro con los hilos del watchdog, del lector de
+    stderr o del servidor en marcha. Se lanza GATE en lugar del comando y
+    release() le pone los límites antes de dejarle lanzarlo:
+
+        with Sandbox(cmd, timeout, limits) as box:
+            proc = subprocess.Popen(box.cmd, stdin=box.stdin, ...)
+            pid = box.release(proc.pid)
+        ...
+        returncode, user_time, sys_time, max_rss_kb = wait_with_rusage(proc, pid)
+
+    El comando no es proc sino un proceso que la compuerta crea con fork y
+    que el tester hereda al terminar ella: wait4 mide solo el comando, sin
+    la CPU del arranque de la compuerta y con su suelo de RSS (algo más de
+    1 MB) en vez del del tester. Comparte stdout, stderr y grupo de procesos
+    con proc, recibe /dev/null como stdin (push_swap no lo lee) e ignora
+    SIGINT y SIGQUIT, como todo proceso en segundo plano de sh (en su propia
+    sesión la terminal no se los envía). Sin resource.prlimit (fuera de
+    Linux) el comando es el propio proc y no tiene límites.
+    """
+
+    def __init__(self, cmd, timeout, limits):
+        _reserve_arguments(cmd)
+        self.limits = limits
+        self.cpu = limits.cpu if limits.cpu is not None else timeout
+        self.cmd = list(cmd)
+        self.stdin = subprocess.DEVNULL
+        self._socket = self._gate = None
+        if hasattr(resource, "prlimit"):
+            # Los errores de un comando que no existe se lanzan aquí, como
+            # los daría Popen, en vez de salir 127 desde la compuerta
+            self.cmd[0] = _executable(cmd[0])
+            _become_subreaper()
+            self._socket, self._gate = socket.socketpair()
+            self.cmd = list(GATE) + self.cmd
+            self.stdin = self._gate.fileno()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def release(self, pid):
+        """Aplica los límites a la compuerta pid, le deja lanzar el comando y devuelve el pid de este"""
+        if self._socket is None:
+            return pid
+        self._gate.close()
+        self._gate = None
+        if self.limits.memory is not None:
+            _set_limit(resource.RLIMIT_AS, self.limits.memory, pid=pid)
+        if self.cpu is not None:
+            # Al agotarlo el kernel envía SIGXCPU, que por defecto termina el proceso
+            _set_limit(resource.RLIMIT_CPU, max(1, math.ceil(self.cpu)), pid=pid)
+        self._socket.sendall(b"\n")
+        line = b""
+        while not line.endswith(b"\n"):
+            chunk = self._socket.recv(64)
+            if not chunk:
+                raise OSError(errno.ECHILD, "la compuerta terminó sin lanzar el comando")
+            line += chunk
+        # Hasta que la compuerta termina, el comando es hijo suyo (y ella podría recogerlo)
+        try:
+            os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+        except ChildProcessError:
+            # Ya la recogió otro, p. ej. el watcher de asyncio
+            pass
+        self._socket.sendall(b"\n")
+        self.close()
+        return int(line)
+
+    def close(self):
+        """Cierra la compuerta; un hijo que siga esperando termina sin ejecutar nada"""
+        for end in (self._socket, self._gate):
+            if end is not None:
+                end.close()
+        self._socket = self._gate = None
+
+
+def _failure_kind(returncode, stderr, limits):
+    """TIMEOUT, OOM o None según cómo terminó un hijo que falló
+
+    Solo cuentan señales reales (a quien llama le corresponden los hijos que
+    mató el propio runner). Un hijo muerto por SIGXCPU superó RLIMIT_CPU y
+    uno muerto por SIGKILL lo mató el OOM killer del kernel. Bajo RLIMIT_AS
+    malloc devuelve NULL y cada programa falla a su manera: es OOM si stderr
+    lo dice o si el hijo muere por SIGSEGV (un puntero NULL sin comprobar).
+
+    Un SIGSEGV por un fallo propio de push_swap también cuenta como OOM con
+    el límite puesto, y una reserva fallida que termina con "Error" y salida
+    1 queda como ERROR, igual que una entrada inválida; para distinguirlos
+    hay que repetir con Limits(memory=None).
+    """
+    if returncode == -signal.SIGXCPU:
+        return TIMEOUT
+    if returncode == -signal.SIGKILL:
+        return OOM
+    if limits.memory is not None and (returncode == -signal.SIGSEGV
+                                      or any(message in stderr for message in OOM_MESSAGES)):
+        return OOM
+    return None
+
+
+def _lines(stream):
+    """Líneas de stream sin el salto de línea, leyendo por bloques
+
+    A diferencia de iterar el fichero, una línea sin terminar nunca ocupa
+    más de LINE_LIMIT bytes más un bloque: se corta y se entrega tal cual.
+    """
+    pending = b""
+    for chunk in iter(lambda: stream.read1(65536), b""):
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+        if len(pending) > LINE_LIMIT:
+            yield pending
+            return
+    if pending:
+        yield pending
+
+
+def _from_cache(key, max_ops, keep_operations, echo, on_operation):
+    """RunResult de una entrada de la caché, o None si no sirve para estos límites
+
+    La caché solo guarda las operaciones y el estado: los tiempos y el RSS
+    de la ejecución original no valen como medidas de esta.
+    """
+    entry = push_swap_cache.load(key)
+    if entry is None:
+        return None
+    meta, operations = entry
+    if meta["ops"] > max_ops:
+        return None
+    if echo:
+        for op in operations:
+            print(op)
+    if on_operation:
+        for op in operations:
+            on_operation(op)
+    return RunResult(status=meta["status"], ops=meta["ops"], returncode=meta["returncode"],
+                     wall=None, stderr=meta["stderr"],
+                     operations=operations if keep_operations else None, cached=True,
+                     user_time=None, sys_time=None, max_rss_kb=None,
+                     invalid=meta.get("invalid", False))
+
+
+def run_push_swap(numbers, push_swap=PUSH_SWAP, timeout=DEFAULT_TIMEOUT, max_ops=DEFAULT_MAX_OPS,
+                  keep_operations=False, echo=False, use_cache=True, on_operation=None, quoted=False,
+                  limits=DEFAULT_LIMITS):
+    """Ejecuta push_swap y simula sus operaciones mientras se producen
+
+    El proceso se mata si supera timeout segundos (lo vigila el watchdog),
+    max_ops operaciones o limits.output bytes de salida, y se ejecuta con los
+    límites de CPU y memoria de limits; cada caso tiene su estado (TIMEOUT,
+    MAX_OPS, OUTPUT_FLOOD, OOM). La
+    lista de operaciones solo se guarda con keep_operations (si hay una
+    operación inválida se conservan las anteriores a ella) y cada línea se
+    muestra por pantalla con echo. on_operation se llama con cada operación
+    (sin validar) según llega, p. ej. para enviarla a un navegador. Con
+    quoted los números se pasan en un único argumento (push_swap_command).
+
+    Con use_cache el resultado se busca primero en push_swap_cache y las
+    ejecuciones completas se guardan allí, con los límites y el plazo en la
+    clave (un Error por falta de memoria no vale para Limits(memory=None)).
+    """
+    key = None
+    if use_cache:
+        key = push_swap_cache.cache_key(push_swap, numbers, quoted, [limits.memory, limits.cpu, timeout])
+        result = _from_cache(key, max_ops, keep_operations, echo, on_operation)
+        if result is not None:
+            return result
+        # Para guardar la entrada hace falta la lista de operaciones
+        keep = keep_operations
+        keep_operations = True
+
+    cmd = push_swap_command(push_swap, numbers, quoted)
+    with Sandbox(cmd, timeout, limits) as box:
+        proc = subprocess.Popen(box.cmd, stdin=box.stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                start_new_session=True)
+        pid = box.release(proc.pid)
+        start = time.perf_counter()
+    deadline = watchdog.watch(proc, timeout)
+
+    stderr_chunks = []
+    stderr_thread = threading.Thread(target=_drain, args=(proc.stderr, stderr_chunks), daemon=True)
+    stderr_thread.start()
+
+    operations = [] if keep_operations else None
+
+    def watch(lines):
+        count = 0
+        received = 0
+        for line in lines:
+            count += 1
+            received += len(line) + 1
+            if count > max_ops:
+                raise _OperationLimit()
+            if limits.output is not None and received > limits.output:
+                raise _OutputLimit()
+            if echo:
+                print(line.decode(errors="replace"))
+            if keep_operations or on_operation:
+                op = line.decode(errors="replace")
+                if keep_operations:
+                    operations.append(op)
+                if on_operation:
+                    on_operation(op)
+            yield line
+
+    simulator = PushSwapSimulator(numbers)
+    status = None
+    invalid = False
+    try:
+        simulator.run(watch(_lines(proc.stdout)))
+    except InvalidOperation:
+        status = ERROR
+        invalid = True
+        _kill(proc)
+    except _OperationLimit:
+        status = MAX_OPS
+        _kill(proc)
+    except _OutputLimit:
+        status = OUTPUT_FLOOD
+        _kill(proc)
+    finally:
+        proc.stdout.close()
+        returncode, user_time, sys_time, max_rss_kb = wait_with_rusage(proc, pid, deadline)
+        stderr_thread.join()
+        proc.stderr.close()
+    wall = time.perf_counter() - start
+    stderr = b"".join(stderr_chunks).decode(errors="replace")
+
+    if deadline.expired.is_set() and returncode == -signal.SIGKILL:
+        status = TIMEOUT
+    elif status is None:
+        if returncode != 0:
+            status = _failure_kind(returncode, stderr, limits) or ERROR
+        else:
+            status = OK if simulator.is_sorted() else KO
+
+    if operations is not None:
+        del operations[simulator.count:]
+
+    result = RunResult(status=status, ops=simulator.count, returncode=returncode, wall=wall,
+                       stderr=stderr, operations=operations,
+                       user_time=user_time, sys_time=sys_time, max_rss_kb=max_rss_kb,
+                       invalid=invalid)
+
+    # Solo se guardan los resultados deterministas (no los cortados por un límite)
+    if key is not None:
+        if status in (OK, KO, ERROR):
+            meta = {"status": status, "ops": result.ops, "returncode": returncode,
+                    "stderr": result.stderr, "invalid": result.invalid}
+            push_swap_cache.store(key, meta, operations)
+        if not keep:
+            result.operations = None
+    return result
+
+
+def append_result(path, record):
+    """Añade un registro al fichero de resultados (una línea JSON por ejecución)"""
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def run_command(cmd, timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS):
+    """Ejecuta cmd pasando su stdout/stderr tal cual y devuelve sus medidas
+
+    Es la versión sin simulación de run_push_swap, para el tester en bash
+    (los argumentos pueden ser inválidos a propósito), con los mismos límites.
+    """
+    out = sys.stdout.buffer
+    with Sandbox(cmd, timeout, limits) as box:
+        proc = subprocess.Popen(box.cmd, stdin=box.stdin, stdout=subprocess.PIPE, start_new_session=True)
+        pid = box.release(proc.pid)
+        start = time.perf_counter()
+    deadline = watchdog.watch(proc, timeout)
+    lines = 0
+    received = 0
+    flooded = False
+    try:
+        for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+            received += len(chunk)
+            if limits.output is not None and received > limits.output:
+                flooded = True
+                _kill(proc)
+                break
+            lines += chunk.count(b"\n")
+            out.write(chunk)
+    finally:
+        proc.stdout.close()
+        returncode, user_time, sys_time, max_rss_kb = wait_with_rusage(proc, pid, deadline)
+        out.flush()
+    if deadline.expired.is_set() and returncode == -signal.SIGKILL:
+        status = TIMEOUT
+    elif flooded:
+        status = OUTPUT_FLOOD
+    elif returncode == 0:
+        status = "exit"
+    else:
+        status = _failure_kind(returncode, "", limits) or ERROR
+    return {"status": status,
+            "ops": lines, "returncode": returncode, "wall": time.perf_counter() - start,
+            "user": user_time, "sys": sys_time, "max_rss_kb": max_rss_kb}
+
+
+def main():
+    """push_swap_runner.py [--results FICHERO] [--label ETIQUETA] -- push_swap args...
+
+    Ejecuta el comando con su salida intacta y añade sus medidas (tiempo real,
+    CPU user/sys, RSS máximo) al fichero de resultados.
+    """
+    args = sys.argv[1:]
+    if "--" not in args:
+        print(main.__doc__, file=sys.stderr)
+        return 2
+    separator = args.index("--")
+    options, cmd = args[:separator], args[separator + 1:]
+    results = None
+    label = ""
+    while options:
+        option = options.pop(0)
+        if option == "--results" and options:
+            results = options.pop(0)
+        elif option == "--label" and options:
+            label = options.pop(0)
+        else:
+            print(f"Opción desconocida: {option}", file=sys.stderr)
+            return 2
+
+    record = run_command(cmd)
+    if results:
+        append_result(results, dict(label=label, argc=len(cmd) - 1, **record))
+    return record["returncode"] if record["returncode"] >= 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Búsqueda de entradas en el peor caso: hill climbing en paralelo maximizando operaciones"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from push_swap_cache import binary_hash
+from push_swap_runner import OK, PUSH_SWAP, run_push_swap
+
+# Directorio con el corpus de las peores entradas encontradas (un fichero por tamaño)
+CORPUS_DIR = ".push_swap_worst"
+
+# Entradas que se conservan por tamaño
+CORPUS_SIZE = 10
+
+# Límites de la corrección (máxima nota, mínimo para aprobar) por tamaño
+GRADING_LIMITS = {100: (700, 1500), 500: (5500, 11500)}
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def mutate(numbers, rng):
+    """Devuelve una copia con una mutación: intercambio, inversión o rotación de un bloque"""
+    mutant = list(numbers)
+    n = len(mutant)
+    if n < 2:
+        return mutant
+    i, j = sorted(rng.sample(range(n), 2))
+    kind = rng.randrange(3)
+    if kind == 0:
+        mutant[i], mutant[j] = mutant[j], mutant[i]
+    elif kind == 1:
+        mutant[i:j + 1] = mutant[i:j + 1][::-1]
+    else:
+        k = rng.randrange(1, j - i + 1)
+        mutant[i:j + 1] = mutant[i + k:j + 1] + mutant[i:i + k]
+    return mutant
+
+
+def evaluate(task):
+    """Número de operaciones de push_swap para una entrada (se ejecuta en un worker)"""
+    push_swap, numbers = task
+    # Cada mutante es una entrada nueva: la caché solo se llenaría de basura
+    result = run_push_swap(numbers, push_swap, use_cache=False)
+    return result.ops, result.status
+
+
+def corpus_path(size, corpus_dir=CORPUS_DIR):
+    return os.path.join(corpus_dir, f"worst_{size}.json")
+
+
+def load_corpus(size, corpus_dir=CORPUS_DIR):
+    """Entradas guardadas para un tamaño (lista de dicts con numbers, ops y binary)"""
+    try:
+        with open(corpus_path(size, corpus_dir)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_corpus(size, entries, corpus_dir=CORPUS_DIR):
+    """Guarda las CORPUS_SIZE peores entradas sin repetir"""
+    unique = {}
+    for entry in sorted(entries, key=lambda e: e["ops"], reverse=True):
+        unique.setdefault(tuple(entry["numbers"]), entry)
+    os.makedirs(corpus_dir, exist_ok=True)
+    tmp_path = corpus_path(size, corpus_dir) + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(list(unique.values())[:CORPUS_SIZE], f)
+    os.replace(tmp_path, corpus_path(size, corpus_dir))
+
+
+def search(push_swap, size, rounds, population, mutants, seed=0, jobs=None, corpus_dir=CORPUS_DIR):
+    """Hill climbing con population escaladores y mutants mutaciones cada uno por ronda
+
+    Los escaladores parten de las entradas del corpus (reevaluadas con el binario
+    actual) y de permutaciones aleatorias. Devuelve (corpus actualizado, fallos)
+    donde fallos son las entradas con las que push_swap no ordenó; esas nunca
+    entran en el corpus, tampoco las de partida.
+    """
+    rng = random.Random(seed)
+    digest = binary_hash(push_swap)
+    corpus = load_corpus(size, corpus_dir)
+
+    starts = [entry["numbers"] for entry in corpus if len(entry["numbers"]) == size][:population]
+    while len(starts) < population:
+        numbers = list(range(1, size + 1))
+        rng.shuffle(numbers)
+        starts.append(numbers)
+
+    failures = []
+    with multiprocessing.Pool(jobs or os.cpu_count() or 1) as pool:
+        scores = pool.map(evaluate, [(push_swap, numbers) for numbers in starts])
+        climbers = []
+        for numbers, (ops, status) in zip(starts, scores):
+            if status != OK:
+                failures.append({"numbers": numbers, "ops": ops, "status": status})
+                # Fuera del corpus; cualquier mutante que sí se ordene lo sustituye
+                ops = -1
+            climbers.append([numbers, ops])
+        corpus = [{"numbers": numbers, "ops": ops, "binary": digest} for numbers, ops in climbers if ops >= 0]
+
+        for round_index in range(rounds):
+            candidates = [(k, mutate(climbers[k][0], rng)) for k in range(population) for _ in range(mutants)]
+            scores = pool.map(evaluate, [(push_swap, numbers) for _, numbers in candidates])
+            for (k, numbers), (ops, status) in zip(candidates, scores):
+                if status != OK:
+                    failures.append({"numbers": numbers, "ops": ops, "status": status})
+                    continue
+                # Se aceptan también los empates para poder cruzar mesetas
+                if ops >= climbers[k][1]:
+                    climbers[k] = [numbers, ops]
+            corpus.extend({"numbers": numbers, "ops": ops, "binary": digest}
+                          for numbers, ops in climbers if ops >= 0)
+            save_corpus(size, corpus, corpus_dir)
+            corpus = load_corpus(size, corpus_dir)
+            worst = f"{corpus[0]['ops']} operaciones" if corpus else "ninguna entrada ordenada"
+            print(f"Ronda {round_index + 1}/{rounds}: peor caso {worst}", flush=True)
+
+    save_corpus(size, corpus, corpus_dir)
+    return load_corpus(size, corpus_dir), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("size", type=int, help="cantidad de números de cada entrada")
+    parser.add_argument("-r", "--rounds", type=int, default=50, help="rondas de mutación (50)")
+    parser.add_argument("-p", "--population", type=int, default=None, help="escaladores en paralelo (núcleos)")
+    parser.add_argument("-m", "--mutants", type=int, default=4, help="mutaciones por escalador y ronda (4)")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de las mutaciones")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="procesos en paralelo (todos los núcleos)")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    parser.add_argument("--visualize", action="store_true", help="abrir la peor entrada en el visualizador")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+
+    population = args.population or os.cpu_count() or 1
+    start = time.perf_counter()
+    corpus, failures = search(args.push_swap, args.size, args.rounds, population, args.mutants,
+                              args.seed, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    if not corpus:
+        print(f"{RED}✗ push_swap no ordenó ninguna entrada de {args.size} números, "
+              f"por ejemplo: {' '.join(map(str, failures[0]['numbers']))} ({failures[0]['status']}){NC}")
+        return 1
+    worst = corpus[0]
+    print(f"\nPeor caso para {args.size} números: {worst['ops']} operaciones ({elapsed:.1f} segundos)")
+    print(f"Corpus guardado en {corpus_path(args.size)}")
+    limits = GRADING_LIMITS.get(args.size)
+    if limits:
+        best, minimum = limits
+        if worst["ops"] < best:
+            print(f"{GREEN}✓ Por debajo de {best} operaciones incluso en el peor caso encontrado{NC}")
+        elif worst["ops"] <= minimum:
+            print(f"{YELLOW}⚠ El peor caso supera {best} operaciones{NC}")
+        else:
+            print(f"{RED}✗ El peor caso supera el límite de {minimum} operaciones{NC}")
+    if failures:
+        print(f"{RED}✗ {len(failures)} entradas no se ordenaron, por ejemplo: {' '.join(map(str, failures[0]['numbers']))}{NC}")
+
+    if args.visualize:
+        import push_swap_visualizer
+        push_swap_visualizer.PUSH_SWAP = args.push_swap
+        operations = push_swap_visualizer.run_push_swap(worst["numbers"])
+        push_swap_visualizer.open_in_browser(push_swap_visualizer.generate_html(worst["numbers"], operations))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
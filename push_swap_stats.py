@@ -0,0 +1,147 @@
+"""Funciones estadísticas compartidas por los benchmarks (sin dependencias externas)"""
+import math
+
+
+def percentile(sorted_values, p):
+    """Percentil p (0-100) con interpolación lineal sobre una lista ya ordenada"""
+    if not sorted_values:
+        return float("nan")
+    k = (len(sorted_values) - 1) * p / 100
+    lo = math.floor(k)
+    hi = math.ceil(k)
+    if lo == hi:
+        return sorted_values[lo]
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def mean(values):
+    """Media aritmética"""
+    return sum(values) / len(values) if values else float("nan")
+
+
+def describe(values):
+    """Resumen de una muestra: min, media, p50, p90, p99 y max"""
+    ordered = sorted(values)
+    return {
+        "n": len(ordered),
+        "min": ordered[0] if ordered else float("nan"),
+        "mean": mean(ordered),
+        "p50": percentile(ordered, 50),
+        "p90": percentile(ordered, 90),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1] if ordered else float("nan"),
+    }
+
+
+def linear_regression(xs, ys):
+    """Recta de mínimos cuadrados y = a * x + b; devuelve (a, b, R²)"""
+    n = len(xs)
+    mx, my = mean(xs), mean(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    syy = sum((y - my) ** 2 for y in ys)
+    if n < 2 or sxx == 0:
+        return float("nan"), my, float("nan")
+    slope = sxy / sxx
+    r2 = 1.0 if syy == 0 else sxy * sxy / (sxx * syy)
+    return slope, my - slope * mx, r2
+
+
+def stdev(values):
+    """Desviación típica muestral (n - 1)"""
+    if len(values) < 2:
+        return float("nan")
+    m = mean(values)
+    return math.sqrt(sum((v - m) ** 2 for v in values) / (len(values) - 1))
+
+
+def _beta_fraction(a, b, x):
+    """Fracción continua de la beta incompleta (método de Lentz)"""
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1.0) < 1e-15:
+            break
+    return result
+
+
+def incomplete_beta(a, b, x):
+    """Función beta incompleta regularizada I_x(a, b)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log1p(-x))
+    # La fracción converge rápido solo para x < (a + 1) / (a + b + 2); si no, se usa la simetría
+    if x < (a + 1) / (a + b + 2):
+        return front * _beta_fraction(a, b, x) / a
+    return 1.0 - front * _beta_fraction(b, a, 1 - x) / b
+
+
+def t_cdf(t, df):
+    """Función de distribución de la t de Student con df grados de libertad"""
+    tail = 0.5 * incomplete_beta(df / 2, 0.5, df / (df + t * t))
+    return 1.0 - tail if t > 0 else tail
+
+
+def t_ppf(p, df):
+    """Cuantil p de la t de Student (bisección sobre t_cdf)"""
+    lo, hi = -1e3, 1e3
+    for _ in range(200):
+        mid = (lo + hi) / 2
+        if t_cdf(mid, df) < p:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def paired_test(before, after, confidence=0.95):
+    """Test t pareado de after - before
+
+    Devuelve la media de las diferencias, su intervalo de confianza y el
+    valor p bilateral. Si todas las diferencias son iguales el valor p es 1
+    cuando son 0 y 0 en otro caso.
+    """
+    differences = [b - a for a, b in zip(before, after)]
+    n = len(differences)
+    m = mean(differences)
+    if n < 2:
+        return {"n": n, "mean": m, "ci_low": float("nan"), "ci_high": float("nan"),
+                "t": float("nan"), "p": float("nan")}
+    error = stdev(differences) / math.sqrt(n)
+    if error == 0:
+        return {"n": n, "mean": m, "ci_low": m, "ci_high": m,
+                "t": 0.0 if m == 0 else math.copysign(math.inf, m), "p": 1.0 if m == 0 else 0.0}
+    t = m / error
+    margin = t_ppf(0.5 + confidence / 2, n - 1) * error
+    return {"n": n, "mean": m, "ci_low": m - margin, "ci_high": m + margin,
+            "t": t, "p": 2 * (1 - t_cdf(abs(t), n - 1))}
+
+
+def holm(p_values):
+    """Valores p ajustados con el método de Holm (el orden de la lista se conserva)
+
+    Controla la probabilidad de al menos un falso positivo en la familia de
+    tests: el k-ésimo menor valor p se multiplica por (m - k + 1) y se impone
+    que los ajustados no decrezcan. Los nan (tests sin datos) quedan igual y
+    no cuentan en m.
+    """
+    ranked = sorted((p, i) for i, p in enumerate(p_values) if not math.isnan(p))
+    adjusted = list(p_values)
+    running = 0.0
+    for k, (p, i) in enumerate(ranked):
+        running = max(running, min(1.0, (len(ranked) - k) * p))
+        adjusted[i] = running
+    return adjusted
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Barrido de tamaños grandes: ajuste de operaciones y tiempo frente a n, n log n y n²"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+from push_swap_bench import make_input
+from push_swap_runner import ERROR, OK, OPERATION_BYTES, PUSH_SWAP, Limits, run_push_swap
+from push_swap_stats import linear_regression, mean
+
+# Tamaños extremos del barrido y número de pasos geométricos entre ellos
+MIN_SIZE = 1000
+MAX_SIZE = 50000
+STEPS = 6
+
+# Límites de cada ejecución (los del runner se quedan cortos con 50000 números)
+SWEEP_TIMEOUT = 120.0
+SWEEP_MAX_OPS = 50_000_000
+SWEEP_LIMITS = Limits(output=SWEEP_MAX_OPS * OPERATION_BYTES)
+
+# Modelos de crecimiento que se ajustan: nombre -> f(n)
+MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n²": lambda n: n * n,
+}
+
+# Exponente del tiempo a partir del cual se marca como superlineal: n log n
+# entre 1000 y 50000 crece como n^1.1 aproximadamente
+SUPERLINEAR_EXPONENT = 1.3
+
+# Colores para la terminal
+GREEN = "\033[0;32m"
+RED = "\033[0;31m"
+YELLOW = "\033[0;33m"
+NC = "\033[0m"
+
+
+def geometric_sizes(low=MIN_SIZE, high=MAX_SIZE, steps=STEPS):
+    """steps tamaños de low a high con razón constante"""
+    if steps < 2:
+        return [low]
+    ratio = (high / low) ** (1 / (steps - 1))
+    return sorted({round(low * ratio ** k) for k in range(steps)})
+
+
+def sweep_sample(task):
+    """Una muestra de un tamaño (se ejecuta en un worker)"""
+    push_swap, size, seed, index, use_cache, quoted = task
+    numbers = make_input(size, seed, index)
+    try:
+        result = run_push_swap(numbers, push_swap, timeout=SWEEP_TIMEOUT, max_ops=SWEEP_MAX_OPS,
+                               use_cache=use_cache, quoted=quoted, limits=SWEEP_LIMITS)
+    except OSError as e:
+        return dict(size=size, index=index, status=f"{ERROR}: {e}", ops=0, wall=0.0, user=0.0,
+                    sys=0.0, max_rss_kb=0, cached=False)
+    return dict(size=size, index=index, **result.metrics())
+
+
+def run_sweep(push_swap, sizes, samples, seed=0, jobs=None, use_cache=False, quoted=False):
+    """Ejecuta samples entradas de cada tamaño en un pool de procesos, de mayor a menor
+
+    Los tamaños grandes van primero para que no queden solos al final del pool.
+    Por defecto sin caché: los tiempos guardados son de otra ejecución.
+    """
+    tasks = [(push_swap, size, seed, i, use_cache, quoted)
+             for size in sorted(sizes, reverse=True) for i in range(samples)]
+    results = {size: [] for size in sorted(sizes)}
+    with multiprocessing.Pool(jobs or os.cpu_count() or 1) as pool:
+        for sample in pool.imap_unordered(sweep_sample, tasks):
+            results[sample["size"]].append(sample)
+    return results
+
+
+def fit(sizes, values):
+    """Ajusta values frente a cada modelo y frente a una potencia de n
+
+    Para cada modelo se ajusta y = c * f(n) en escala logarítmica (los tamaños
+    abarcan varios órdenes de magnitud), así que su error es la desviación
+    típica de log(y / f(n)) y el mejor modelo es el de menor error. El
+    exponente es la pendiente de log y frente a log n.
+    """
+    points = [(n, v) for n, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return None
+    logs_n = [math.log(n) for n, _ in points]
+    logs_v = [math.log(v) for _, v in points]
+    errors = {}
+    for name, model in MODELS.items():
+        residuals = [lv - math.log(model(n)) for (n, _), lv in zip(points, logs_v)]
+        m = mean(residuals)
+        errors[name] = math.sqrt(sum((r - m) ** 2 for r in residuals) / len(residuals))
+    exponent, _, r2 = linear_regression(logs_n, logs_v)
+    return {"exponent": exponent, "r2": r2, "errors": errors, "best": min(errors, key=errors.get)}
+
+
+def summarize(results):
+    """Medias por tamaño (solo las muestras que ordenan) y ajustes de operaciones y tiempo de CPU
+
+    El tiempo que se ajusta es el de CPU de push_swap (user + sys): el tiempo
+    real incluye la simulación de las operaciones en el tester. Los tiempos y
+    el RSS salen solo de las muestras medidas ahora (no de la caché).
+    """
+    rows = []
+    for size, samples in results.items():
+        passed = [s for s in samples if s["status"] == OK]
+        timed = [s for s in passed if not s.get("cached")]
+        rows.append({
+            "size": size,
+            "samples": len(samples),
+            "failures": len(samples) - len(passed),
+            "timed": len(timed),
+            "ops": mean([s["ops"] for s in passed]),
+            "cpu": mean([s["user"] + s["sys"] for s in timed]),
+            "wall": mean([s["wall"] for s in timed]),
+            "rss_kb": max((s["max_rss_kb"] for s in timed), default=0),
+        })
+    measured = [row for row in rows if row["failures"] < row["samples"]]
+    sizes = [row["size"] for row in measured]
+    ops_fit = fit(sizes, [row["ops"] for row in measured])
+    timed = [row for row in measured if row["timed"]]
+    cpu_fit = fit([row["size"] for row in timed], [row["cpu"] for row in timed])
+    superlinear = cpu_fit is not None and (cpu_fit["exponent"] > SUPERLINEAR_EXPONENT or cpu_fit["best"] == "n²")
+    return {"rows": rows, "ops_fit": ops_fit, "cpu_fit": cpu_fit, "superlinear": superlinear}
+
+
+def _format_fit(label, result):
+    if result is None:
+        return f"{label}: sin datos suficientes"
+    errors = "  ".join(f"{name} {error:.3f}" for name, error in result["errors"].items())
+    return (f"{label}: crece como {result['best']} (exponente {result['exponent']:.2f}, "
+            f"R² {result['r2']:.3f}; error log por modelo: {errors})")
+
+
+def print_summary(summary):
+    print(f"{YELLOW}{'Tamaño':>7} | {'ops':>11} {'ops/n':>7} {'ops/n·log n':>11} | "
+          f"{'cpu':>10} {'real':>10} {'RSS máx':>9} | Fallos{NC}")
+    print("-" * 90)
+    for row in summary["rows"]:
+        n = row["size"]
+        failures = f"{RED}{row['failures']}/{row['samples']}{NC}" if row["failures"] else "0"
+        if row["failures"] == row["samples"]:
+            print(f"{n:>7} | {'-':>11} {'-':>7} {'-':>11} | {'-':>10} {'-':>10} {'-':>9} | {failures}")
+            continue
+        times = (f"{row['cpu'] * 1000:>8.1f}ms {row['wall'] * 1000:>8.1f}ms {row['rss_kb'] / 1024:>7.1f}MB"
+                 if row["timed"] else f"{'caché':>10} {'-':>10} {'-':>9}")
+        print(f"{n:>7} | {row['ops']:>11.1f} {row['ops'] / n:>7.2f} {row['ops'] / (n * math.log2(n)):>11.3f} | "
+              f"{times} | {failures}")
+    print()
+    print(_format_fit("Operaciones", summary["ops_fit"]))
+    print(_format_fit("Tiempo de CPU", summary["cpu_fit"]))
+    if summary["superlinear"]:
+        print(f"{RED}✗ El tiempo crece más deprisa que n log n (exponente > {SUPERLINEAR_EXPONENT}){NC}")
+    elif summary["cpu_fit"] is not None:
+        print(f"{GREEN}✓ El tiempo no crece más deprisa que n log n{NC}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=None,
+                        help=f"tamaños a probar (por defecto {STEPS} entre {MIN_SIZE} y {MAX_SIZE} en progresión geométrica)")
+    parser.add_argument("--min", type=int, default=MIN_SIZE, help=f"tamaño mínimo ({MIN_SIZE})")
+    parser.add_argument("--max", type=int, default=MAX_SIZE, help=f"tamaño máximo ({MAX_SIZE})")
+    parser.add_argument("--steps", type=int, default=STEPS, help=f"número de tamaños ({STEPS})")
+    parser.add_argument("-n", "--samples", type=int, default=3, help="entradas por tamaño (3)")
+    parser.add_argument("--seed", type=int, default=0, help="semilla base de las entradas")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="procesos en paralelo (todos los núcleos; -j 1 da tiempos más estables)")
+    parser.add_argument("--push-swap", default=PUSH_SWAP, help="ruta al programa push_swap")
+    parser.add_argument("--cache", action="store_true",
+                        help="reutilizar la caché (las muestras de la caché no cuentan para el tiempo)")
+    parser.add_argument("--quoted", action="store_true",
+                        help='pasar los números en un solo argumento ("$ARG"); en Linux solo hasta unos 20000')
+    parser.add_argument("-o", "--output", default=None, help="guardar las muestras y los ajustes en un fichero JSON")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.push_swap):
+        print(f"{RED}Error: No se encontró el programa push_swap en la ubicación: {args.push_swap}{NC}")
+        return 1
+    sizes = args.sizes or geometric_sizes(args.min, args.max, args.steps)
+    if any(n < 2 for n in sizes):
+        print(f"{RED}Error: los tamaños deben ser al menos 2{NC}")
+        return 1
+
+    print(f"Tamaños: {' '.join(map(str, sizes))} ({args.samples} entradas de cada uno)")
+    start = time.perf_counter()
+    results = run_sweep(args.push_swap, sizes, args.samples, args.seed, args.jobs, args.cache, args.quoted)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print_summary(summary)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"samples": [s for size in results for s in results[size]], **summary}, f)
+        print(f"Resultados guardados en {args.output}")
+    print(f"\n{sum(map(len, results.values()))} ejecuciones en {elapsed:.2f} segundos (semilla {args.seed})")
+    failed = any(row["failures"] for row in summary["rows"])
+    return 1 if failed or summary["superlinear"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,18 @@ BLUE='\033[0;34m'
 YELLOW='\033[0;33m'
 NC='\033[0m' # No Color
 
-# Path al programa push_swap (ajusta según sea necesario)
-PUSH_SWAP="./push_swap"
+# Path al programa push_swap (ajusta según sea necesario o usa PUSH_SWAP=ruta ./push_swap_tester.sh)
+PUSH_SWAP="${PUSH_SWAP:-./push_swap}"
+
+# Directorio del tester (para encontrar los scripts de Python)
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PYTHON="python3"
+
+# Semilla de las entradas aleatorias (SEED=1234 ./push_swap_tester.sh repite una ejecución)
+SEED="${SEED:-$RANDOM}"
+
+# Fichero con las medidas de cada ejecución (una línea JSON: tiempo, CPU, RSS...)
+RESULTS_FILE="push_swap_results.jsonl"
 
 # Función para mostrar el encabezado de una prueba
 print_header() {
@@ -17,12 +27,34 @@ print_header() {
     echo -e "${BLUE}=======================================${NC}"
 }
 
+# Ejecuta push_swap (primer argumento: etiqueta) registrando sus medidas en RESULTS_FILE
+run_push_swap() {
+    local label="$1"
+    shift
+    $PYTHON "$SCRIPT_DIR/push_swap_runner.py" --results "$RESULTS_FILE" --label "$label" -- "$PUSH_SWAP" "$@"
+}
+
+# Permutación reproducible de 1..tamaño (argumentos: tamaño, índice del caso)
+random_input() {
+    $PYTHON "$SCRIPT_DIR/push_swap_corpus.py" case random "$1" --seed "$SEED" --index "$2"
+}
+
+# Devuelve un campo de la última ejecución registrada
+last_result() {
+    tail -n 1 "$RESULTS_FILE" | $PYTHON -c "import json, sys; print(json.load(sys.stdin)[sys.argv[1]])" "$1"
+}
+
+# Tiempo real (ms), CPU (ms) y RSS máximo (MB) de la última ejecución
+last_metrics() {
+    tail -n 1 "$RESULTS_FILE" | $PYTHON -c "import json, sys; r = json.load(sys.stdin); print(f\"{r['wall'] * 1000:.1f}\t{(r['user'] + r['sys']) * 1000:.1f}\t{r['max_rss_kb'] / 1024:.1f}\")"
+}
+
 # Función para verificar si el programa detecta errores correctamente
 test_error_cases() {
     print_header "PRUEBA DE CASOS DE ERROR"
 
     echo -e "${YELLOW}Caso: Argumentos duplicados${NC}"
-    OUTPUT=$($PUSH_SWAP 1 2 3 3 4 5 2>&1)
+    OUTPUT=$(run_push_swap "duplicados" 1 2 3 3 4 5 2>&1)
     if [[ "$OUTPUT" == *"Error"* ]]; then
         echo -e "${GREEN}✓ Correcto: Detectó duplicados${NC}"
     else
@@ -30,7 +62,7 @@ test_error_cases() {
     fi
 
     echo -e "${YELLOW}Caso: Argumentos no numéricos${NC}"
-    OUTPUT=$($PUSH_SWAP 1 2 abc 4 5 2>&1)
+    OUTPUT=$(run_push_swap "no numérico" 1 2 abc 4 5 2>&1)
     if [[ "$OUTPUT" == *"Error"* ]]; then
         echo -e "${GREEN}✓ Correcto: Detectó argumento no numérico${NC}"
     else
@@ -38,12 +70,49 @@ test_error_cases() {
     fi
 
     echo -e "${YELLOW}Caso: Número fuera de rango INT${NC}"
-    OUTPUT=$($PUSH_SWAP 1 2 99999999999999999999 4 2>&1)
+    OUTPUT=$(run_push_swap "fuera de rango" 1 2 99999999999999999999 4 2>&1)
     if [[ "$OUTPUT" == *"Error"* ]]; then
         echo -e "${GREEN}✓ Correcto: Detectó número fuera de rango${NC}"
     else
         echo -e "${RED}✗ Incorrecto: No detectó número fuera de rango${NC}"
     fi
+
+    # Unos cientos de argv difíciles (límites, signos, ceros, vacíos, duplicados disfrazados)
+    echo -e "${YELLOW}Caso: Fuzzing del parseo de argumentos${NC}"
+    $PYTHON "$SCRIPT_DIR/push_swap_fuzz.py" --push-swap "$PUSH_SWAP" --count 300 --seed "$SEED" --top 3
+}
+
+# Casos pequeños de las pruebas básicas y extremas: etiqueta, operaciones, óptimo y exceso
+OPTIMAL_CASES=()
+
+# Ejecuta un caso pequeño (primer argumento: etiqueta) y lo compara con el
+# mínimo exacto de operaciones de la tabla de push_swap_optimal.py
+check_optimal() {
+    local label="$1"
+    shift
+    local output operations result best excess
+    output=$(run_push_swap "$label" "$@")
+    if [[ -z "$output" ]]; then
+        operations=0
+    else
+        output+=$'\n'
+        operations=$(printf '%s' "$output" | wc -l | tr -d '[:space:]')
+    fi
+    result=$(printf '%s' "$output" | $PYTHON "$SCRIPT_DIR/push_swap_checker.py" "$@" 2>&1)
+    best=$($PYTHON "$SCRIPT_DIR/push_swap_optimal.py" --best "$@")
+    echo -e "Operaciones: $operations (óptimo: $best)"
+    if [[ "$result" != "OK" ]]; then
+        echo -e "${RED}✗ Incorrecto: La secuencia no ordena la pila ($result)${NC}"
+        excess="-"
+    else
+        excess=$((operations - best))
+        if [[ "$excess" -eq 0 ]]; then
+            echo -e "${GREEN}✓ Óptimo: Usó el mínimo de operaciones${NC}"
+        else
+            echo -e "${YELLOW}⚠ Mejorable: $excess operaciones más que el óptimo${NC}"
+        fi
+    fi
+    OPTIMAL_CASES+=("$label"$'\t'"$operations"$'\t'"$best"$'\t'"$excess")
 }
 
 # Función para probar casos básicos
@@ -51,40 +120,16 @@ test_basic_cases() {
     print_header "PRUEBA DE CASOS BÁSICOS"
 
     echo -e "${YELLOW}Caso: Lista ya ordenada${NC}"
-    OPERATIONS=$($PUSH_SWAP 1 2 3 4 5 | wc -l | tr -d '[:space:]')
-    echo -e "Operaciones: $OPERATIONS"
-    if [[ "$OPERATIONS" -eq 0 ]]; then
-        echo -e "${GREEN}✓ Correcto: No realizó operaciones en lista ordenada${NC}"
-    else
-        echo -e "${RED}✗ Incorrecto: Realizó operaciones innecesarias${NC}"
-    fi
+    check_optimal "ordenada" 1 2 3 4 5
 
     echo -e "${YELLOW}Caso: Un solo número${NC}"
-    OPERATIONS=$($PUSH_SWAP 42 | wc -l | tr -d '[:space:]')
-    echo -e "Operaciones: $OPERATIONS"
-    if [[ "$OPERATIONS" -eq 0 ]]; then
-        echo -e "${GREEN}✓ Correcto: No realizó operaciones con un solo número${NC}"
-    else
-        echo -e "${RED}✗ Incorrecto: Realizó operaciones innecesarias${NC}"
-    fi
+    check_optimal "un número" 42
 
     echo -e "${YELLOW}Caso: Dos números invertidos${NC}"
-    OPERATIONS=$($PUSH_SWAP 2 1 | wc -l | tr -d '[:space:]')
-    echo -e "Operaciones: $OPERATIONS"
-    if [[ "$OPERATIONS" -le 1 ]]; then
-        echo -e "${GREEN}✓ Correcto: Usó una operación o menos${NC}"
-    else
-        echo -e "${RED}✗ Incorrecto: Usó más de una operación${NC}"
-    fi
+    check_optimal "dos invertidos" 2 1
 
     echo -e "${YELLOW}Caso: Tres números (3 1 2)${NC}"
-    OPERATIONS=$($PUSH_SWAP 3 1 2 | wc -l | tr -d '[:space:]')
-    echo -e "Operaciones: $OPERATIONS"
-    if [[ "$OPERATIONS" -le 2 ]]; then
-        echo -e "${GREEN}✓ Correcto: Usó dos operaciones o menos${NC}"
-    else
-        echo -e "${RED}✗ Incorrecto: Usó más de dos operaciones${NC}"
-    fi
+    check_optimal "3 1 2" 3 1 2
 }
 
 # Función para probar casos extremos
@@ -92,22 +137,23 @@ test_extreme_cases() {
     print_header "PRUEBA DE CASOS EXTREMOS"
 
     echo -e "${YELLOW}Caso: Valores INT_MIN e INT_MAX${NC}"
-    OPERATIONS=$($PUSH_SWAP 2147483647 -2147483648 0 42 | wc -l | tr -d '[:space:]')
-    echo -e "Operaciones: $OPERATIONS"
-    if [[ "$OPERATIONS" -lt 20 ]]; then
-        echo -e "${GREEN}✓ Bueno: Usó menos de 20 operaciones${NC}"
-    else
-        echo -e "${YELLOW}⚠ Regular: Usó más de 20 operaciones${NC}"
-    fi
+    check_optimal "INT_MIN e INT_MAX" 2147483647 -2147483648 0 42
 
     echo -e "${YELLOW}Caso: Secuencia invertida (5 números)${NC}"
-    OPERATIONS=$($PUSH_SWAP 5 4 3 2 1 | wc -l | tr -d '[:space:]')
-    echo -e "Operaciones: $OPERATIONS"
-    if [[ "$OPERATIONS" -lt 12 ]]; then
-        echo -e "${GREEN}✓ Excelente: Usó menos de 12 operaciones${NC}"
-    else
-        echo -e "${YELLOW}⚠ Regular: Usó más de 12 operaciones${NC}"
-    fi
+    check_optimal "5 invertidos" 5 4 3 2 1
+}
+
+# Exceso sobre el óptimo de cada caso pequeño
+show_optimal_summary() {
+    print_header "EXCESO SOBRE EL ÓPTIMO (CASOS PEQUEÑOS)"
+    local label operations best excess
+    echo -e "${YELLOW}Caso\t\t\t| Operaciones\t| Óptimo\t| Exceso${NC}"
+    echo "--------------------------------------------------------------"
+    for case in "${OPTIMAL_CASES[@]}"; do
+        IFS=$'\t' read -r label operations best excess <<< "$case"
+        # Relleno por caracteres (no por bytes) para alinear las etiquetas con tildes
+        printf "%s%*s| %s\t\t| %s\t\t| %s\n" "$label" $((24 - ${#label})) "" "$operations" "$best" "$excess"
+    done
 }
 
 # Función para probar sets de datos medianos y grandes
@@ -115,8 +161,8 @@ test_large_sets() {
     print_header "PRUEBA DE CONJUNTOS GRANDES"
 
     echo -e "${YELLOW}Caso: 100 números aleatorios${NC}"
-    ARG=$(ruby -e "puts (1..100).to_a.shuffle.join(' ')")
-    OPERATIONS=$($PUSH_SWAP $ARG | wc -l | tr -d '[:space:]')
+    ARG=$(random_input 100 0)
+    OPERATIONS=$(run_push_swap "100 aleatorios" $ARG | wc -l | tr -d '[:space:]')
     echo -e "Operaciones: $OPERATIONS"
     if [[ "$OPERATIONS" -lt 1500 ]]; then
         echo -e "${GREEN}✓ Excelente: Menos de 1500 operaciones${NC}"
@@ -127,11 +173,9 @@ test_large_sets() {
     fi
     
     echo -e "${YELLOW}Caso: 500 números aleatorios${NC}"
-    ARG=$(ruby -e "puts (1..500).to_a.shuffle.join(' ')")
-    time_start=$(date +%s.%N)
-    OPERATIONS=$($PUSH_SWAP $ARG | wc -l | tr -d '[:space:]')
-    time_end=$(date +%s.%N)
-    execution_time=$(echo "$time_end - $time_start" | bc)
+    ARG=$(random_input 500 0)
+    OPERATIONS=$(run_push_swap "500 aleatorios" $ARG | wc -l | tr -d '[:space:]')
+    execution_time=$(last_result wall)
     echo -e "Operaciones: $OPERATIONS (Tiempo: $execution_time segundos)"
     if [[ "$OPERATIONS" -lt 10000 ]]; then
         echo -e "${GREEN}✓ Excelente: Menos de 10000 operaciones${NC}"
@@ -142,39 +186,31 @@ test_large_sets() {
     fi
 }
 
-# Función para probar la validez de las operaciones (requiere checker)
+# Función para probar la validez de las operaciones
 test_validity() {
-    # Comprueba si existe un checker en el directorio
+    # Comprueba si existe un checker en el directorio; si no, usa el simulador de Python
     if [ -f "./checker_Mac" ]; then
         CHECKER="./checker_Mac"
     elif [ -f "./checker" ]; then
         CHECKER="./checker"
     else
-        echo -e "${RED}No se encontró el programa checker. Saltando prueba de validez.${NC}"
-        return
+        CHECKER="$PYTHON $SCRIPT_DIR/push_swap_checker.py"
+        echo -e "${YELLOW}No se encontró el programa checker. Usando push_swap_checker.py${NC}"
     fi
 
     print_header "PRUEBA DE VALIDEZ DE OPERACIONES"
 
-    echo -e "${YELLOW}Caso: 5 números aleatorios${NC}"
-    ARG="3 1 4 2 5"
-    OPERATIONS=$($PUSH_SWAP $ARG)
-    echo "$OPERATIONS" | $CHECKER $ARG > /dev/null
-    if [ $? -eq 0 ]; then
-        echo -e "${GREEN}✓ Correcto: La secuencia ordena correctamente${NC}"
-    else
-        echo -e "${RED}✗ Incorrecto: La secuencia no ordena correctamente${NC}"
-    fi
-    
-    echo -e "${YELLOW}Caso: 100 números aleatorios${NC}"
-    ARG=$(ruby -e "puts (1..100).to_a.shuffle.join(' ')")
-    OPERATIONS=$($PUSH_SWAP $ARG)
-    echo "$OPERATIONS" | $CHECKER $ARG > /dev/null
-    if [ $? -eq 0 ]; then
-        echo -e "${GREEN}✓ Correcto: La secuencia ordena correctamente${NC}"
-    else
-        echo -e "${RED}✗ Incorrecto: La secuencia no ordena correctamente${NC}"
-    fi
+    for size in 5 100 500; do
+        echo -e "${YELLOW}Caso: $size números aleatorios${NC}"
+        ARG=$(random_input "$size" 1)
+        # Las operaciones van directamente del pipe al checker, sin guardarlas
+        RESULT=$(run_push_swap "validez $size" $ARG | $CHECKER $ARG 2>&1)
+        if [[ "$RESULT" == "OK" ]]; then
+            echo -e "${GREEN}✓ Correcto: La secuencia ordena correctamente${NC}"
+        else
+            echo -e "${RED}✗ Incorrecto: La secuencia no ordena correctamente ($RESULT)${NC}"
+        fi
+    done
 }
 
 # Funcion para mostrar un resumen visual del rendimiento
@@ -184,12 +220,13 @@ show_performance_summary() {
     # Pruebas con diferentes tamaños para mostrar gráficamente
     sizes=(3 5 10 50 100 500)
     
-    echo -e "${YELLOW}Tamaño\t| Operaciones\t| Gráfico${NC}"
-    echo "------------------------------------"
+    echo -e "${YELLOW}Tamaño\t| Operaciones\t| Tiempo ms\t| CPU ms\t| RSS MB\t| Gráfico${NC}"
+    echo "------------------------------------------------------------------------------"
     
     for size in "${sizes[@]}"; do
-        ARG=$(ruby -e "puts (1..$size).to_a.shuffle.join(' ')")
-        OPERATIONS=$($PUSH_SWAP $ARG | wc -l | tr -d '[:space:]')
+        ARG=$(random_input "$size" 2)
+        OPERATIONS=$(run_push_swap "resumen $size" $ARG | wc -l | tr -d '[:space:]')
+        IFS=$'\t' read -r wall_ms cpu_ms rss_mb <<< "$(last_metrics)"
         
         # Crear una barra gráfica sencilla
         bar=""
@@ -202,12 +239,84 @@ show_performance_summary() {
             bar="${bar}█"
         done
         
-        echo -e "$size\t| $OPERATIONS\t| ${BLUE}$bar${NC}"
+        echo -e "$size\t| $OPERATIONS\t\t| $wall_ms\t\t| $cpu_ms\t| $rss_mb\t| ${BLUE}$bar${NC}"
     done
 }
 
+# Benchmark con varias permutaciones por tamaño en paralelo
+run_benchmark() {
+    print_header "BENCHMARK ($1 MUESTRAS POR TAMAÑO)"
+    $PYTHON "$SCRIPT_DIR/push_swap_bench.py" --push-swap "$PUSH_SWAP" --samples "$1"
+}
+
+# Benchmark con todos los casos de un corpus generado con push_swap_corpus.py
+run_corpus() {
+    print_header "BENCHMARK DEL CORPUS $1"
+    $PYTHON "$SCRIPT_DIR/push_swap_bench.py" --push-swap "$PUSH_SWAP" --corpus "$1"
+}
+
+# Comparación A/B de dos binarios con las mismas entradas
+run_compare() {
+    print_header "COMPARACIÓN $1 -> $2 ($3 MUESTRAS POR TAMAÑO)"
+    $PYTHON "$SCRIPT_DIR/push_swap_compare.py" "$1" "$2" --samples "$3"
+}
+
+# Todas las permutaciones de los tamaños pequeños comparadas con el mínimo exacto
+run_optimal() {
+    print_header "DISTANCIA AL ÓPTIMO (TODAS LAS PERMUTACIONES)"
+    $PYTHON "$SCRIPT_DIR/push_swap_optimal.py" --push-swap "$PUSH_SWAP" "$@"
+}
+
+# Perfil por fases de una entrada aleatoria
+run_profile() {
+    print_header "PERFIL POR FASES ($1 NÚMEROS)"
+    $PYTHON "$SCRIPT_DIR/push_swap_profile.py" --push-swap "$PUSH_SWAP" -o push_swap_profile.json $(random_input "$1" 0)
+}
+
+# Barrido de tamaños grandes con ajuste de la complejidad
+run_sweep() {
+    print_header "BARRIDO DE TAMAÑOS GRANDES"
+    $PYTHON "$SCRIPT_DIR/push_swap_sweep.py" --push-swap "$PUSH_SWAP" "$@"
+}
+
+# Fuzzing del parseo de argumentos con miles de argv
+run_fuzz() {
+    print_header "FUZZING DE ARGUMENTOS"
+    $PYTHON "$SCRIPT_DIR/push_swap_fuzz.py" --push-swap "$PUSH_SWAP" "$@"
+}
+
+# Rendimiento y corrección de un checker con flujos de operaciones grandes
+run_checker_bench() {
+    print_header "BENCHMARK DEL CHECKER"
+    $PYTHON "$SCRIPT_DIR/push_swap_checker_bench.py" "$@"
+}
+
+# Tendencia y regresiones de los benchmarks guardados en el historial
+run_history() {
+    print_header "HISTORIAL DE BENCHMARKS"
+    $PYTHON "$SCRIPT_DIR/push_swap_history.py" report "$@"
+}
+
 # Ejecutar todas las pruebas
 main() {
+    # La comparación usa sus dos binarios en lugar de PUSH_SWAP
+    if [ "$1" == "--compare" ]; then
+        run_compare "$2" "$3" "${4:-100}"
+        exit $?
+    fi
+    
+    # El benchmark del checker y el historial no necesitan push_swap
+    if [ "$1" == "--checker-bench" ]; then
+        shift
+        run_checker_bench "$@"
+        exit $?
+    fi
+    if [ "$1" == "--history" ]; then
+        shift
+        run_history "$@"
+        exit $?
+    fi
+    
     print_header "TESTER DE PUSH_SWAP"
     echo -e "${YELLOW}Verificando existencia del programa push_swap...${NC}"
     
@@ -217,18 +326,54 @@ main() {
         exit 1
     fi
     
-    echo -e "${GREEN}Programa encontrado. Ejecutando pruebas...${NC}"
+    echo -e "${GREEN}Programa encontrado. Ejecutando pruebas (semilla $SEED)...${NC}"
+    
+    # Empezar un fichero de resultados nuevo en cada ejecución del tester
+    : > "$RESULTS_FILE"
+    
+    # Modos alternativos
+    case "$1" in
+        --bench)
+            run_benchmark "${2:-100}"
+            exit $?
+            ;;
+        --corpus)
+            run_corpus "$2"
+            exit $?
+            ;;
+        --profile)
+            run_profile "${2:-500}"
+            exit $?
+            ;;
+        --sweep)
+            shift
+            run_sweep "$@"
+            exit $?
+            ;;
+        --optimal)
+            shift
+            run_optimal "$@"
+            exit $?
+            ;;
+        --fuzz)
+            shift
+            run_fuzz "$@"
+            exit $?
+            ;;
+    esac
     
     # Ejecutar todas las pruebas
     test_error_cases
     test_basic_cases
     test_extreme_cases
+    show_optimal_summary
     test_large_sets
     test_validity
     show_performance_summary
     
     print_header "PRUEBAS COMPLETADAS"
+    echo -e "Medidas de cada ejecución guardadas en $RESULTS_FILE"
 }
 
 # Ejecutar programa principal
-main
\ No newline at end of file
+main "$@"
\ No newline at end of file
@@ -1,11 +1,24 @@
 #!/usr/bin/env python3
-import subprocess
 import sys
 import random
 import os
 import webbrowser
 import platform
 import json
+import base64
+import hmac
+import secrets
+import struct
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import push_swap_runner as runner
+from push_swap_analyzer import analyze
+from push_swap_checker import OPCODES, OPERATIONS, encode_operations, parse_numbers
+from push_swap_optimal import efficiency, lower_bound
+from push_swap_profile import profile
 
 # Ruta al programa push_swap
 PUSH_SWAP = "./push_swap"
@@ -16,18 +29,90 @@ COLORS = [
     "#FFC300", "#00FFC3", "#C300FF", "#FF0000", "#00FF00"
 ]
 
-def generate_html(numbers, operations):
-    """Genera un archivo HTML con la visualización interactiva de push_swap"""
+# Cada cuántas operaciones se guarda una instantánea de las pilas en la página
+# (saltar a cualquier paso reproduce como mucho este número de operaciones)
+KEYFRAME_INTERVAL = 100
+
+# A partir de este número de elementos se dibuja en un <canvas> en vez de un div por elemento
+CANVAS_THRESHOLD = 200
+
+# Operaciones ejecutadas por frame de animación en el modo canvas
+OPS_PER_FRAME = 10
+
+# Puerto del modo --serve (solo escucha en localhost)
+SERVE_PORT = 8000
+
+# Pausa entre dos lotes de operaciones enviados al navegador en modo --serve
+STREAM_INTERVAL = 0.05
+
+# Tamaño máximo de las entradas aleatorias que se pueden pedir desde la página
+MAX_SERVE_SIZE = 10000
+
+# Tamaño máximo del formulario de /new (una lista de números pegada a mano)
+MAX_FORM_BYTES = 1 << 20
+
+def analysis_summary(numbers, operations):
+    """Análisis de las operaciones para la página: sobrantes (mapa de bits en base64), cota inferior
+    y perfil por fases (sin la lista de pushes, que la página no usa)"""
+    report = analyze(operations, len(numbers))
+    phases = profile(numbers, operations)
+    del phases["pushes"]
+    wasted_bits = bytearray((len(operations) + 7) // 8)
+    for index in report["wasted"]:
+        wasted_bits[index >> 3] |= 1 << (index & 7)
+    return {
+        "optimized": report["optimized"],
+        "wasted_count": len(report["wasted"]),
+        "wasted": base64.b64encode(bytes(wasted_bits)).decode("ascii"),
+        "bound": lower_bound(numbers),
+        "efficiency": efficiency(numbers, len(operations)),
+        "profile": phases,
+    }
+
+def generate_html(numbers, operations, render_mode=None, debug=False):
+    """Genera un archivo HTML con la visualización interactiva de push_swap
+
+    render_mode es "dom" o "canvas"; por defecto se elige según CANVAS_THRESHOLD.
+    Con debug la página registra cada operación en la consola del navegador.
+    """
+    html = render_html(numbers, operations, render_mode, debug=debug)
+    
+    # Guardar el HTML en un archivo
+    with open("push_swap_visualization.html", "w") as f:
+        f.write(html)
+    
+    return "push_swap_visualization.html"
+
+def render_html(numbers, operations, render_mode=None, stream_url=None, debug=False):
+    """Devuelve el HTML de la visualización
+
+    Con stream_url la página recibe más operaciones por Server-Sent Events
+    desde esa URL (modo --serve) y se anima según llegan.
+    """
     
     # Aseguramos que operations es una lista de strings y no está vacía
     if not operations:
         operations = []
     
-    # Convertir a JSON para pasar correctamente a JavaScript
-    numbers_json = json.dumps(numbers)
-    operations_json = json.dumps(operations)
+    if render_mode is None:
+        render_mode = "canvas" if len(numbers) > CANVAS_THRESHOLD else "dom"
+    
+    # Operaciones como un byte por operación (con rachas comprimidas) y números como
+    # int32 little-endian, ambos en base64 para decodificarlos en typed arrays
+    operations_b64 = base64.b64encode(encode_operations(operations)).decode("ascii")
+    numbers_b64 = base64.b64encode(struct.pack(f"<{len(numbers)}i", *numbers)).decode("ascii")
     colors_json = json.dumps(COLORS)
     
+    # Operaciones sobrantes según el analizador, como mapa de bits (bit i = operación i),
+    # y cota inferior de operaciones para esta entrada con la eficiencia respecto a ella
+    summary = analysis_summary(numbers, operations)
+    
+    # En vivo se muestra el estado de la ejecución hasta que termina
+    stream_status = "<div id='stream-status'>Recibiendo operaciones...</div>" if stream_url else ""
+    
+    # Constantes de los códigos de operación para el JavaScript (SA = 0, SB = 1, ...)
+    opcodes_js = ", ".join(f"{op.upper()} = {code}" for code, op in enumerate(OPERATIONS))
+    
     html = """
     <!DOCTYPE html>
     <html lang="es">
@@ -132,14 +217,29 @@ def generate_html(numbers, operations):
                 margin-top: 20px;
                 height: 100px;
                 overflow-y: auto;
+                position: relative;
+            }
+            
+            /* Solo existen en el DOM las filas visibles, colocadas en su posición absoluta */
+            .operations-spacer {
+                position: relative;
             }
             
             .operation {
-                padding: 5px;
-                margin: 5px 0;
+                position: absolute;
+                left: 0;
+                right: 0;
+                height: 24px;
+                line-height: 24px;
+                padding: 0 5px;
                 border-radius: 4px;
             }
             
+            .wasted-operation {
+                color: #ff7777;
+                text-decoration: line-through;
+            }
+            
             .current-operation {
                 background-color: #66c2ff;
                 color: #1e1e1e;
@@ -158,6 +258,51 @@ def generate_html(numbers, operations):
                 width: 200px;
             }
             
+            .timeline-control {
+                display: flex;
+                align-items: center;
+                gap: 10px;
+                margin-top: 10px;
+                justify-content: center;
+            }
+            
+            .timeline-slider {
+                width: 60%;
+            }
+            
+            .stack-canvas {
+                display: block;
+                width: 100%;
+                height: 500px;
+            }
+            
+            .profile {
+                background-color: #2a2a2a;
+                border-radius: 8px;
+                padding: 15px;
+                margin-top: 20px;
+            }
+            
+            .profile-canvas {
+                display: block;
+                width: 100%;
+                height: 200px;
+                cursor: pointer;
+            }
+            
+            .profile-legend {
+                margin-top: 8px;
+                font-size: 14px;
+            }
+            
+            .profile-legend span {
+                margin-right: 15px;
+            }
+            
+            .frame-input {
+                width: 60px;
+            }
+            
             .debug-info {
                 margin-top: 20px;
                 padding: 10px;
@@ -180,6 +325,7 @@ def generate_html(numbers, operations):
             <h1>Push Swap Visualizer</h1>
             
             <div class="controls">
+                <button id="step-back">⬅ Paso atrás</button>
                 <button id="start">▶ Empezar</button>
                 <button id="step">➡ Paso a paso</button>
                 <button id="reset">🔄 Reiniciar</button>
@@ -189,53 +335,369 @@ def generate_html(numbers, operations):
                 <label for="speed">Velocidad:</label>
                 <input type="range" id="speed" class="speed-slider" min="50" max="1000" value="300">
                 <span id="speed-value">300ms</span>
+                <label for="ops-per-frame" class="canvas-only">Operaciones por frame:</label>
+                <input type="number" id="ops-per-frame" class="frame-input canvas-only" min="1" value='""" + str(OPS_PER_FRAME) + """'>
+            </div>
+            
+            <div class="timeline-control">
+                <label for="timeline">Posición:</label>
+                <input type="range" id="timeline" class="timeline-slider" min="0" max="0" value="0">
             </div>
             
             <div class="info">
                 <div id="total-operations">Operaciones totales: <span>0</span></div>
+                <div id="optimized-operations" title="Tachadas en rojo en la lista: sin efecto, rotaciones de más, parejas que se anulan o fusionables">Tras reescribir: """ + str(summary["optimized"]) + """ (""" + str(summary["wasted_count"]) + """ sobrantes)</div>
+                <div id="lower-bound" title="n menos la subsecuencia creciente más larga: ninguna solución puede usar menos operaciones">Cota inferior: """ + str(summary["bound"]) + """ (eficiencia """ + f"{summary['efficiency']:.1%}" + """)</div>
                 <div id="current-step">Paso actual: <span>0</span> / <span>0</span></div>
+                """ + stream_status + """
             </div>
             
             <div class="stacks-container">
                 <div class="stack">
                     <div class="stack-title">Pila A</div>
+                    <div class="empty-stack-message" id="empty-a">Pila A vacía</div>
                     <div class="stack-items" id="stack-a"></div>
+                    <canvas class="stack-canvas" id="canvas-a"></canvas>
                 </div>
                 
                 <div class="stack">
                     <div class="stack-title">Pila B</div>
+                    <div class="empty-stack-message" id="empty-b">Pila B vacía</div>
                     <div class="stack-items" id="stack-b"></div>
+                    <canvas class="stack-canvas" id="canvas-b"></canvas>
                 </div>
             </div>
             
             <div class="operations" id="operations-list">
-                <div class="operation">Esperando inicio...</div>
+                <div class="operations-spacer" id="operations-spacer"></div>
+            </div>
+            
+            <div class="profile" id="profile">
+                <div class="stack-title">Perfil por fases</div>
+                <canvas class="profile-canvas" id="profile-chart" title="Operaciones de cada tipo por ventana, tamaño de B y fases; haz clic para ir a esa posición"></canvas>
+                <div class="profile-legend" id="profile-legend"></div>
+                <div class="profile-legend" id="profile-phases"></div>
             </div>
             
             <div class="debug-info">
                 <h3>Información de depuración</h3>
                 <p>Números iniciales: """ + str(numbers) + """</p>
                 <p>Total de operaciones: """ + str(len(operations)) + """</p>
-                <p>Operaciones: """ + str(operations) + """</p>
             </div>
         </div>
         
         <script>
-            // Estado inicial de las pilas (usando JSON para transferir datos de Python a JavaScript)
-            const initialNumbers = """ + numbers_json + """;
-            const operations = """ + operations_json + """;
+            // Códigos de operación (mismo orden que OPERATIONS en push_swap_checker.py)
+            const """ + opcodes_js + """;
+            const OPERATION_NAMES = """ + json.dumps(OPERATIONS) + """;
+            
+            function decodeBase64(text) {
+                const binary = atob(text);
+                const bytes = new Uint8Array(binary.length);
+                for (let i = 0; i < binary.length; i++) {
+                    bytes[i] = binary.charCodeAt(i);
+                }
+                return bytes;
+            }
+            
+            // Un byte por operación; con el bit alto activado le sigue la longitud de la racha (varint)
+            function decodeOperations(bytes, count) {
+                const ops = new Uint8Array(count);
+                let pos = 0;
+                let i = 0;
+                while (i < bytes.length) {
+                    const code = bytes[i++];
+                    if (code & 0x80) {
+                        let run = 0;
+                        let scale = 1;
+                        let part;
+                        do {
+                            part = bytes[i++];
+                            run += (part & 0x7f) * scale;
+                            scale *= 128;
+                        } while (part & 0x80);
+                        ops.fill(code & 0x7f, pos, pos + run);
+                        pos += run;
+                    } else {
+                        ops[pos++] = code;
+                    }
+                }
+                return ops;
+            }
+            
+            // Estado inicial de las pilas (datos binarios embebidos desde Python)
+            const initialNumbers = new Int32Array(decodeBase64(""" + json.dumps(numbers_b64) + """).buffer);
+            // En modo en vivo llegan más operaciones: operations es una vista del
+            // principio de operationBuffer, que dobla su capacidad cuando se llena
+            let operationBuffer = decodeOperations(decodeBase64(""" + json.dumps(operations_b64) + """), """ + str(len(operations)) + """);
+            let operations = operationBuffer;
+            let wastedOperations = decodeBase64(""" + json.dumps(summary["wasted"]) + """);
+            // Perfil por fases de push_swap_profile.py (en vivo llega al terminar)
+            let profile = """ + json.dumps(summary["profile"]) + """;
+            const STREAM_URL = """ + json.dumps(stream_url) + """;
+            let streaming = STREAM_URL !== null;
             const COLORS = """ + colors_json + """;
+            const KEYFRAME_INTERVAL = """ + str(KEYFRAME_INTERVAL) + """;
+            const RENDER_MODE = """ + json.dumps(render_mode) + """;
+            
+            // Alto de cada fila de la lista de operaciones y filas extra fuera de la vista
+            const OPERATION_ROW_HEIGHT = 28;
+            const OPERATION_ROW_OVERSCAN = 3;
+            
+            // Operación inversa de cada una (para dar pasos hacia atrás)
+            const INVERSE = new Uint8Array(OPERATION_NAMES.length);
+            [[SA, SA], [SB, SB], [SS, SS], [PA, PB], [PB, PA], [RA, RRA], [RB, RRB],
+             [RR, RRR], [RRA, RA], [RRB, RB], [RRR, RR]].forEach(([op, inverse]) => INVERSE[op] = inverse);
             
-            console.log("Números iniciales:", initialNumbers);
-            console.log("Operaciones:", operations);
-            console.log("Colores:", COLORS);
+            // Registro en la consola solo con --debug (registrar las pilas en cada operación es O(n))
+            const DEBUG = """ + json.dumps(debug) + """;
+            function debugLog(...args) {
+                if (DEBUG) {
+                    console.log(...args);
+                }
+            }
             
-            let stackA = [...initialNumbers];
-            let stackB = [];
+            // Pila de capacidad fija sobre un Int32Array circular: la cima es data[head],
+            // así que todas las operaciones son O(1)
+            class RingStack {
+                constructor(capacity) {
+                    this.data = new Int32Array(Math.max(capacity, 1));
+                    this.head = 0;
+                    this.size = 0;
+                }
+                
+                // Elemento i contando desde la cima
+                get(i) {
+                    return this.data[(this.head + i) % this.data.length];
+                }
+                
+                pushTop(value) {
+                    this.head = (this.head + this.data.length - 1) % this.data.length;
+                    this.data[this.head] = value;
+                    this.size++;
+                }
+                
+                popTop() {
+                    const value = this.data[this.head];
+                    this.head = (this.head + 1) % this.data.length;
+                    this.size--;
+                    return value;
+                }
+                
+                pushBottom(value) {
+                    this.data[(this.head + this.size) % this.data.length] = value;
+                    this.size++;
+                }
+                
+                popBottom() {
+                    this.size--;
+                    return this.data[(this.head + this.size) % this.data.length];
+                }
+                
+                // Cada operación devuelve si cambió la pila
+                swap() {
+                    if (this.size < 2) {
+                        return false;
+                    }
+                    const second = (this.head + 1) % this.data.length;
+                    const top = this.data[this.head];
+                    this.data[this.head] = this.data[second];
+                    this.data[second] = top;
+                    return true;
+                }
+                
+                rotate() {
+                    if (this.size < 2) {
+                        return false;
+                    }
+                    this.pushBottom(this.popTop());
+                    return true;
+                }
+                
+                reverseRotate() {
+                    if (this.size < 2) {
+                        return false;
+                    }
+                    this.pushTop(this.popBottom());
+                    return true;
+                }
+                
+                load(values) {
+                    this.data.set(values, 0);
+                    this.head = 0;
+                    this.size = values.length;
+                }
+                
+                // Copia la pila (de la cima al fondo) en target desde offset
+                copyTo(target, offset) {
+                    const first = Math.min(this.size, this.data.length - this.head);
+                    target.set(this.data.subarray(this.head, this.head + first), offset);
+                    target.set(this.data.subarray(0, this.size - first), offset + first);
+                }
+                
+                toArray() {
+                    const values = new Int32Array(this.size);
+                    this.copyTo(values, 0);
+                    return Array.from(values);
+                }
+            }
+            
+            // Las dos pilas de push_swap
+            class StackModel {
+                constructor(capacity) {
+                    this.a = new RingStack(capacity);
+                    this.b = new RingStack(capacity);
+                }
+                
+                reset(numbers) {
+                    this.a.load(numbers);
+                    this.b.load([]);
+                }
+                
+                // Aplica una operación y devuelve si cambió las pilas (pa con B vacía no hace nada);
+                // ss, rr y rrr usan | para aplicar siempre las dos mitades
+                apply(op) {
+                    switch (op) {
+                        case SA: return this.a.swap();
+                        case SB: return this.b.swap();
+                        case SS: return this.a.swap() | this.b.swap();
+                        case PA:
+                            if (this.b.size === 0) {
+                                return false;
+                            }
+                            this.a.pushTop(this.b.popTop());
+                            return true;
+                        case PB:
+                            if (this.a.size === 0) {
+                                return false;
+                            }
+                            this.b.pushTop(this.a.popTop());
+                            return true;
+                        case RA: return this.a.rotate();
+                        case RB: return this.b.rotate();
+                        case RR: return this.a.rotate() | this.b.rotate();
+                        case RRA: return this.a.reverseRotate();
+                        case RRB: return this.b.reverseRotate();
+                        case RRR: return this.a.reverseRotate() | this.b.reverseRotate();
+                    }
+                    throw new Error(`Operación desconocida: ${op}`);
+                }
+                
+                // Copia de las dos pilas en un único Int32Array: [A..., B...]
+                snapshot() {
+                    const data = new Int32Array(this.a.size + this.b.size);
+                    this.a.copyTo(data, 0);
+                    this.b.copyTo(data, this.a.size);
+                    return { data: data, sizeA: this.a.size };
+                }
+                
+                restore(frame) {
+                    this.a.load(frame.data.subarray(0, frame.sizeA));
+                    this.b.load(frame.data.subarray(frame.sizeA));
+                }
+            }
+            
+            // Simula un lote de operaciones que empieza en la operación from: qué operaciones
+            // cambian las pilas y las instantáneas cada KEYFRAME_INTERVAL operaciones
+            function simulateBatch(model, ops, from) {
+                const changed = new Uint8Array(ops.length);
+                const frames = [];
+                for (let i = 0; i < ops.length; i++) {
+                    if ((from + i) % KEYFRAME_INTERVAL === 0) {
+                        frames.push(model.snapshot());
+                    }
+                    changed[i] = model.apply(ops[i]) ? 1 : 0;
+                }
+                return { from: from, effective: changed, frames: frames };
+            }
+            
+            // Código del Web Worker: simula todas las operaciones en segundo plano y
+            // devuelve por cada lote solo los cambios (effective y las instantáneas)
+            function simulationWorker() {
+                const CHUNK = 10000;
+                let model = null;
+                let count = 0;
+                self.onmessage = event => {
+                    const message = event.data;
+                    if (message.numbers) {
+                        model = new StackModel(message.numbers.length);
+                        model.reset(message.numbers);
+                        count = 0;
+                        return;
+                    }
+                    for (let start = 0; start < message.ops.length; start += CHUNK) {
+                        const result = simulateBatch(model, message.ops.subarray(start, start + CHUNK), count);
+                        count += result.effective.length;
+                        self.postMessage(result, [result.effective.buffer, ...result.frames.map(frame => frame.data.buffer)]);
+                    }
+                };
+            }
+            
+            // Simulación en este hilo, por lotes según llegan
+            function localSimulation() {
+                const model = new StackModel(initialNumbers.length);
+                model.reset(initialNumbers);
+                let count = 0;
+                return ops => {
+                    const result = simulateBatch(model, ops, count);
+                    count += ops.length;
+                    receiveSimulation(result);
+                };
+            }
+            
+            // Lanza la simulación en un Worker (Blob URL) o, si no se puede, en este hilo
+            function createSimulation() {
+                try {
+                    const source = [
+                        """ + json.dumps(f"const {opcodes_js};") + """,
+                        `const KEYFRAME_INTERVAL = ${KEYFRAME_INTERVAL};`,
+                        RingStack.toString(), StackModel.toString(), simulateBatch.toString(),
+                        `(${simulationWorker.toString()})();`,
+                    ].join('\\n');
+                    const worker = new Worker(URL.createObjectURL(new Blob([source], { type: 'text/javascript' })));
+                    let fallback = null;
+                    worker.onmessage = event => receiveSimulation(event.data);
+                    // Si el Worker no carga o falla, se rehace todo en este hilo: sin esto
+                    // nunca llegarían las instantáneas ni effective
+                    worker.onerror = event => {
+                        event.preventDefault();
+                        debugLog("Simulación en el hilo principal:", event.message);
+                        worker.onmessage = null;
+                        worker.terminate();
+                        keyframes.length = 0;
+                        simulated = 0;
+                        fallback = localSimulation();
+                        fallback(operations.slice());
+                    };
+                    worker.postMessage({ numbers: initialNumbers });
+                    debugLog("Simulación en un Web Worker");
+                    return ops => fallback ? fallback(ops) : worker.postMessage({ ops: ops }, [ops.buffer]);
+                } catch (error) {
+                    debugLog("Simulación en el hilo principal:", error);
+                    return localSimulation();
+                }
+            }
+            
+            debugLog("Números iniciales:", initialNumbers);
+            debugLog("Operaciones:", operations);
+            debugLog("Colores:", COLORS);
+            
+            // Pilas mostradas
+            const view = new StackModel(initialNumbers.length);
+            view.reset(initialNumbers);
             let currentStep = 0;
             let animationInterval = null;
+            let animationFrame = null;
+            let opsPerFrame = """ + str(OPS_PER_FRAME) + """;
             let animationSpeed = 300; // milisegundos
             
+            // keyframes[k] = estado de las pilas tras k * KEYFRAME_INTERVAL operaciones
+            const keyframes = [];
+            // effective[i] = 1 si la operación i cambió las pilas (pa con B vacía no hace nada)
+            let effective = new Uint8Array(operationBuffer.length);
+            // Operaciones ya simuladas (effective y keyframes solo son válidos hasta aquí)
+            let simulated = 0;
+            
             // Obtener el elemento máximo para calcular proporciones
             const maxNum = Math.max(...initialNumbers);
             const minNum = Math.min(...initialNumbers);
@@ -244,267 +706,367 @@ def generate_html(numbers, operations):
             // Elementos del DOM
             const stackAElement = document.getElementById('stack-a');
             const stackBElement = document.getElementById('stack-b');
+            const emptyAElement = document.getElementById('empty-a');
+            const emptyBElement = document.getElementById('empty-b');
             const operationsList = document.getElementById('operations-list');
+            const operationsSpacer = document.getElementById('operations-spacer');
             const totalOpsElement = document.getElementById('total-operations').querySelector('span');
             const currentStepElements = document.getElementById('current-step').querySelectorAll('span');
             const startButton = document.getElementById('start');
             const stepButton = document.getElementById('step');
             const resetButton = document.getElementById('reset');
+            const stepBackButton = document.getElementById('step-back');
+            const timelineSlider = document.getElementById('timeline');
+            const canvasAElement = document.getElementById('canvas-a');
+            const canvasBElement = document.getElementById('canvas-b');
+            const opsPerFrameInput = document.getElementById('ops-per-frame');
+            const speedLabel = document.querySelector('label[for="speed"]');
             const speedSlider = document.getElementById('speed');
             const speedValue = document.getElementById('speed-value');
             
+            // Resultado de un lote de la simulación (llegan en orden)
+            function receiveSimulation(result) {
+                effective.set(result.effective, result.from);
+                keyframes.push(...result.frames);
+                simulated = result.from + result.effective.length;
+            }
+            
+            // Ir a cualquier posición: instantánea más cercana + como mucho KEYFRAME_INTERVAL
+            // operaciones (más si la simulación aún no ha llegado hasta ahí)
+            function seek(position) {
+                position = Math.max(0, Math.min(position, operations.length));
+                // Las instantáneas se toman antes de cada operación múltiplo de KEYFRAME_INTERVAL:
+                // al final de una secuencia de longitud múltiplo no existe la de position, y se
+                // parte de la última (no del estado inicial, que dejaría las pilas sin ordenar)
+                const frameIndex = Math.min(Math.floor(position / KEYFRAME_INTERVAL), keyframes.length - 1);
+                if (frameIndex >= 0) {
+                    view.restore(keyframes[frameIndex]);
+                } else {
+                    // Sin instantáneas todavía (la simulación no ha devuelto el primer lote)
+                    view.reset(initialNumbers);
+                }
+                for (let i = Math.max(frameIndex, 0) * KEYFRAME_INTERVAL; i < position; i++) {
+                    executeOperation(operations[i]);
+                }
+                currentStep = position;
+                updateView();
+            }
+            
+            // op: operación recién aplicada (solo se actualiza su cambio), null si las pilas
+            // no cambiaron; sin op se redibujan las pilas completas
+            function updateView(op) {
+                if (RENDER_MODE === 'canvas') {
+                    requestDraw();
+                } else if (op === undefined) {
+                    renderStacks();
+                } else {
+                    renderOperationDelta(op);
+                }
+                renderOperations();
+                currentStepElements[0].textContent = currentStep;
+                timelineSlider.value = currentStep;
+            }
+            
             // Inicializar visualización
             function init() {
-                stackA = [...initialNumbers];
-                stackB = [];
+                view.reset(initialNumbers);
                 currentStep = 0;
                 
-                renderStacks();
-                renderOperations();
+                updateView();
+                initOperations();
                 
                 totalOpsElement.textContent = operations.length;
                 currentStepElements[0].textContent = 0;
                 currentStepElements[1].textContent = operations.length;
+                timelineSlider.max = operations.length;
+                timelineSlider.value = 0;
                 
-                if (animationInterval) {
-                    clearInterval(animationInterval);
-                    animationInterval = null;
+                stopAnimation();
+            }
+            
+            // Un nodo persistente por valor, con el ancho y el color calculados una sola vez
+            // (el modo canvas no los necesita)
+            const itemNodes = new Map();
+            (RENDER_MODE === 'dom' ? initialNumbers : []).forEach(num => {
+                const item = document.createElement('div');
+                item.classList.add('stack-item');
+                
+                // Calcular ancho proporcional al valor
+                const widthPercent = range === 0 ? 90 : 30 + ((num - minNum) / range) * 60;
+                item.style.width = `${widthPercent}%`;
+                
+                // Asignar un color basado en el valor
+                const colorIndex = Math.abs(num) % COLORS.length;
+                item.style.backgroundColor = COLORS[colorIndex];
+                
+                item.textContent = num;
+                itemNodes.set(num, item);
+            });
+            
+            function updateEmptyMessages() {
+                emptyAElement.style.display = stackAElement.childElementCount === 0 ? '' : 'none';
+                emptyBElement.style.display = stackBElement.childElementCount === 0 ? '' : 'none';
+            }
+            
+            // Modo canvas: cada elemento es una barra de alto fijo (1px si hace falta)
+            const barColors = new Map();
+            const barWidths = new Map();
+            initialNumbers.forEach(num => {
+                barColors.set(num, COLORS[Math.abs(num) % COLORS.length]);
+                barWidths.set(num, range === 0 ? 0.9 : 0.3 + ((num - minNum) / range) * 0.6);
+            });
+            let drawPending = false;
+            
+            function resizeCanvas(canvas) {
+                const ratio = window.devicePixelRatio || 1;
+                canvas.width = Math.max(1, Math.floor(canvas.clientWidth * ratio));
+                canvas.height = Math.max(1, Math.floor(canvas.clientHeight * ratio));
+            }
+            
+            // Dibuja una pila con la cima abajo, igual que la vista con divs
+            function drawStack(canvas, stack) {
+                const ctx = canvas.getContext('2d');
+                const width = canvas.width;
+                const height = canvas.height;
+                const rowHeight = height / Math.max(initialNumbers.length, 1);
+                const barHeight = rowHeight >= 3 ? rowHeight - 1 : Math.max(rowHeight, 1);
+                ctx.clearRect(0, 0, width, height);
+                for (let i = 0; i < stack.size; i++) {
+                    const num = stack.get(i);
+                    const barWidth = barWidths.get(num) * width;
+                    ctx.fillStyle = barColors.get(num);
+                    ctx.fillRect((width - barWidth) / 2, height - (i + 1) * rowHeight, barWidth, barHeight);
                 }
             }
             
-            // Renderizar las pilas
+            function drawStacks() {
+                drawPending = false;
+                drawStack(canvasAElement, view.a);
+                drawStack(canvasBElement, view.b);
+                emptyAElement.style.display = view.a.size === 0 ? '' : 'none';
+                emptyBElement.style.display = view.b.size === 0 ? '' : 'none';
+            }
+            
+            // Agrupa varios cambios en un solo dibujo por frame
+            function requestDraw() {
+                if (!drawPending) {
+                    drawPending = true;
+                    requestAnimationFrame(drawStacks);
+                }
+            }
+            
+            // Renderizar las pilas completas (al iniciar o al saltar a otra posición)
             function renderStacks() {
-                console.log("Renderizando pilas");
-                console.log("stackA:", stackA);
-                console.log("stackB:", stackB);
-                
-                // Limpiar pilas
-                stackAElement.innerHTML = '';
-                stackBElement.innerHTML = '';
-                
-                // Renderizar pila A
-                if (stackA.length === 0) {
-                    const emptyMessage = document.createElement('div');
-                    emptyMessage.classList.add('empty-stack-message');
-                    emptyMessage.textContent = "Pila A vacía";
-                    stackAElement.appendChild(emptyMessage);
-                } else {
-                    stackA.forEach((num, index) => {
-                        const item = document.createElement('div');
-                        item.classList.add('stack-item');
-                        
-                        // Calcular ancho proporcional al valor
-                        const widthPercent = range === 0 ? 90 : 30 + ((num - minNum) / range) * 60;
-                        item.style.width = `${widthPercent}%`;
-                        
-                        // Asignar un color basado en el valor
-                        const colorIndex = Math.abs(num) % COLORS.length;
-                        item.style.backgroundColor = COLORS[colorIndex];
-                        
-                        item.textContent = num;
-                        stackAElement.appendChild(item);
-                    });
+                stackAElement.replaceChildren(...view.a.toArray().map(num => itemNodes.get(num)));
+                stackBElement.replaceChildren(...view.b.toArray().map(num => itemNodes.get(num)));
+                updateEmptyMessages();
+            }
+            
+            // Aplicar al DOM solo el cambio que produce una operación
+            function swapNodes(element) {
+                if (element.childElementCount >= 2) {
+                    element.insertBefore(element.children[1], element.firstElementChild);
                 }
-                
-                // Renderizar pila B
-                if (stackB.length === 0) {
-                    const emptyMessage = document.createElement('div');
-                    emptyMessage.classList.add('empty-stack-message');
-                    emptyMessage.textContent = "Pila B vacía";
-                    stackBElement.appendChild(emptyMessage);
-                } else {
-                    stackB.forEach((num, index) => {
-                        const item = document.createElement('div');
-                        item.classList.add('stack-item');
-                        
-                        // Calcular ancho proporcional al valor
-                        const widthPercent = range === 0 ? 90 : 30 + ((num - minNum) / range) * 60;
-                        item.style.width = `${widthPercent}%`;
-                        
-                        // Asignar un color basado en el valor
-                        const colorIndex = Math.abs(num) % COLORS.length;
-                        item.style.backgroundColor = COLORS[colorIndex];
-                        
-                        item.textContent = num;
-                        stackBElement.appendChild(item);
-                    });
+            }
+            
+            function pushNode(from, to) {
+                if (from.childElementCount > 0) {
+                    to.insertBefore(from.firstElementChild, to.firstElementChild);
                 }
             }
             
-            // Renderizar lista de operaciones
-            function renderOperations() {
-                operationsList.innerHTML = '';
+            function rotateNodes(element) {
+                if (element.childElementCount >= 2) {
+                    element.appendChild(element.firstElementChild);
+                }
+            }
+            
+            function reverseRotateNodes(element) {
+                if (element.childElementCount >= 2) {
+                    element.insertBefore(element.lastElementChild, element.firstElementChild);
+                }
+            }
+            
+            function renderOperationDelta(op) {
+                switch(op) {
+                    case SA: swapNodes(stackAElement); break;
+                    case SB: swapNodes(stackBElement); break;
+                    case SS: swapNodes(stackAElement); swapNodes(stackBElement); break;
+                    case PA: pushNode(stackBElement, stackAElement); break;
+                    case PB: pushNode(stackAElement, stackBElement); break;
+                    case RA: rotateNodes(stackAElement); break;
+                    case RB: rotateNodes(stackBElement); break;
+                    case RR: rotateNodes(stackAElement); rotateNodes(stackBElement); break;
+                    case RRA: reverseRotateNodes(stackAElement); break;
+                    case RRB: reverseRotateNodes(stackBElement); break;
+                    case RRR: reverseRotateNodes(stackAElement); reverseRotateNodes(stackBElement); break;
+                }
+                updateEmptyMessages();
+            }
+            
+            // Filas reutilizadas de la lista virtual de operaciones
+            const operationRows = [];
+            
+            // Renderizar las filas visibles de la lista de operaciones
+            function renderOperationRows() {
+                if (operations.length === 0) {
+                    return;
+                }
+                const first = Math.max(0, Math.floor(operationsList.scrollTop / OPERATION_ROW_HEIGHT) - OPERATION_ROW_OVERSCAN);
+                const count = Math.ceil(operationsList.clientHeight / OPERATION_ROW_HEIGHT) + 2 * OPERATION_ROW_OVERSCAN;
+                
+                while (operationRows.length < count) {
+                    const row = document.createElement('div');
+                    row.classList.add('operation');
+                    operationsSpacer.appendChild(row);
+                    operationRows.push(row);
+                }
                 
+                operationRows.forEach((row, k) => {
+                    const index = first + k;
+                    if (index >= operations.length) {
+                        row.style.display = 'none';
+                        return;
+                    }
+                    row.style.display = '';
+                    row.style.top = `${index * OPERATION_ROW_HEIGHT}px`;
+                    row.textContent = `${index + 1}: ${OPERATION_NAMES[operations[index]]}`;
+                    row.classList.toggle('current-operation', index === currentStep - 1);
+                    row.classList.toggle('wasted-operation', (wastedOperations[index >> 3] & (1 << (index & 7))) !== 0);
+                });
+            }
+            
+            // Preparar la lista de operaciones (alto total sin crear una fila por operación)
+            function initOperations() {
                 if (operations.length === 0) {
                     const opElement = document.createElement('div');
                     opElement.classList.add('operation');
                     opElement.textContent = "No hay operaciones (lista ya ordenada o error)";
-                    operationsList.appendChild(opElement);
+                    operationsSpacer.replaceChildren(opElement);
                     return;
                 }
-                
-                operations.forEach((op, index) => {
-                    const opElement = document.createElement('div');
-                    opElement.classList.add('operation');
-                    if (index === currentStep - 1) {
-                        opElement.classList.add('current-operation');
-                    }
-                    opElement.textContent = `${index + 1}: ${op}`;
-                    operationsList.appendChild(opElement);
-                });
-                
-                // Scrollear a la operación actual
+                operationsSpacer.style.height = `${operations.length * OPERATION_ROW_HEIGHT}px`;
+                operationsList.scrollTop = 0;
+                renderOperationRows();
+            }
+            
+            // Actualizar la lista de operaciones tras un cambio de paso
+            function renderOperations() {
+                // Scrollear a la operación actual si no está visible
                 if (currentStep > 0) {
-                    const currentOpElement = operationsList.querySelector('.current-operation');
-                    if (currentOpElement) {
-                        currentOpElement.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    const top = (currentStep - 1) * OPERATION_ROW_HEIGHT;
+                    const viewTop = operationsList.scrollTop;
+                    const viewHeight = operationsList.clientHeight;
+                    if (top < viewTop || top + OPERATION_ROW_HEIGHT > viewTop + viewHeight) {
+                        operationsList.scrollTop = Math.max(0, top - (viewHeight - OPERATION_ROW_HEIGHT) / 2);
                     }
                 }
+                renderOperationRows();
             }
             
-            // Ejecutar una operación
+            // Ejecutar una operación sobre las pilas mostradas
             function executeOperation(op) {
-                console.log("Ejecutando operación:", op);
-                switch(op) {
-                    case 'sa':
-                        // Swap A - intercambiar los dos primeros elementos de A
-                        if (stackA.length >= 2) {
-                            const temp = stackA[0];
-                            stackA[0] = stackA[1];
-                            stackA[1] = temp;
-                        }
-                        break;
-                    case 'sb':
-                        // Swap B - intercambiar los dos primeros elementos de B
-                        if (stackB.length >= 2) {
-                            const temp = stackB[0];
-                            stackB[0] = stackB[1];
-                            stackB[1] = temp;
-                        }
-                        break;
-                    case 'ss':
-                        // Swap A y Swap B simultáneamente
-                        if (stackA.length >= 2) {
-                            const temp = stackA[0];
-                            stackA[0] = stackA[1];
-                            stackA[1] = temp;
-                        }
-                        if (stackB.length >= 2) {
-                            const temp = stackB[0];
-                            stackB[0] = stackB[1];
-                            stackB[1] = temp;
-                        }
-                        break;
-                    case 'pa':
-                        // Push A - tomar el primer elemento de B y ponerlo en A
-                        if (stackB.length > 0) {
-                            const elem = stackB.shift();
-                            stackA.unshift(elem);
-                        }
-                        break;
-                    case 'pb':
-                        // Push B - tomar el primer elemento de A y ponerlo en B
-                        if (stackA.length > 0) {
-                            const elem = stackA.shift();
-                            stackB.unshift(elem);
-                        }
-                        break;
-                    case 'ra':
-                        // Rotate A - mover el primer elemento al final de A
-                        if (stackA.length > 0) {
-                            const elem = stackA.shift();
-                            stackA.push(elem);
-                        }
-                        break;
-                    case 'rb':
-                        // Rotate B - mover el primer elemento al final de B
-                        if (stackB.length > 0) {
-                            const elem = stackB.shift();
-                            stackB.push(elem);
-                        }
-                        break;
-                    case 'rr':
-                        // Rotate A y Rotate B simultáneamente
-                        if (stackA.length > 0) {
-                            const elemA = stackA.shift();
-                            stackA.push(elemA);
-                        }
-                        if (stackB.length > 0) {
-                            const elemB = stackB.shift();
-                            stackB.push(elemB);
-                        }
-                        break;
-                    case 'rra':
-                        // Reverse Rotate A - mover el último elemento al inicio de A
-                        if (stackA.length > 0) {
-                            const elem = stackA.pop();
-                            stackA.unshift(elem);
-                        }
-                        break;
-                    case 'rrb':
-                        // Reverse Rotate B - mover el último elemento al inicio de B
-                        if (stackB.length > 0) {
-                            const elem = stackB.pop();
-                            stackB.unshift(elem);
-                        }
-                        break;
-                    case 'rrr':
-                        // Reverse Rotate A y Reverse Rotate B simultáneamente
-                        if (stackA.length > 0) {
-                            const elemA = stackA.pop();
-                            stackA.unshift(elemA);
-                        }
-                        if (stackB.length > 0) {
-                            const elemB = stackB.pop();
-                            stackB.unshift(elemB);
-                        }
-                        break;
-                    default:
-                        console.error("Operación desconocida:", op);
-                        break;
-                }
-                console.log("Estado de pila A después de operación:", stackA);
-                console.log("Estado de pila B después de operación:", stackB);
+                debugLog("Ejecutando operación:", OPERATION_NAMES[op]);
+                view.apply(op);
+                if (DEBUG) {
+                    debugLog("Estado de pila A después de operación:", view.a.toArray());
+                    debugLog("Estado de pila B después de operación:", view.b.toArray());
+                }
             }
             
-            // Ejecutar un paso
-            function step() {
+            // Ejecutar la siguiente operación sin actualizar la vista (null si no quedan)
+            function advance() {
                 if (currentStep < operations.length) {
-                    executeOperation(operations[currentStep]);
+                    const op = operations[currentStep];
+                    executeOperation(op);
                     currentStep++;
-                    
-                    renderStacks();
-                    renderOperations();
-                    
-                    currentStepElements[0].textContent = currentStep;
+                    return op;
+                }
+                return null;
+            }
+            
+            // Ejecutar un paso
+            function step() {
+                const op = advance();
+                if (op === null) {
+                    return false;
+                }
+                updateView(op);
+                return true;
+            }
+            
+            // Deshacer un paso aplicando la operación inversa
+            function stepBack() {
+                if (currentStep > 0) {
+                    if (currentStep > simulated) {
+                        // Aún no se sabe si la operación cambió las pilas
+                        seek(currentStep - 1);
+                        return true;
+                    }
+                    currentStep--;
+                    if (effective[currentStep]) {
+                        const op = INVERSE[operations[currentStep]];
+                        executeOperation(op);
+                        updateView(op);
+                    } else {
+                        updateView(null);
+                    }
                     
                     return true;
                 }
                 return false;
             }
             
-            // Empezar animación automática
-            function start() {
+            // Modo canvas: varias operaciones por frame y un único dibujo
+            function animateFrame() {
+                for (let k = 0; k < opsPerFrame && advance() !== null; k++);
+                updateView();
+                if (currentStep < operations.length || streaming) {
+                    animationFrame = requestAnimationFrame(animateFrame);
+                } else {
+                    stopAnimation();
+                }
+            }
+            
+            function startInterval() {
+                animationInterval = setInterval(() => {
+                    // En vivo se espera a que lleguen más operaciones
+                    if (!step() && !streaming) {
+                        stopAnimation();
+                    }
+                }, animationSpeed);
+            }
+            
+            function stopAnimation() {
                 if (animationInterval) {
                     clearInterval(animationInterval);
-                    startButton.textContent = '▶ Empezar';
                     animationInterval = null;
+                }
+                if (animationFrame) {
+                    cancelAnimationFrame(animationFrame);
+                    animationFrame = null;
+                }
+                startButton.textContent = '▶ Empezar';
+            }
+            
+            // Empezar animación automática
+            function start() {
+                if (animationInterval || animationFrame) {
+                    stopAnimation();
                     return;
                 }
                 
-                if (currentStep >= operations.length) {
+                if (currentStep >= operations.length && !streaming) {
                     init();
                 }
                 
                 startButton.textContent = '⏸ Pausar';
                 
-                animationInterval = setInterval(() => {
-                    if (!step()) {
-                        clearInterval(animationInterval);
-                        animationInterval = null;
-                        startButton.textContent = '▶ Empezar';
-                    }
-                }, animationSpeed);
+                if (RENDER_MODE === 'canvas') {
+                    animationFrame = requestAnimationFrame(animateFrame);
+                } else {
+                    startInterval();
+                }
             }
             
             // Reiniciar visualización
@@ -512,10 +1074,161 @@ def generate_html(numbers, operations):
                 init();
             }
             
+            // Grupos de operaciones del gráfico del perfil, apilados de abajo arriba
+            const PROFILE_GROUPS = [
+                { name: 'swap', ops: [SA, SB, SS], color: '#FFC300' },
+                { name: 'pb', ops: [PB], color: '#FF5733' },
+                { name: 'pa', ops: [PA], color: '#33FF57' },
+                { name: 'rotate', ops: [RA, RB, RR], color: '#3357FF' },
+                { name: 'reverse rotate', ops: [RRA, RRB, RRR], color: '#C300FF' }
+            ];
+            const PHASE_COLORS = {
+                'push-to-B': 'rgba(255, 87, 51, 0.12)',
+                'sort-back': 'rgba(51, 255, 87, 0.12)',
+                'final-rotate': 'rgba(51, 87, 255, 0.12)',
+                'in-place': 'rgba(255, 255, 255, 0.06)'
+            };
+            const profileCanvas = document.getElementById('profile-chart');
+            
+            // Histograma por ventanas (barras apiladas), tamaño de B (línea) y fases (fondo)
+            function drawProfile() {
+                document.getElementById('profile').style.display = profile.total ? '' : 'none';
+                if (!profile.total) {
+                    return;
+                }
+                resizeCanvas(profileCanvas);
+                const ctx = profileCanvas.getContext('2d');
+                const width = profileCanvas.width;
+                const height = profileCanvas.height;
+                const ratio = window.devicePixelRatio || 1;
+                ctx.clearRect(0, 0, width, height);
+                
+                // La posición x de la operación i es i / total del ancho
+                ctx.font = `${12 * ratio}px Arial`;
+                profile.phases.forEach(phase => {
+                    const x = phase.start / profile.total * width;
+                    const w = (phase.end - phase.start) / profile.total * width;
+                    ctx.fillStyle = PHASE_COLORS[phase.name];
+                    ctx.fillRect(x, 0, w, height);
+                    ctx.fillStyle = '#888';
+                    ctx.fillRect(x, 0, 1, height);
+                    if (w > 80 * ratio) {
+                        ctx.fillStyle = '#f0f0f0';
+                        ctx.fillText(phase.name, x + 4 * ratio, 14 * ratio);
+                    }
+                });
+                
+                const barWidth = profile.window / profile.total * width;
+                profile.counts.forEach((histogram, w) => {
+                    let y = height;
+                    PROFILE_GROUPS.forEach(group => {
+                        const count = group.ops.reduce((sum, op) => sum + histogram[op], 0);
+                        const h = count / profile.window * (height - 20 * ratio);
+                        ctx.fillStyle = group.color;
+                        ctx.fillRect(w * barWidth, y - h, Math.max(1, barWidth - 1), h);
+                        y -= h;
+                    });
+                });
+                
+                ctx.strokeStyle = '#f0f0f0';
+                ctx.lineWidth = 2 * ratio;
+                ctx.beginPath();
+                profile.b_size.forEach((size, w) => {
+                    const y = height - size / Math.max(profile.size, 1) * (height - 20 * ratio);
+                    if (w === 0) {
+                        ctx.moveTo(0, height);
+                    }
+                    ctx.lineTo(Math.min((w + 1) * barWidth, width), y);
+                });
+                ctx.stroke();
+                
+                document.getElementById('profile-legend').innerHTML = PROFILE_GROUPS.map(group =>
+                    `<span style="color: ${group.color}">■ ${group.name}</span>`).join('') +
+                    `<span>— tamaño de B</span><span>${profile.window} operaciones por barra</span>`;
+                document.getElementById('profile-phases').innerHTML = profile.phases.map(phase =>
+                    `<span>${phase.name}: ${phase.ops} (${(phase.ops / profile.total * 100).toFixed(1)}%), ` +
+                    `${phase.rotations_per_push.toFixed(2)} rotaciones por push</span>`).join('');
+            }
+            
+            profileCanvas.addEventListener('click', event => {
+                const rect = profileCanvas.getBoundingClientRect();
+                stopAnimation();
+                seek(Math.round((event.clientX - rect.left) / rect.width * operations.length));
+            });
+            window.addEventListener('resize', drawProfile);
+            
+            // Modo en vivo: añadir un lote de operaciones recibido del servidor
+            function appendOperations(batch) {
+                const added = decodeOperations(decodeBase64(batch.ops), batch.count);
+                const from = operations.length;
+                const length = from + added.length;
+                if (length > operationBuffer.length) {
+                    const capacity = Math.max(length, operationBuffer.length * 2, 1024);
+                    const grownOperations = new Uint8Array(capacity);
+                    grownOperations.set(operations);
+                    operationBuffer = grownOperations;
+                    const grownEffective = new Uint8Array(capacity);
+                    grownEffective.set(effective.subarray(0, from));
+                    effective = grownEffective;
+                }
+                operationBuffer.set(added, from);
+                operations = operationBuffer.subarray(0, length);
+                simulate(added);
+                
+                totalOpsElement.textContent = operations.length;
+                currentStepElements[1].textContent = operations.length;
+                timelineSlider.max = operations.length;
+                if (from === 0) {
+                    // Quitar el mensaje de lista vacía
+                    operationsSpacer.replaceChildren(...operationRows);
+                }
+                operationsSpacer.style.height = `${operations.length * OPERATION_ROW_HEIGHT}px`;
+                renderOperationRows();
+            }
+            
+            // Modo en vivo: push_swap terminó; llegan el análisis y el estado final
+            function finishStream(summary) {
+                streaming = false;
+                document.getElementById('stream-status').textContent = `push_swap terminó: ${summary.status}`;
+                // Sin análisis si la ejecución falló en el servidor
+                if (summary.wasted === undefined) return;
+                wastedOperations = decodeBase64(summary.wasted);
+                document.getElementById('optimized-operations').textContent =
+                    `Tras reescribir: ${summary.optimized} (${summary.wasted_count} sobrantes)`;
+                document.getElementById('lower-bound').textContent =
+                    `Cota inferior: ${summary.bound} (eficiencia ${(summary.efficiency * 100).toFixed(1)}%)`;
+                profile = summary.profile;
+                drawProfile();
+                renderOperationRows();
+            }
+            
+            function connectStream() {
+                const source = new EventSource(STREAM_URL);
+                source.onmessage = event => appendOperations(JSON.parse(event.data));
+                source.addEventListener('done', event => {
+                    source.close();
+                    finishStream(JSON.parse(event.data));
+                });
+                source.onerror = () => {
+                    // Sin reconectar: se repetirían las operaciones ya recibidas
+                    source.close();
+                    if (streaming) {
+                        streaming = false;
+                        document.getElementById('stream-status').textContent = 'Conexión con el servidor perdida';
+                    }
+                };
+                start();
+            }
+            
             // Event listeners
             startButton.addEventListener('click', start);
             stepButton.addEventListener('click', step);
             resetButton.addEventListener('click', reset);
+            stepBackButton.addEventListener('click', stepBack);
+            operationsList.addEventListener('scroll', renderOperationRows);
+            timelineSlider.addEventListener('input', function() {
+                seek(parseInt(this.value));
+            });
             
             // Control de velocidad
             speedSlider.addEventListener('input', function() {
@@ -524,73 +1237,321 @@ def generate_html(numbers, operations):
                 
                 if (animationInterval) {
                     clearInterval(animationInterval);
-                    animationInterval = setInterval(() => {
-                        if (!step()) {
-                            clearInterval(animationInterval);
-                            animationInterval = null;
-                            startButton.textContent = '▶ Empezar';
-                        }
-                    }, animationSpeed);
+                    startInterval();
                 }
             });
             
+            opsPerFrameInput.addEventListener('input', function() {
+                opsPerFrame = Math.max(1, parseInt(this.value) || 1);
+            });
+            
+            // Mostrar solo los controles y contenedores del modo elegido
+            if (RENDER_MODE === 'canvas') {
+                stackAElement.style.display = 'none';
+                stackBElement.style.display = 'none';
+                speedSlider.style.display = 'none';
+                speedValue.style.display = 'none';
+                speedLabel.style.display = 'none';
+                resizeCanvas(canvasAElement);
+                resizeCanvas(canvasBElement);
+                window.addEventListener('resize', () => {
+                    resizeCanvas(canvasAElement);
+                    resizeCanvas(canvasBElement);
+                    requestDraw();
+                });
+            } else {
+                canvasAElement.style.display = 'none';
+                canvasBElement.style.display = 'none';
+                document.querySelectorAll('.canvas-only').forEach(element => element.style.display = 'none');
+            }
+            
             // Inicializar visualización al cargar el documento
             document.addEventListener('DOMContentLoaded', () => {
-                console.log("DOM cargado, inicializando visualización");
+                debugLog("DOM cargado, inicializando visualización");
                 init();
+                drawProfile();
             });
             
+            // Simular todas las operaciones en segundo plano (las de modo en vivo se añaden al llegar)
+            const simulate = createSimulation();
+            simulate(operations.slice());
+            
             // Inicializar inmediatamente también 
             init();
+            
+            // En vivo se conecta al servidor y se anima según llegan las operaciones
+            if (streaming) {
+                document.addEventListener('DOMContentLoaded', connectStream);
+            }
         </script>
     </body>
     </html>
     """
     
-    # Guardar el HTML en un archivo
-    with open("push_swap_visualization.html", "w") as f:
-        f.write(html)
-    
-    return "push_swap_visualization.html"
+    return html
 
-def run_push_swap(numbers):
-    """Ejecuta push_swap con los números dados y devuelve las operaciones"""
+def run_push_swap(numbers, debug=False, use_cache=True):
+    """Ejecuta push_swap con los números dados y devuelve las operaciones
+
+    Las operaciones se leen y verifican en streaming; con debug se muestra
+    además cada línea de la salida según llega. Si el binario y la entrada no
+    han cambiado el resultado sale de la caché sin ejecutar push_swap.
+    """
     try:
-        # Convertir números a strings
-        num_strings = [str(n) for n in numbers]
+        print(f"Ejecutando {PUSH_SWAP} con {len(numbers)} números")
         
-        # Mostrar el comando que se va a ejecutar
-        cmd = [PUSH_SWAP] + num_strings
-        print(f"Ejecutando comando: {' '.join(cmd)}")
+        result = runner.run_push_swap(numbers, PUSH_SWAP, keep_operations=True, echo=debug,
+                                      use_cache=use_cache)
+        if result.cached:
+            print("Resultado obtenido de la caché")
         
-        # Ejecutar push_swap
-        result = subprocess.run(cmd, 
-                                 capture_output=True, 
-                                 text=True)
-        
-        # Mostrar salida completa para debug
-        print(f"Código de salida: {result.returncode}")
-        print(f"Stdout: '{result.stdout}'")
-        print(f"Stderr: '{result.stderr}'")
+        if debug:
+            print(f"Código de salida: {result.returncode}")
+            print(f"Stderr: '{result.stderr}'")
         
         # Comprobar si hubo algún error
-        if result.returncode != 0:
+        if result.status == runner.TIMEOUT:
+            print(f"push_swap superó el tiempo límite ({runner.DEFAULT_TIMEOUT}s); se visualizan {result.ops} operaciones")
+        elif result.status == runner.MAX_OPS:
+            print(f"push_swap superó el máximo de {runner.DEFAULT_MAX_OPS} operaciones; se visualizan las primeras")
+        elif result.status == runner.OUTPUT_FLOOD:
+            print(f"push_swap superó el límite de {runner.OUTPUT_LIMIT} bytes de salida; se visualizan las primeras operaciones")
+        elif result.invalid:
+            # El runner mata a push_swap en la línea inválida (código de salida
+            # -9): solo se pueden visualizar las operaciones anteriores a ella
+            print(f"Operación inválida en la línea {result.ops + 1}")
+        elif result.returncode != 0:
+            if result.status == runner.OOM:
+                print(f"push_swap se quedó sin memoria (límite de {runner.MEMORY_LIMIT // (1024 * 1024)} MB)")
             print(f"Error ejecutando push_swap: {result.stderr}")
             return []
         
-        # Obtener las operaciones devueltas
-        operations = result.stdout.strip().split('\n')
-        # Filtrar líneas vacías
-        operations = [op for op in operations if op]
-        
-        print(f"Operaciones obtenidas: {operations}")
-        return operations
+        print(f"Operaciones obtenidas: {result.ops}")
+        if not result.cached:
+            print(f"Tiempo: {result.wall:.3f}s (CPU user {result.user_time:.3f}s, sys {result.sys_time:.3f}s), "
+                  f"RSS máximo: {result.max_rss_kb / 1024:.1f} MB")
+        print(f"Verificación de la secuencia: {result.status}")
+        runner.append_result(runner.RESULTS_FILE, dict(label="visualizer", argc=len(numbers), **result.metrics()))
+        return result.operations
     except Exception as e:
         print(f"Error al ejecutar push_swap: {e}")
         import traceback
         traceback.print_exc()
         return []
 
+class LiveRun:
+    """Ejecución de push_swap cuyas operaciones se envían a los navegadores según llegan"""
+
+    def __init__(self, run_id, numbers, render_mode=None, use_cache=True):
+        self.id = run_id
+        self.numbers = numbers
+        self.render_mode = render_mode
+        self.use_cache = use_cache
+        self.operations = []
+        self.status = None
+        self.summary = None
+        self.condition = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _add(self, op):
+        # Una operación inválida no se envía: la ejecución termina justo después
+        if op in OPCODES:
+            with self.condition:
+                self.operations.append(op)
+                self.condition.notify_all()
+
+    def _run(self):
+        status = runner.ERROR
+        try:
+            result = runner.run_push_swap(self.numbers, PUSH_SWAP, keep_operations=True,
+                                          use_cache=self.use_cache, on_operation=self._add)
+            status = result.status
+            runner.append_result(runner.RESULTS_FILE, dict(label="visualizer", argc=len(self.numbers),
+                                                           **result.metrics()))
+        except OSError as e:
+            status = f"{runner.ERROR}: {e}"
+        except Exception as e:
+            status = f"{runner.ERROR}: error inesperado ({e})"
+            import traceback
+            traceback.print_exc()
+        finally:
+            # El resumen se publica siempre: los clientes de /events lo esperan para terminar
+            with self.condition:
+                try:
+                    summary = analysis_summary(self.numbers, self.operations)
+                except Exception:
+                    summary = {}
+                summary["status"] = status
+                self.status = status
+                self.summary = summary
+                self.condition.notify_all()
+            print(f"Ejecución {self.id}: {len(self.operations)} operaciones, {status}")
+
+
+class LiveServer(ThreadingHTTPServer):
+    """Servidor del modo --serve: cada ejecución tiene su URL /run/<id>"""
+    daemon_threads = True
+
+    def __init__(self, address, render_mode=None, use_cache=True):
+        super().__init__(address, LiveHandler)
+        self.render_mode = render_mode
+        self.use_cache = use_cache
+        self.runs = {}
+        self.lock = threading.Lock()
+        # Va en el formulario del índice: otra página no lo conoce y no puede
+        # lanzar push_swap con un POST a localhost
+        self.token = secrets.token_urlsafe(16)
+
+    def start_run(self, numbers):
+        with self.lock:
+            run = LiveRun(len(self.runs) + 1, numbers, self.render_mode, self.use_cache)
+            self.runs[run.id] = run
+        return run
+
+
+class LiveHandler(BaseHTTPRequestHandler):
+    """/ lista las ejecuciones, POST /new lanza una, /run/<id> es su página y /run/<id>/events sus operaciones"""
+
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        params = urllib.parse.parse_qs(query)
+        parts = path.strip("/").split("/")
+        if path == "/":
+            self._send_html(self._index())
+        elif path == "/new":
+            # Lanza procesos: solo por POST con el token del formulario
+            self.send_response(405)
+            self.send_header("Allow", "POST")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif len(parts) in (2, 3) and parts[0] == "run" and parts[1].isdigit() and int(parts[1]) in self.server.runs:
+            run = self.server.runs[int(parts[1])]
+            if len(parts) == 2:
+                with run.condition:
+                    operations = list(run.operations)
+                stream_url = f"/run/{run.id}/events?from={len(operations)}"
+                self._send_html(render_html(run.numbers, operations, run.render_mode, stream_url))
+            elif parts[2] == "events":
+                try:
+                    sent = int(params.get("from", ["0"])[0])
+                    if sent < 0:
+                        raise ValueError(sent)
+                except ValueError:
+                    self.send_error(400, "from debe ser un entero no negativo")
+                    return
+                self._stream(run, sent)
+            else:
+                self.send_error(404)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if self.path != "/new":
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_FORM_BYTES:
+            self.send_error(400, "Formulario inválido")
+            return
+        params = urllib.parse.parse_qs(self.rfile.read(length).decode(errors="replace"))
+        if not hmac.compare_digest(params.get("token", [""])[0], self.server.token):
+            self.send_error(403, "Token inválido")
+            return
+        self._new_run(params)
+
+    def _new_run(self, params):
+        try:
+            if params.get("numbers", [""])[0].strip():
+                numbers = parse_numbers(params["numbers"][:1])
+            else:
+                size = int(params.get("size", ["100"])[0])
+                if not 1 <= size <= MAX_SERVE_SIZE:
+                    raise ValueError(f"el tamaño debe estar entre 1 y {MAX_SERVE_SIZE}")
+                limit = max(100, size * 5)
+                numbers = generate_random_numbers(size, -limit, limit)
+        except ValueError as e:
+            self.send_error(400, f"Entrada inválida: {e}")
+            return
+        run = self.server.start_run(numbers)
+        self.send_response(303)
+        self.send_header("Location", f"/run/{run.id}")
+        self.end_headers()
+
+    def _index(self):
+        rows = []
+        for run in self.server.runs.values():
+            with run.condition:
+                count = len(run.operations)
+                status = run.status or "en curso"
+            rows.append(f"<li><a href='/run/{run.id}'>Ejecución {run.id}</a>: "
+                        f"{len(run.numbers)} números, {count} operaciones, {status}</li>")
+        return ("<!DOCTYPE html><html lang='es'><head><meta charset='UTF-8'><title>Push Swap Visualizer</title></head>"
+                "<body style='font-family: Arial, sans-serif; background-color: #1e1e1e; color: #f0f0f0;'>"
+                "<h1>Push Swap Visualizer</h1>"
+                "<form action='/new' method='post'>"
+                f"<input type='hidden' name='token' value='{self.server.token}'>"
+                "Números: <input name='numbers' size='40'> o tamaño aleatorio: "
+                "<input name='size' type='number' min='1' value='100'> <button>Ejecutar</button></form>"
+                "<ul>" + "".join(reversed(rows)) + "</ul></body></html>")
+
+    def _send_html(self, html):
+        body = html.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, run, sent):
+        """Envía las operaciones desde la número sent en lotes y un evento done al terminar"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            while True:
+                with run.condition:
+                    while len(run.operations) <= sent and run.summary is None:
+                        run.condition.wait()
+                    batch = run.operations[sent:]
+                    summary = run.summary
+                if batch:
+                    data = base64.b64encode(encode_operations(batch)).decode("ascii")
+                    self.wfile.write(f"data: {json.dumps({'count': len(batch), 'ops': data})}\n\n".encode())
+                    sent += len(batch)
+                # summary solo existe cuando ya no llegan más operaciones
+                if summary is not None:
+                    self.wfile.write(f"event: done\ndata: {json.dumps(summary)}\n\n".encode())
+                    self.wfile.flush()
+                    return
+                self.wfile.flush()
+                time.sleep(STREAM_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        # Sin una línea por petición: la salida queda para el resumen de cada ejecución
+        pass
+
+
+def serve(numbers, render_mode=None, use_cache=True, port=SERVE_PORT):
+    """Modo --serve: lanza push_swap y abre su página, que se anima mientras llegan las operaciones"""
+    server = LiveServer(("127.0.0.1", port), render_mode, use_cache)
+    run = server.start_run(numbers)
+    url = f"http://127.0.0.1:{server.server_port}/run/{run.id}"
+    print(f"Servidor en http://127.0.0.1:{server.server_port}/ (Ctrl+C para salir)")
+    print(f"Abriendo URL: {url}")
+    webbrowser.open(url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor detenido")
+    finally:
+        server.server_close()
+
 def generate_random_numbers(count=10, min_val=-100, max_val=100):
     """Genera una lista de números aleatorios sin repetición"""
     numbers = random.sample(range(min_val, max_val + 1), min(count, max_val - min_val + 1))
@@ -609,31 +1570,59 @@ def main():
     try:
         numbers = []
         
+        # Separar las opciones (--canvas, --dom) de los números
+        render_mode = None
+        debug = False
+        use_cache = True
+        live = False
+        port = SERVE_PORT
+        args = []
+        for arg in sys.argv[1:]:
+            if arg in ("--canvas", "--dom"):
+                render_mode = arg[2:]
+            elif arg == "--serve":
+                live = True
+            elif arg.startswith("--port="):
+                try:
+                    port = int(arg[len("--port="):])
+                except ValueError:
+                    print(f"Error: Puerto inválido: {arg}")
+                    sys.exit(1)
+            elif arg == "--debug":
+                debug = True
+            elif arg == "--no-cache":
+                use_cache = False
+            elif arg.startswith("--"):
+                print(f"Error: Opción desconocida: {arg}")
+                sys.exit(1)
+            else:
+                args.append(arg)
+        
         # Comprobar si se proporcionaron argumentos
-        if len(sys.argv) > 1:
-            # Si hay argumentos, intentar convertirlos a enteros
+        if args:
+            # Si hay argumentos, validarlos como el checker: enteros de 32 bits
+            # sin duplicados (la página los empaqueta como int32)
             try:
-                numbers = [int(arg) for arg in sys.argv[1:]]
-            except ValueError:
-                print("Error: Todos los argumentos deben ser números enteros.")
+                numbers = parse_numbers(args)
+            except ValueError as e:
+                print(f"Error: Los argumentos deben ser enteros distintos dentro de int ({e}).")
                 sys.exit(1)
         else:
             # Si no hay argumentos, generar 10 números aleatorios
             numbers = generate_random_numbers(10)
         
-        # Verificar que no hay duplicados
-        if len(numbers) != len(set(numbers)):
-            print("Error: No se permiten números duplicados.")
-            sys.exit(1)
-        
         print(f"Números a ordenar: {numbers}")
         
+        if live:
+            serve(numbers, render_mode, use_cache, port)
+            return
+        
         # Ejecutar push_swap
-        operations = run_push_swap(numbers)
+        operations = run_push_swap(numbers, debug, use_cache)
         
         # Generar visualización incluso si no hay operaciones
         print(f"Generando visualización con {len(operations)} operaciones")
-        html_file = generate_html(numbers, operations)
+        html_file = generate_html(numbers, operations, render_mode, debug)
         
         # Abrir en navegador
         print(f"Abriendo visualización en el navegador...")